@@ -0,0 +1,116 @@
+"""
+Benchmark of the commands sent between the main process and the player processes
+Compare the previous path, VCommands pickled through a multiprocessing Queue, with the CommandsProtocol form
+sent through a pipe. Measure the size of each message, the messages encoded and decoded by second and the
+round trip latency to a process that answers each PLAY with a NOW_PLAYING
+
+Run from the root folder: python -m Benchmarks.CommandsProtocol
+"""
+import pickle
+from multiprocessing import Pipe, Process, Queue
+from statistics import median
+from time import perf_counter
+from typing import Callable, List
+from Music.Song import Song
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsProtocol import CommandsProtocol
+
+ENCODING_ROUNDS = 20000
+ROUND_TRIPS = 2000
+
+
+def createSong() -> Song:
+    song = Song('https://www.youtube.com/watch?v=00000000001', None, 'Requester')
+    song.finish_down({'url': 'https://rr1---sn-example.googlevideo.com/videoplayback?expire=1700000000&id=1&itag=251',
+                      'duration': 245, 'title': 'Song from the benchmark playlist',
+                      'webpage_url': 'https://www.youtube.com/watch?v=00000000001',
+                      'original_url': 'https://www.youtube.com/watch?v=00000000001',
+                      'channel': 'Channel', 'id': '00000000001', 'uploader': 'Uploader',
+                      'thumbnail': 'https://i.ytimg.com/vi/00000000001/hqdefault.jpg'})
+    return song
+
+
+def pickleEncode(command: VCommands) -> bytes:
+    return pickle.dumps(command)
+
+
+def measureEncoding(name: str, commands: List[VCommands], encode: Callable, decode: Callable) -> None:
+    sizes = ', '.join(f'{command.getType().name} {len(encode(command))} B' for command in commands)
+    start = perf_counter()
+    for _ in range(ENCODING_ROUNDS):
+        for command in commands:
+            decode(encode(command))
+    elapsed = perf_counter() - start
+    messagesPerSecond = ENCODING_ROUNDS * len(commands) / elapsed
+    print(f'{name:>8} -> {messagesPerSecond:,.0f} messages/s encoded and decoded | {sizes}')
+
+
+def pickledEcho(queueToReceive: Queue, queueToSend: Queue) -> None:
+    while True:
+        command: VCommands = queueToReceive.get()
+        if command.getType() == VCommandsType.TERMINATE:
+            return
+        queueToSend.put(VCommands(VCommandsType.NOW_PLAYING, command.getArgs()))
+
+
+def protocolEcho(connectionToReceive, connectionToSend) -> None:
+    while True:
+        command = CommandsProtocol.decode(connectionToReceive.recv_bytes())
+        if command.getType() == VCommandsType.TERMINATE:
+            return
+        connectionToSend.send_bytes(CommandsProtocol.encode(VCommands(VCommandsType.NOW_PLAYING, command.getArgs())))
+
+
+def measurePickledRoundTrip(song: Song) -> List[float]:
+    queueToEcho, queueToMain = Queue(), Queue()
+    process = Process(target=pickledEcho, args=(queueToEcho, queueToMain))
+    process.start()
+
+    latencies = []
+    for _ in range(ROUND_TRIPS):
+        start = perf_counter()
+        queueToEcho.put(VCommands(VCommandsType.PLAY, song))
+        queueToMain.get()
+        latencies.append(perf_counter() - start)
+    queueToEcho.put(VCommands(VCommandsType.TERMINATE))
+    process.join()
+    return latencies
+
+
+def measureProtocolRoundTrip(song: Song) -> List[float]:
+    echoReceive, mainSend = Pipe(duplex=False)
+    mainReceive, echoSend = Pipe(duplex=False)
+    process = Process(target=protocolEcho, args=(echoReceive, echoSend))
+    process.start()
+
+    latencies = []
+    for _ in range(ROUND_TRIPS):
+        start = perf_counter()
+        mainSend.send_bytes(CommandsProtocol.encode(VCommands(VCommandsType.PLAY, song)))
+        CommandsProtocol.decode(mainReceive.recv_bytes())
+        latencies.append(perf_counter() - start)
+    mainSend.send_bytes(CommandsProtocol.encode(VCommands(VCommandsType.TERMINATE)))
+    process.join()
+    return latencies
+
+
+def printLatencies(name: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f'{name:>8} -> Round trip median: {median(latencies) * 1e6:.0f} us | p99: {p99 * 1e6:.0f} us | '
+          f'{len(latencies) / sum(latencies):,.0f} round trips/s')
+
+
+if __name__ == '__main__':
+    song = createSong()
+    commands = [VCommands(VCommandsType.PLAY, song), VCommands(VCommandsType.NOW_PLAYING, song),
+                VCommands(VCommandsType.SKIP)]
+
+    print(f'Encoding of {len(commands)} commands, {ENCODING_ROUNDS} times')
+    measureEncoding('Pickle', commands, pickleEncode, pickle.loads)
+    # The events reference the song by the id, in the protocol NOW_PLAYING carries only the songID
+    measureEncoding('Protocol', commands, CommandsProtocol.encode, CommandsProtocol.decode)
+
+    print(f'{ROUND_TRIPS} round trips of PLAY -> NOW_PLAYING')
+    printLatencies('Pickle', measurePickledRoundTrip(song))
+    printLatencies('Protocol', measureProtocolRoundTrip(song))
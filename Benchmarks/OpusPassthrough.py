@@ -0,0 +1,84 @@
+"""
+Benchmark of the CPU used to play one song, the value that limits the songs played at the same time by a machine
+Compare the PCM path, where ffmpeg decodes the song and each 20ms frame is encoded to Opus like the voice client
+does, with the Opus passthrough, where ffmpeg copies the Opus stream and the frames are sent as they are
+Measure the frames by CPU second, counting the CPU of this process and of ffmpeg, and the songs that one CPU
+core could play at the same time. Requires ffmpeg with libopus and the opus library
+
+Run from the root folder: python -m Benchmarks.OpusPassthrough
+"""
+import os
+import subprocess
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Tuple
+from discord import AudioSource, FFmpegOpusAudio, FFmpegPCMAudio, PCMVolumeTransformer
+from discord.opus import Encoder
+
+SONG_SECONDS = 120
+FRAMES_BY_SECOND = 1000 // Encoder.FRAME_LENGTH
+
+
+def createOpusSong(folder: str) -> str:
+    """Create a song in webm with Opus, the format of most of the YouTube songs"""
+    path = os.path.join(folder, 'song.webm')
+    subprocess.run(['ffmpeg', '-loglevel', 'error', '-f', 'lavfi', '-i', f'sine=frequency=440:duration={SONG_SECONDS}',
+                    '-f', 'lavfi', '-i', f'anoisesrc=amplitude=0.1:duration={SONG_SECONDS}',
+                    '-filter_complex', 'amix=inputs=2', '-ac', '2', '-c:a', 'libopus', '-b:a', '128k', path],
+                   check=True)
+    return path
+
+
+def getCPUTimes() -> Tuple[float, float]:
+    """CPU seconds used by this process and by the finished child processes"""
+    times = os.times()
+    return times.user + times.system, times.children_user + times.children_system
+
+
+def playPCM(path: str) -> int:
+    source = PCMVolumeTransformer(FFmpegPCMAudio(path, options='-vn'), 1)
+    encoder = Encoder()
+    return readFrames(source, lambda frame: encoder.encode(frame, Encoder.SAMPLES_PER_FRAME))
+
+
+def playPassthrough(path: str) -> int:
+    # Only with the Opus codec the FFmpegOpusAudio copies the stream, with others it encodes again
+    source = FFmpegOpusAudio(path, codec='opus', options='-vn')
+    return readFrames(source, lambda frame: frame)
+
+
+def readFrames(source: AudioSource, prepareFrame: Callable[[bytes], bytes]) -> int:
+    """Read the song as fast as possible, doing with each frame what the voice client does before sending it"""
+    frames = 0
+    try:
+        while True:
+            frame = source.read()
+            if not frame:
+                return frames
+            prepareFrame(frame)
+            frames += 1
+    finally:
+        # The ffmpeg process is waited, so its CPU is counted in the children times
+        source.cleanup()
+
+
+def run(name: str, play: Callable[[str], int], path: str) -> None:
+    processBefore, childrenBefore = getCPUTimes()
+    start = perf_counter()
+    frames = play(path)
+    elapsed = perf_counter() - start
+    processAfter, childrenAfter = getCPUTimes()
+
+    processCPU = processAfter - processBefore
+    ffmpegCPU = childrenAfter - childrenBefore
+    framesByCPUSecond = frames / (processCPU + ffmpegCPU)
+    print(f'{name:>11} -> {frames} frames in {elapsed:.2f}s | CPU: {processCPU:.2f}s player, {ffmpegCPU:.2f}s ffmpeg | '
+          f'{framesByCPUSecond:,.0f} frames/CPU-second | {framesByCPUSecond / FRAMES_BY_SECOND:,.0f} songs by core')
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as folder:
+        path = createOpusSong(folder)
+        print(f'Song of {SONG_SECONDS}s in Opus, {SONG_SECONDS * FRAMES_BY_SECOND} frames of {Encoder.FRAME_LENGTH}ms')
+        run('PCM', playPCM, path)
+        run('Passthrough', playPassthrough, path)
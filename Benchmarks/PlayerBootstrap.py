@@ -0,0 +1,77 @@
+"""
+Startup benchmark of the bot instance created in each player process
+Compare the full initializer, that loads every cog, with the voice only initializer of the players
+Each variant runs in a new process, measuring the time to create the bot, the RSS of the process and the
+memory used to cache one guild with its members, as received in the GUILD_CREATE event
+
+Run from the root folder: python -m Benchmarks.PlayerBootstrap
+"""
+import tracemalloc
+from multiprocessing import Process, Queue
+from time import perf_counter
+from typing import Callable
+
+GUILD_MEMBERS_QUANT = 5000
+
+
+def getRSS() -> int:
+    """RSS of the current process in KiB, read from the proc file system"""
+    with open('/proc/self/status') as file:
+        for line in file:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def createGuildData(membersQuant: int) -> dict:
+    members = [{'user': {'id': str(10 ** 17 + index), 'username': f'User {index}', 'discriminator': '0001',
+                         'avatar': None},
+                'roles': [], 'joined_at': '2023-01-01T00:00:00+00:00', 'deaf': False, 'mute': False}
+               for index in range(membersQuant)]
+    return {'id': str(10 ** 16), 'name': 'Benchmark Guild', 'owner_id': members[0]['user']['id'], 'roles': [],
+            'emojis': [], 'stickers': [], 'features': [], 'channels': [], 'voice_states': [],
+            'members': members, 'member_count': membersQuant}
+
+
+def createFullBot():
+    from Music.VulkanInitializer import VulkanInitializer
+    return VulkanInitializer(willListen=False).getBot()
+
+
+def createPlayerBot():
+    from Music.VulkanPlayerInitializer import VulkanPlayerInitializer
+    return VulkanPlayerInitializer().getBot()
+
+
+def measure(createBot: Callable, results: Queue) -> None:
+    rssBefore = getRSS()
+    start = perf_counter()
+    bot = createBot()
+    startupTime = perf_counter() - start
+    rssAfter = getRSS()
+
+    from discord import Guild
+    guildData = createGuildData(GUILD_MEMBERS_QUANT)
+    tracemalloc.start()
+    guild = Guild(data=guildData, state=bot._connection)
+    guildMemory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results.put((startupTime, rssAfter, rssAfter - rssBefore, guildMemory, len(guild.members), len(bot.cogs)))
+
+
+def run(name: str, createBot: Callable) -> None:
+    results = Queue()
+    process = Process(target=measure, args=(createBot, results))
+    process.start()
+    startupTime, rss, rssIncrease, guildMemory, cachedMembers, cogsQuant = results.get()
+    process.join()
+    print(f'{name:>8} -> Startup: {startupTime * 1000:.0f} ms | RSS: {rss / 1024:.1f} MiB '
+          f'(+{rssIncrease / 1024:.1f} MiB creating the bot) | Cogs: {cogsQuant} | '
+          f'Guild cache: {guildMemory / 1024:.0f} KiB, {cachedMembers} members')
+
+
+if __name__ == '__main__':
+    print(f'Bot instance of a player process, guild with {GUILD_MEMBERS_QUANT} members')
+    run('Full', createFullBot)
+    run('Player', createPlayerBot)
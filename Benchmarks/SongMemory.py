@@ -0,0 +1,81 @@
+"""
+Memory benchmark of a queue with 10k downloaded songs
+Compare the slotted Song with the previous layout, where each Song stored a dict with all the information
+
+Run from the root folder: python -m Benchmarks.SongMemory
+"""
+import pickle
+import tracemalloc
+from time import time
+from typing import Callable, List
+from Music.Playlist import Playlist
+from Music.Song import Song
+
+SONGS_QUANT = 10000
+
+
+class DictSong:
+    """Reproduction of the previous Song layout, used only as reference"""
+
+    def __init__(self, identifier: str, playlist, requester: str) -> None:
+        self.__identifier = identifier
+        self.__info = {'requester': requester}
+        self.__problematic = False
+        self.__playlist = playlist
+        self.__downloadTime: int = time()
+
+    def finish_down(self, info: dict) -> None:
+        self.__downloadTime = time()
+        self.__useful_keys = ['duration',
+                              'title', 'webpage_url',
+                              'channel', 'id', 'uploader',
+                              'thumbnail', 'original_url']
+        self.__required_keys = ['url']
+
+        for key in self.__required_keys:
+            self.__info[key] = info[key]
+        for key in self.__useful_keys:
+            if key in info.keys():
+                self.__info[key] = info[key]
+
+
+def createInfo(index: int) -> dict:
+    videoID = f'{index:011d}'
+    return {'url': f'https://rr1---sn-example.googlevideo.com/videoplayback?expire=1700000000&id={videoID}&itag=251',
+            'duration': 200 + index % 300,
+            'title': f'Song number {index} from the benchmark playlist',
+            'webpage_url': f'https://www.youtube.com/watch?v={videoID}',
+            'original_url': f'https://www.youtube.com/watch?v={videoID}',
+            'channel': f'Channel {index % 50}',
+            'id': videoID,
+            'uploader': f'Uploader {index % 50}',
+            'thumbnail': f'https://i.ytimg.com/vi/{videoID}/hqdefault.jpg'}
+
+
+def createSongs(songClass: Callable, infos: List[dict]) -> List:
+    playlist = Playlist()
+    songs = []
+    for index, info in enumerate(infos):
+        song = songClass(f'https://www.youtube.com/watch?v={index:011d}', playlist, 'Requester')
+        song.finish_down(info)
+        songs.append(song)
+    return songs
+
+
+def measure(songClass: Callable, infos: List[dict]) -> None:
+    tracemalloc.start()
+    songs = createSongs(songClass, infos)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pickledSize = len(pickle.dumps(songs[0]))
+    print(f'{songClass.__name__:>10} -> Memory: {memory / 1024:.0f} KiB | '
+          f'{memory / len(songs):.0f} bytes by song | Pickled song: {pickledSize} bytes')
+
+
+if __name__ == '__main__':
+    # The information dicts are created before to measure only the memory kept by the songs
+    infos = [createInfo(index) for index in range(SONGS_QUANT)]
+    print(f'Memory used by {SONGS_QUANT} queued songs')
+    measure(DictSong, infos)
+    measure(Song, infos)
@@ -18,6 +18,56 @@ class VConfigs(Singleton):
             # This feature is for now in testing period, for a more stable version, keep this boolean = Trued
             self.SONG_PLAYBACK_IN_SEPARATE_PROCESS = os.getenv('SONG_PLAYBACK_IN_SEPARATE_PROCESS', 'True') == 'True'
 
+            # Quant of processes that will play the songs of all servers, each server is always played by the same process
+            # If 0, each server playing songs has its own process. Only used with the playback in separate process
+            # The workers don't have the supervision, resume and drain of the players, and can't be used with the
+            # player nodes or the sharding
+            self.PLAYER_WORKERS_QUANT = int(os.getenv('PLAYER_WORKERS_QUANT', 0))
+            # Quant of player processes started and logged in before being needed, used by the next servers to play
+            # songs, avoiding the delay to start a new process. Only used with one process for each server
+            self.PLAYER_STANDBY_PROCESSES = int(os.getenv('PLAYER_STANDBY_PROCESSES', 0))
+            # If True the Bot connects with the quant of gateway shards recommended by Discord, required above 2500 servers
+            self.AUTO_SHARDING = os.getenv('AUTO_SHARDING', 'False') == 'True'
+            # Total quant of gateway shards of the Bot, if greater than 0 it's used instead of the AUTO_SHARDING
+            self.SHARD_COUNT = int(os.getenv('SHARD_COUNT', 0))
+            # Shards connected by this process, like '0-3' or '0,2,4'. To split the servers between processes run
+            # one Bot for each range, with the same SHARD_COUNT. If not set, this process connects all the shards
+            self.SHARD_IDS = self.__parseShardIDs(os.getenv('SHARD_IDS'))
+            # If True the player processes run in the player nodes, started with 'python -m Parallelism.PlayerNode'
+            # in other machines, instead of in this machine. Only used with the playback in separate process
+            self.PLAYBACK_IN_PLAYER_NODES = os.getenv('PLAYBACK_IN_PLAYER_NODES', 'False') == 'True'
+            # Addresses of the player nodes, like 'host:port' or 'unix:/path', separated by comma. If empty, one
+            # player node is started in this machine with the PLAYER_NODE_ADDRESS
+            self.PLAYER_NODES = [address.strip() for address in os.getenv('PLAYER_NODES', '').split(',') if address.strip() != '']
+            # Address where a player node listens, the commands are not encrypted, so keep it in a private network
+            self.PLAYER_NODE_ADDRESS = os.getenv('PLAYER_NODE_ADDRESS', 'localhost:7380')
+            # Secret shared by the bots and the player nodes, a node only accepts the bots that prove to know it
+            # If empty, the nodes only start in unix addresses, and the local node receives a random secret of the bot
+            self.PLAYER_NODE_SECRET = os.getenv('PLAYER_NODE_SECRET', '')
+            # Maximum of players that each bot connection can have in a player node
+            self.PLAYER_NODE_MAX_PLAYERS = int(os.getenv('PLAYER_NODE_MAX_PLAYERS', 1000))
+            # Seconds a player node stopped by SIGTERM waits its players be handed off to other nodes before exiting,
+            # the players are moved between songs when possible, the others continue the song in the new node
+            self.PLAYER_DRAIN_TIMEOUT = int(os.getenv('PLAYER_DRAIN_TIMEOUT', 300))
+            # Interval in seconds between the heartbeats sent by each player process to the main process
+            self.PLAYER_HEARTBEAT_INTERVAL = int(os.getenv('PLAYER_HEARTBEAT_INTERVAL', 5))
+            # Seconds without heartbeats after which a player process is restarted, keeping the playlist
+            self.PLAYER_HEARTBEAT_TIMEOUT = int(os.getenv('PLAYER_HEARTBEAT_TIMEOUT', 30))
+            # Delay in seconds of the player process loop that is considered unhealthy
+            self.PLAYER_MAX_LOOP_LAG = float(os.getenv('PLAYER_MAX_LOOP_LAG', 2))
+            # Seconds a player has to start playing the song it received, while it logs in, connects to the voice
+            # channel and resolves the song, before the song not playing is counted as unhealthy
+            self.PLAYER_START_GRACE = float(os.getenv('PLAYER_START_GRACE', 45))
+            # Seconds waited before restarting again the player of a server restarted recently, doubled by each
+            # restart of the server until it plays a song, up to the PLAYER_RESTART_MAX_BACKOFF
+            self.PLAYER_RESTART_BACKOFF = float(os.getenv('PLAYER_RESTART_BACKOFF', 5))
+            self.PLAYER_RESTART_MAX_BACKOFF = float(os.getenv('PLAYER_RESTART_MAX_BACKOFF', 300))
+
+            # If True the songs already in Opus, like most of the YouTube songs, are sent to Discord as they are, without
+            # decoding and encoding again each frame. The volume of these songs is only applied by decoding them again
+            self.OPUS_PASSTHROUGH = os.getenv('OPUS_PASSTHROUGH', 'True') == 'True'
+            self.__validatePlayback()
+
             # Maximum of songs that will be downloaded at once, the higher this number is, the faster the songs will be all available
             # but the slower will be the others commands of the Bot during the downloading time, for example, the playback quality
             self.MAX_DOWNLOAD_SONGS_AT_A_TIME = int(os.getenv('MAX_DOWNLOAD_SONGS_AT_A_TIME', 5))
@@ -60,6 +110,20 @@ class VConfigs(Singleton):
             self.MAX_SONGS_IN_PAGE = int(os.getenv('MAX_SONGS_IN_PAGE', 10))
             self.MAX_PRELOAD_SONGS = int(os.getenv('MAX_PRELOAD_SONGS', 15))
             self.MAX_SONGS_HISTORY = int(os.getenv('MAX_SONGS_HISTORY', 15))
+            # Quant of resolved titles kept in memory to give suggestions in the /play command
+            self.MAX_AUTOCOMPLETE_TITLES = int(os.getenv('MAX_AUTOCOMPLETE_TITLES', 5000))
+
+            # Database where the queues are saved to be restored after the Bot restarts, the folder is created if missing
+            self.PLAYLISTS_DATABASE_PATH = os.getenv('PLAYLISTS_DATABASE_PATH', os.path.join(f'{Folder().rootFolder}Data', 'playlists.db'))
+            # Interval in seconds between the snapshots of the queues that changed
+            self.PLAYLISTS_SNAPSHOT_INTERVAL = int(os.getenv('PLAYLISTS_SNAPSHOT_INTERVAL', 30))
+            # Quant of changes stored after the snapshot of a queue before they are compacted in a new snapshot
+            self.PLAYLISTS_CHANGES_TO_COMPACT = int(os.getenv('PLAYLISTS_CHANGES_TO_COMPACT', 20))
+            # Quant of songs of each queue kept in memory, the others are stored in a file until needed
+            self.MAX_SONGS_IN_MEMORY = int(os.getenv('MAX_SONGS_IN_MEMORY', 200))
+            # Folder of the files storing the queues songs, by default the temporary folder of the system
+            self.PLAYLISTS_SPILL_FOLDER = os.getenv('PLAYLISTS_SPILL_FOLDER')
+            self.MAX_PLAYLIST_NAME_LENGTH = int(os.getenv('MAX_PLAYLIST_NAME_LENGTH', 50))
 
             self.INVITE_MESSAGE = os.getenv('INVITE_MESSAGE', """To invite Vulkan to your own server, click [here]({}). 
             Or use this direct URL: {}""")
@@ -72,3 +136,29 @@ class VConfigs(Singleton):
 
     def setPlayersManager(self, newManager):
         self.__manager = newManager
+
+    def isSharded(self) -> bool:
+        return self.AUTO_SHARDING or self.SHARD_COUNT > 0
+
+    def __validatePlayback(self) -> None:
+        """Reject at the start the playback options that can't work together"""
+        if not self.SONG_PLAYBACK_IN_SEPARATE_PROCESS or self.PLAYER_WORKERS_QUANT <= 0:
+            return
+        if self.PLAYBACK_IN_PLAYER_NODES:
+            raise ValueError('PLAYER_WORKERS_QUANT can not be used with PLAYBACK_IN_PLAYER_NODES')
+        if self.isSharded():
+            raise ValueError('PLAYER_WORKERS_QUANT can not be used with AUTO_SHARDING or SHARD_COUNT')
+
+    def __parseShardIDs(self, value: str):
+        """Return the list of shards ids of a value like '0-3,6', None if the value is empty"""
+        if value is None or value.strip() == '':
+            return None
+
+        shardIDs = []
+        for part in value.split(','):
+            if '-' in part:
+                start, end = part.split('-')
+                shardIDs.extend(range(int(start), int(end) + 1))
+            else:
+                shardIDs.append(int(part))
+        return shardIDs
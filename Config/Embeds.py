@@ -89,6 +89,38 @@ class VEmbeds:
             colour=self.__colors.BLUE)
         return embed
 
+    def PLAYLIST_SAVED(self, name: str, quant: int) -> Embed:
+        embed = Embed(
+            title=self.__messages.SONG_PLAYER,
+            description=self.__messages.PLAYLIST_SAVED.format(name, quant),
+            colour=self.__colors.BLUE)
+        return embed
+
+    def PLAYLIST_LOADED(self, name: str, quant: int) -> Embed:
+        embed = Embed(
+            title=self.__messages.SONG_PLAYER,
+            description=self.__messages.PLAYLIST_LOADED.format(name, quant),
+            colour=self.__colors.BLUE)
+        return embed
+
+    def PLAYLIST_NOT_FOUND(self, name: str, savedNames: list) -> Embed:
+        description = self.__messages.PLAYLIST_NOT_FOUND.format(name)
+        if len(savedNames) > 0:
+            names = ', '.join(f'`{savedName}`' for savedName in savedNames)
+            description += '\n' + self.__messages.SAVED_PLAYLISTS.format(names)
+        embed = Embed(
+            title=self.__messages.ERROR_TITLE,
+            description=description,
+            colour=self.__colors.BLACK)
+        return embed
+
+    def INVALID_PLAYLIST_NAME(self) -> Embed:
+        embed = Embed(
+            title=self.__messages.ERROR_TITLE,
+            description=self.__messages.INVALID_PLAYLIST_NAME,
+            colour=self.__colors.BLACK)
+        return embed
+
     def SONG_INFO(self, info: dict, title: str, position='Playing Now') -> Embed:
         embedvc = Embed(
             title=title,
@@ -33,6 +33,10 @@ class Helper(Singleton):
             self.CHANGE_VOLUME = 'Set the volume of the song.'
             self.CHANGE_VOLUME_LONG = 'Change the volume of the song, expect a number from 0 to 100.'
             self.HELP_PLAY_LONG = 'Play a song in discord. \n\nRequire: You to be connected to a voice channel.\nArguments: Youtube, Spotify or Deezer song/playlist link or the title of the song to be searched in Youtube.'
+            self.HELP_SAVE = 'Save the queue as a playlist of the server.'
+            self.HELP_SAVE_LONG = 'Save the current song and the songs in the queue with a name, to be loaded again later with the load command.\n\nArguments: Name of the playlist, replacing any playlist with the same name.'
+            self.HELP_LOAD = 'Add a saved playlist to the queue.'
+            self.HELP_LOAD_LONG = 'Add all the songs of a playlist saved in this server to the queue, without searching the songs again.\n\nRequire: You to be connected to a voice channel.\nArguments: Name of the saved playlist.'
             self.HELP_HISTORY = f'Show the history of played songs.'
             self.HELP_HISTORY_LONG = f'Show the last {config.MAX_SONGS_HISTORY} played songs'
             self.HELP_MOVE = 'Moves a song from position pos1 to pos2 in queue.'
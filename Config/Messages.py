@@ -37,6 +37,12 @@ class Messages(Singleton):
             self.HISTORY_TITLE = f'{self.__emojis.MUSIC} Played Songs'
             self.HISTORY_EMPTY = f'{self.__emojis.QUEUE} There is no musics in history'
 
+            self.PLAYLIST_SAVED = f'{self.__emojis.MUSIC} Playlist `{{}}` saved with `{{}}` songs'
+            self.PLAYLIST_LOADED = f'{self.__emojis.MUSIC} Playlist `{{}}` loaded, `{{}}` songs added to the queue'
+            self.PLAYLIST_NOT_FOUND = f'{self.__emojis.ERROR} There is no saved playlist called `{{}}` in this server'
+            self.SAVED_PLAYLISTS = 'Saved playlists: {}'
+            self.INVALID_PLAYLIST_NAME = f'{self.__emojis.ERROR} The playlist name must have between 1 and {configs.MAX_PLAYLIST_NAME_LENGTH} characters'
+
             self.SONG_MOVED_SUCCESSFULLY = 'Song `{}` in position `{}` moved to the position `{}` successfully'
             self.SONG_REMOVED_SUCCESSFULLY = 'Song `{}` removed successfully'
 
@@ -21,7 +21,8 @@ class ControlCog(Cog):
             'MUSIC': ['resume', 'pause', 'loop', 'stop',
                       'skip', 'play', 'queue', 'clear',
                       'np', 'shuffle', 'move', 'remove',
-                      'reset', 'prev', 'history', 'volume'],
+                      'reset', 'prev', 'history', 'volume',
+                      'save', 'load'],
             'RANDOM': ['choose', 'cara', 'random']
 
         }
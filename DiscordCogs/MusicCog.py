@@ -18,6 +18,8 @@ from Handlers.HistoryHandler import HistoryHandler
 from Handlers.QueueHandler import QueueHandler
 from Handlers.LoopHandler import LoopHandler
 from Handlers.VolumeHandler import VolumeHandler
+from Handlers.SavePlaylistHandler import SavePlaylistHandler
+from Handlers.LoadPlaylistHandler import LoadPlaylistHandler
 from Messages.MessagesCategory import MessagesCategory
 from Messages.Responses.EmoteCogResponse import EmoteCommandResponse
 from Messages.Responses.EmbedCogResponse import EmbedCommandResponse
@@ -26,6 +28,8 @@ from Config.Configs import VConfigs
 from Config.Embeds import VEmbeds
 from Parallelism.ProcessPlayerManager import ProcessPlayerManager
 from Parallelism.ThreadPlayerManager import ThreadPlayerManager
+from Parallelism.PlayerWorkersManager import PlayerWorkersManager
+from Parallelism.RemotePlayersManager import RemotePlayersManager
 
 helper = Helper()
 
@@ -41,7 +45,11 @@ class MusicCog(Cog):
         self.__bot: VulkanBot = bot
         self.__embeds = VEmbeds()
         configs = VConfigs()
-        if configs.SONG_PLAYBACK_IN_SEPARATE_PROCESS:
+        if configs.SONG_PLAYBACK_IN_SEPARATE_PROCESS and configs.PLAYER_WORKERS_QUANT > 0:
+            configs.setPlayersManager(PlayerWorkersManager(bot))
+        elif configs.SONG_PLAYBACK_IN_SEPARATE_PROCESS and configs.PLAYBACK_IN_PLAYER_NODES:
+            configs.setPlayersManager(RemotePlayersManager(bot))
+        elif configs.SONG_PLAYBACK_IN_SEPARATE_PROCESS:
             configs.setPlayersManager(ProcessPlayerManager(bot))
         else:
             configs.setPlayersManager(ThreadPlayerManager(bot))
@@ -281,6 +289,32 @@ class MusicCog(Cog):
         except Exception as e:
             print(f'[ERROR IN COG] -> {e}')
 
+    @command(name='save', help=helper.HELP_SAVE, description=helper.HELP_SAVE_LONG, aliases=['salvar'])
+    async def save(self, ctx: Context, *args) -> None:
+        try:
+            controller = SavePlaylistHandler(ctx, self.__bot)
+
+            response = await controller.run(" ".join(args))
+            cogResponser1 = EmbedCommandResponse(response, MessagesCategory.MANAGING_QUEUE)
+            cogResponser2 = EmoteCommandResponse(response, MessagesCategory.MANAGING_QUEUE)
+            await cogResponser1.run()
+            await cogResponser2.run()
+        except Exception as e:
+            print(f'[ERROR IN COG] -> {e}')
+
+    @command(name='load', help=helper.HELP_LOAD, description=helper.HELP_LOAD_LONG, aliases=['carregar'])
+    async def load(self, ctx: Context, *args) -> None:
+        try:
+            controller = LoadPlaylistHandler(ctx, self.__bot)
+
+            response = await controller.run(" ".join(args))
+            cogResponser1 = EmbedCommandResponse(response, MessagesCategory.PLAYER)
+            cogResponser2 = EmoteCommandResponse(response, MessagesCategory.PLAYER)
+            await cogResponser1.run()
+            await cogResponser2.run()
+        except Exception as e:
+            print(f'[ERROR IN COG] -> {e}')
+
 
 def setup(bot):
     bot.add_cog(MusicCog(bot))
@@ -1,5 +1,5 @@
 from discord.ext.commands import slash_command, Cog
-from discord import Option, ApplicationContext, OptionChoice
+from discord import Option, ApplicationContext, OptionChoice, AutocompleteContext
 from Handlers.ClearHandler import ClearHandler
 from Handlers.MoveHandler import MoveHandler
 from Handlers.NowPlayingHandler import NowPlayingHandler
@@ -16,16 +16,26 @@ from Handlers.HistoryHandler import HistoryHandler
 from Handlers.QueueHandler import QueueHandler
 from Handlers.LoopHandler import LoopHandler
 from Handlers.VolumeHandler import VolumeHandler
+from Handlers.SavePlaylistHandler import SavePlaylistHandler
+from Handlers.LoadPlaylistHandler import LoadPlaylistHandler
 from Messages.MessagesCategory import MessagesCategory
 from Messages.Responses.SlashEmbedResponse import SlashEmbedResponse
 from Music.VulkanBot import VulkanBot
+from Music.TitlesIndex import TitlesIndex
 from Config.Embeds import VEmbeds
 from Config.Helper import Helper
+from typing import List
 import traceback
 
 helper = Helper()
 
 
+async def playAutocomplete(ctx: AutocompleteContext) -> List[OptionChoice]:
+    """Suggest the titles already resolved by the Bot, the value is the song URL so no search is needed"""
+    suggestions = TitlesIndex().getSuggestions(ctx.value, ctx.interaction.guild_id)
+    return [OptionChoice(name=suggestion.title[:100], value=suggestion.url) for suggestion in suggestions]
+
+
 class SlashCommands(Cog):
     """
     Class to listen to Music commands
@@ -39,7 +49,7 @@ class SlashCommands(Cog):
 
     @slash_command(name="play", description=helper.HELP_PLAY)
     async def play(self, ctx: ApplicationContext,
-                   music: Option(str, "The music name or URL", required=True)) -> None:
+                   music: Option(str, "The music name or URL", required=True, autocomplete=playAutocomplete)) -> None:
         # Due to the utilization of multiprocessing module in this Project, we have multiple instances of the Bot, and by using this flag
         # we can control witch bot instance will listen to the commands that Discord send to our application
         if not self.__bot.listingSlash:
@@ -269,6 +279,36 @@ class SlashCommands(Cog):
         except Exception:
             print(f'[ERROR IN SLASH COMMAND] -> {traceback.format_exc()}')
 
+    @slash_command(name='save_playlist', description=helper.HELP_SAVE)
+    async def save_playlist(self, ctx: ApplicationContext,
+                            name: Option(str, "Name of the playlist")) -> None:
+        if not self.__bot.listingSlash:
+            return
+        try:
+            await ctx.defer()
+            controller = SavePlaylistHandler(ctx, self.__bot)
+
+            response = await controller.run(name)
+            cogResponser = SlashEmbedResponse(response, ctx, MessagesCategory.MANAGING_QUEUE)
+            await cogResponser.run()
+        except Exception:
+            print(f'[ERROR IN SLASH COMMAND] -> {traceback.format_exc()}')
+
+    @slash_command(name='load_playlist', description=helper.HELP_LOAD)
+    async def load_playlist(self, ctx: ApplicationContext,
+                            name: Option(str, "Name of the saved playlist")) -> None:
+        if not self.__bot.listingSlash:
+            return
+        try:
+            await ctx.defer()
+            controller = LoadPlaylistHandler(ctx, self.__bot)
+
+            response = await controller.run(name)
+            cogResponser = SlashEmbedResponse(response, ctx, MessagesCategory.PLAYER)
+            await cogResponser.run()
+        except Exception:
+            print(f'[ERROR IN SLASH COMMAND] -> {traceback.format_exc()}')
+
     @slash_command(name='reset', description=helper.HELP_RESET)
     async def reset(self, ctx: ApplicationContext) -> None:
         if not self.__bot.listingSlash:
@@ -18,7 +18,7 @@ class ClearHandler(AbstractHandler):
             # Clear the playlist
             playlist = playersManager.getPlayerPlaylist(self.guild)
             playerLock = playersManager.getPlayerLock(self.guild)
-            acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+            acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
             if acquired:
                 playlist.clear()
                 playerLock.release()
@@ -17,7 +17,7 @@ class HistoryHandler(AbstractHandler):
         playersManager: AbstractPlayersManager = self.config.getPlayersManager()
         if playersManager.verifyIfPlayerExists(self.guild):
             playerLock = playersManager.getPlayerLock(self.guild)
-            acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+            acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
             if acquired:
                 history = playersManager.getPlayerPlaylist(self.guild).getSongsHistory()
                 playerLock.release()
@@ -24,7 +24,7 @@ class JumpMusicHandler(AbstractHandler):
             return HandlerResponse(self.ctx, embed, error)
 
         playerLock = playersManager.getPlayerLock(self.guild)
-        acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
         if acquired:
             # Try to convert input to int
             error = self.__validateInput(musicPos)
@@ -73,6 +73,6 @@ class JumpMusicHandler(AbstractHandler):
         position = int(position)
 
         if position == -1:
-            position = len(playlist.getSongs())
+            position = playlist.getQueueLength()
 
         return position
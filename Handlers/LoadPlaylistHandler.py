@@ -0,0 +1,57 @@
+from typing import List, Union
+from discord.ext.commands import Context
+from discord import Interaction
+from Config.Exceptions import ImpossibleMove, InvalidInput
+from Handlers.AbstractHandler import AbstractHandler
+from Handlers.HandlerResponse import HandlerResponse
+from Music.PlaylistStore import PlaylistStore
+from Music.Song import Song
+from Music.VulkanBot import VulkanBot
+from Parallelism.AbstractProcessManager import AbstractPlayersManager
+from Parallelism.Commands import VCommands, VCommandsType
+
+
+class LoadPlaylistHandler(AbstractHandler):
+    def __init__(self, ctx: Union[Context, Interaction], bot: VulkanBot) -> None:
+        super().__init__(ctx, bot)
+        self.__store = PlaylistStore()
+
+    async def run(self, name: str) -> HandlerResponse:
+        if not self.ctx.author.voice:
+            error = ImpossibleMove()
+            embed = self.embeds.NO_CHANNEL()
+            return HandlerResponse(self.ctx, embed, error)
+
+        name = name.strip().lower()
+        records = self.__store.loadPlaylist(self.guild.id, name)
+        if records is None:
+            embed = self.embeds.PLAYLIST_NOT_FOUND(name, self.__store.getPlaylistsNames(self.guild.id))
+            error = InvalidInput()
+            return HandlerResponse(self.ctx, embed, error)
+
+        playersManager: AbstractPlayersManager = self.config.getPlayersManager()
+        if not playersManager.verifyIfPlayerExists(self.guild):
+            playersManager.createPlayerForGuild(self.guild, self.ctx)
+
+        # The songs are created only with the stored metadata, the player resolves each one when playing it
+        playlist = playersManager.getPlayerPlaylist(self.guild)
+        requester = self.ctx.author.name
+        songs: List[Song] = []
+        for record in records:
+            record['requester'] = requester
+            songs.append(Song.fromRecord(record, playlist))
+
+        playerLock = playersManager.getPlayerLock(self.guild)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        if acquired:
+            playlist.add_songs(songs)
+            playerLock.release()
+            playCommand = VCommands(VCommandsType.PLAY, None)
+            await playersManager.sendCommandToPlayer(playCommand, self.guild, self.ctx)
+        else:
+            playersManager.resetPlayer(self.guild, self.ctx)
+            embed = self.embeds.PLAYER_RESTARTED()
+            return HandlerResponse(self.ctx, embed)
+
+        embed = self.embeds.PLAYLIST_LOADED(name, len(songs))
+        return HandlerResponse(self.ctx, embed)
@@ -21,7 +21,7 @@ class LoopHandler(AbstractHandler):
 
         playlist = playersManager.getPlayerPlaylist(self.guild)
         playerLock = playersManager.getPlayerLock(self.guild)
-        acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
         if acquired:
             if args == '' or args is None:
                 playlist.loop_all()
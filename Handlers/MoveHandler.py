@@ -22,7 +22,7 @@ class MoveHandler(AbstractHandler):
             return HandlerResponse(self.ctx, embed, error)
 
         playerLock = playersManager.getPlayerLock(self.guild)
-        acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
         if acquired:
             error = self.__validateInput(pos1, pos2)
             if error:
@@ -68,8 +68,8 @@ class MoveHandler(AbstractHandler):
         pos2 = int(pos2)
 
         if pos1 == -1:
-            pos1 = len(playlist.getSongs())
+            pos1 = playlist.getQueueLength()
         if pos2 == -1:
-            pos2 = len(playlist.getSongs())
+            pos2 = playlist.getQueueLength()
 
         return pos1, pos2
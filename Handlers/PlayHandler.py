@@ -8,7 +8,9 @@ from Config.Exceptions import ImpossibleMove, UnknownError
 from Handlers.HandlerResponse import HandlerResponse
 from Music.Downloader import Downloader
 from Music.Searcher import Searcher
+from Music.Playlist import Playlist
 from Music.Song import Song
+from Music.TitlesIndex import TitlesIndex
 from Parallelism.AbstractProcessManager import AbstractPlayersManager
 from Parallelism.Commands import VCommands, VCommandsType
 from Music.VulkanBot import VulkanBot
@@ -20,6 +22,7 @@ class PlayHandler(AbstractHandler):
         super().__init__(ctx, bot)
         self.__searcher = Searcher()
         self.__down = Downloader()
+        self.__titlesIndex = TitlesIndex()
 
     async def run(self, track: str) -> HandlerResponse:
         requester = self.ctx.author.name
@@ -29,8 +32,12 @@ class PlayHandler(AbstractHandler):
             embed = self.embeds.NO_CHANNEL()
             return HandlerResponse(self.ctx, embed, error)
         try:
-            # Search for musics and get the name of each song
-            musicsInfo = await self.__searcher.search(track)
+            # Songs selected from the autocomplete suggestions are already resolved
+            if self.__titlesIndex.isResolvedURL(track):
+                musicsInfo = [track]
+            else:
+                # Search for musics and get the name of each song
+                musicsInfo = await self.__searcher.search(track)
             if musicsInfo is None or len(musicsInfo) == 0:
                 raise InvalidInput(self.messages.INVALID_INPUT, self.messages.ERROR_TITLE)
 
@@ -48,7 +55,7 @@ class PlayHandler(AbstractHandler):
 
             if len(songs) == 1:
                 # If only one music, download it directly
-                song = self.__down.finish_one_song(songs[0])
+                song = await self.__down.finish_one_song_async(songs[0])
                 if song.problematic:  # If error in download song return
                     embed = self.embeds.SONG_PROBLEMATIC()
                     error = DownloadingError()
@@ -59,17 +66,18 @@ class PlayHandler(AbstractHandler):
                     embed = self.embeds.SONG_ADDED(song.title)
                     response = HandlerResponse(self.ctx, embed)
                 else:  # If already playing
-                    pos = len(playlist.getSongs())
+                    pos = playlist.getQueueLength()
                     embed = self.embeds.SONG_ADDED_TWO(song.info, pos)
                     response = HandlerResponse(self.ctx, embed)
 
                 # Add the unique song to the playlist and send a command to player
                 playerLock = playersManager.getPlayerLock(self.guild)
-                acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+                acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
                 if acquired:
                     playlist.add_song(song)
                     # Release the acquired Lock
                     playerLock.release()
+                    self.__titlesIndex.addResolvedSong(song, self.guild.id)
                     playCommand = VCommands(VCommandsType.PLAY, None)
                     await playersManager.sendCommandToPlayer(playCommand, self.guild, self.ctx)
                 else:
@@ -116,22 +124,37 @@ class PlayHandler(AbstractHandler):
 
             # Create task to download the songs in the lot
             tasks: List[asyncio.Task] = []
-            for index, song in enumerate(songsInLot):
+            for song in songsInLot:
                 task = asyncio.create_task(self.__down.download_song(song))
                 tasks.append(task)
 
-            for index, task, in enumerate(tasks):
-                await task
-                song = songsInLot[index]
-                if not song.problematic:  # If downloaded add to the playlist and send play command
-                    playerLock = playersManager.getPlayerLock(self.guild)
-                    acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
-                    if acquired:
-                        playlist.add_song(song)
-                        await playersManager.sendCommandToPlayer(playCommand, self.guild, self.ctx)
-                        playerLock.release()
-                    else:
-                        playersManager.resetPlayer(self.guild, self.ctx)
+            # Add the songs as they are downloaded, keeping the order, so the first ones don't wait the whole lot
+            addedQuant = 0
+            for finishedTask in asyncio.as_completed(tasks):
+                await finishedTask
+                readyQuant = addedQuant
+                while readyQuant < len(tasks) and tasks[readyQuant].done():
+                    readyQuant += 1
+                if readyQuant == addedQuant:
+                    continue
+
+                # All the songs ready are added at once, to use only one lock acquire and one call to the playlist
+                readySongs = [song for song in songsInLot[addedQuant:readyQuant] if not song.problematic]
+                addedQuant = readyQuant
+                if len(readySongs) > 0:
+                    await self.__addDownloadedSongs(readySongs, playlist, playersManager, playCommand)
+
+    async def __addDownloadedSongs(self, songs: List[Song], playlist: Playlist, playersManager: AbstractPlayersManager, playCommand: VCommands) -> None:
+        playerLock = playersManager.getPlayerLock(self.guild)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        if acquired:
+            playlist.add_songs(songs)
+            await playersManager.sendCommandToPlayer(playCommand, self.guild, self.ctx)
+            playerLock.release()
+            for song in songs:
+                self.__titlesIndex.addResolvedSong(song, self.guild.id)
+        else:
+            playersManager.resetPlayer(self.guild, self.ctx)
 
     def __isUserConnected(self) -> bool:
         if self.ctx.author.voice:
@@ -8,7 +8,7 @@ from Parallelism.AbstractProcessManager import AbstractPlayersManager
 from UI.Views.BasicView import BasicView
 from Utils.Utils import Utils
 from Music.VulkanBot import VulkanBot
-from Music.Song import Song
+from Music.SongsPage import SongsPage
 from Music.Playlist import Playlist
 from typing import List, Union
 from discord import Button, Interaction
@@ -29,7 +29,7 @@ class QueueHandler(AbstractHandler):
 
         # Acquire the Lock to manipulate the playlist
         playerLock = playersManager.getPlayerLock(self.guild)
-        acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
         if acquired:
             playlist: Playlist = playersManager.getPlayerPlaylist(self.guild)
 
@@ -39,23 +39,15 @@ class QueueHandler(AbstractHandler):
                 playerLock.release()  # Release the Lock
                 return HandlerResponse(self.ctx, embed)
 
-            allSongs = playlist.getSongs()
-            if len(allSongs) == 0:
+            # Retrieve only the songs of the page to be printed
+            songsPage = playlist.getSongsPage(pageNumber)
+            if songsPage.totalSongs == 0:
                 embed = self.embeds.EMPTY_QUEUE()
                 playerLock.release()  # Release the Lock
                 return HandlerResponse(self.ctx, embed)
 
-            songsPages = playlist.getSongsPages()
-            # Truncate the pageNumber to the closest value
-            if pageNumber < 0:
-                pageNumber = 0
-            elif pageNumber >= len(songsPages):
-                pageNumber = len(songsPages) - 1
-
-            # Select the page in queue to be printed
-            songs = songsPages[pageNumber]
             # Create view for this embed
-            buttons = self.__createViewButtons(songsPages, pageNumber)
+            buttons = self.__createViewButtons(songsPage)
             buttons.extend(self.__createViewJumpButtons(playlist))
             queueView = BasicView(self.bot, buttons, self.config.QUEUE_VIEW_TIMEOUT)
 
@@ -64,15 +56,12 @@ class QueueHandler(AbstractHandler):
             else:
                 title = self.messages.QUEUE_TITLE
 
-            total_time = Utils.format_time(sum([int(song.duration if song.duration else 0)
-                                                for song in allSongs]))
-            total_songs = len(playlist.getSongs())
+            total_time = Utils.format_time(playlist.getTotalDuration())
+            total_songs = songsPage.totalSongs
 
-            text = f'📜 Queue length: {total_songs} | Page Number: {pageNumber+1}/{len(songsPages)} | ⌛ Duration: `{total_time}` downloaded  \n\n'
+            text = f'📜 Queue length: {total_songs} | Page Number: {songsPage.pageNumber+1}/{songsPage.pagesQuant} | ⌛ Duration: `{total_time}` downloaded  \n\n'
 
-            # To work get the correct index of all songs
-            startIndex = (pageNumber * self.config.MAX_SONGS_IN_PAGE) + 1
-            for pos, song in enumerate(songs, start=startIndex):
+            for pos, song in enumerate(songsPage.songs, start=songsPage.startPosition):
                 song_name = song.title[:50] if song.title else self.messages.SONG_DOWNLOADING
 
                 songURL = ''
@@ -98,15 +87,15 @@ class QueueHandler(AbstractHandler):
             embed = self.embeds.PLAYER_RESTARTED()
             return HandlerResponse(self.ctx, embed)
 
-    def __createViewButtons(self, songsPages: List[List[Song]], pageNumber: int) -> List[Button]:
+    def __createViewButtons(self, songsPage: SongsPage) -> List[Button]:
         buttons = []
-        if pageNumber > 0:
-            prevPageNumber = pageNumber - 1
+        if songsPage.hasPrevious():
+            prevPageNumber = songsPage.pageNumber - 1
             buttons.append(CallbackButton(self.bot, self.run, VEmojis().BACK, self.ctx.channel,
                                           self.guild.id, MessagesCategory.QUEUE, "Prev Page", pageNumber=prevPageNumber))
 
-        if pageNumber < len(songsPages) - 1:
-            nextPageNumber = pageNumber + 1
+        if songsPage.hasNext():
+            nextPageNumber = songsPage.pageNumber + 1
             buttons.append(CallbackButton(self.bot, self.run, VEmojis().SKIP, self.ctx.channel,
                                           self.guild.id, MessagesCategory.QUEUE, "Next Page", pageNumber=nextPageNumber))
 
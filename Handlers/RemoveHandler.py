@@ -58,5 +58,5 @@ class RemoveHandler(AbstractHandler):
         position = int(position)
 
         if position == -1:
-            position = len(playlist.getSongs())
+            position = playlist.getQueueLength()
         return position
@@ -0,0 +1,54 @@
+from discord.ext.commands import Context
+from Handlers.AbstractHandler import AbstractHandler
+from Handlers.HandlerResponse import HandlerResponse
+from Config.Exceptions import BadCommandUsage, InvalidInput, UnknownError
+from Music.PlaylistStore import PlaylistStore
+from Music.VulkanBot import VulkanBot
+from Parallelism.AbstractProcessManager import AbstractPlayersManager
+from typing import Union
+from discord import Interaction
+
+
+class SavePlaylistHandler(AbstractHandler):
+    def __init__(self, ctx: Union[Context, Interaction], bot: VulkanBot) -> None:
+        super().__init__(ctx, bot)
+
+    async def run(self, name: str) -> HandlerResponse:
+        name = name.strip().lower()
+        if len(name) == 0 or len(name) > self.config.MAX_PLAYLIST_NAME_LENGTH:
+            embed = self.embeds.INVALID_PLAYLIST_NAME()
+            error = InvalidInput()
+            return HandlerResponse(self.ctx, embed, error)
+
+        playersManager: AbstractPlayersManager = self.config.getPlayersManager()
+        if not playersManager.verifyIfPlayerExists(self.guild):
+            embed = self.embeds.NOT_PLAYING()
+            error = BadCommandUsage()
+            return HandlerResponse(self.ctx, embed, error)
+
+        playerLock = playersManager.getPlayerLock(self.guild)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        if not acquired:
+            playersManager.resetPlayer(self.guild, self.ctx)
+            embed = self.embeds.PLAYER_RESTARTED()
+            return HandlerResponse(self.ctx, embed)
+
+        try:
+            playlist = playersManager.getPlayerPlaylist(self.guild)
+            records = playlist.getRecords()
+        finally:
+            playerLock.release()
+
+        if len(records) == 0:
+            embed = self.embeds.EMPTY_QUEUE()
+            return HandlerResponse(self.ctx, embed)
+
+        try:
+            PlaylistStore().savePlaylist(self.guild.id, name, records)
+            embed = self.embeds.PLAYLIST_SAVED(name, len(records))
+            return HandlerResponse(self.ctx, embed)
+        except Exception as e:
+            print(f'DEVELOPER NOTE -> Error Saving Playlist: {e}')
+            error = UnknownError()
+            embed = self.embeds.UNKNOWN_ERROR()
+            return HandlerResponse(self.ctx, embed, error)
@@ -18,7 +18,7 @@ class ShuffleHandler(AbstractHandler):
         if playersManager.verifyIfPlayerExists(self.guild):
             try:
                 playerLock = playersManager.getPlayerLock(self.guild)
-                acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+                acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
                 if acquired:
                     playlist = playersManager.getPlayerPlaylist(self.guild)
                     playlist.shuffle()
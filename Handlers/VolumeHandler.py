@@ -30,7 +30,7 @@ class VolumeHandler(AbstractHandler):
             return HandlerResponse(self.ctx, embed, error)
 
         playerLock = playersManager.getPlayerLock(self.guild)
-        acquired = playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
+        acquired = await playerLock.acquire(timeout=self.config.ACQUIRE_LOCK_TIMEOUT)
         volume = self.__convert_input_to_volume(args)        
         if acquired:
             volumeCommand = VCommands(VCommandsType.VOLUME, volume)
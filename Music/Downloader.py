@@ -43,18 +43,24 @@ class Downloader:
         self.__not_extracted_not_keys = ['entries']
         self.__playlist_keys = ['entries']
 
-    def finish_one_song(self, song: Song) -> Song:
-        try:
-            if song.identifier is None:
-                return None
+    async def finish_one_song_async(self, song: Song) -> Song:
+        """
+        Download the song in other thread without blocking the loop, the song is finished back in the loop because
+        it updates its Playlist, that is only changed by the loop
+        """
+        if song.identifier is None:
+            return None
+
+        song_info = await asyncio.get_event_loop().run_in_executor(None, self.__download_song_info, song)
+        song.finish_down(song_info)
+        return song
 
+    def __download_song_info(self, song: Song) -> dict:
+        try:
             if Utils.is_url(song.identifier):
-                song_info = self.__download_url(song.identifier)
+                return self.__download_url(song.identifier)
             else:
-                song_info = self.__download_title(song.identifier)
-
-            song.finish_down(song_info)
-            return song
+                return self.__download_title(song.identifier)
         # Convert yt_dlp error to my own error
         except DownloadError as e:
             raise DownloadingError(e.msg)
@@ -120,22 +126,17 @@ class Downloader:
         if song.source is not None:  # If Music already preloaded
             return None
 
-        def __download_func(song: Song) -> None:
-            try:
-                if Utils.is_url(song.identifier):
-                    song_info = self.__download_url(song.identifier)
-                else:
-                    song_info = self.__download_title(song.identifier)
-
-                song.finish_down(song_info)
-            except Exception as e:
-                print(f'DEVELOPER NOTE -> Error Downloading {song.identifier} -> {e}')
-
         # Creating a loop task to download each song
         loop = asyncio.get_event_loop()
         executor = ThreadPoolExecutor(max_workers=self.__config.MAX_PRELOAD_SONGS)
-        fs = {loop.run_in_executor(executor, __download_func, song)}
-        await asyncio.wait(fs=fs, return_when=asyncio.ALL_COMPLETED)
+        try:
+            song_info = await loop.run_in_executor(executor, self.__download_song_info, song)
+        except Exception as e:
+            print(f'DEVELOPER NOTE -> Error Downloading {song.identifier} -> {e}')
+            return None
+
+        # Only the download runs in the executor, the song updates its Playlist in the loop
+        song.finish_down(song_info)
 
     def __download_title(self, title: str) -> dict:
         options = Downloader.__YDL_OPTIONS
@@ -0,0 +1,263 @@
+import random
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+class IndexedQueue:
+    """
+    Sequence stored in a list of blocks with a Fenwick tree over the blocks length.
+    Finding a position costs O(log n) and inserting or removing in a position only moves the elements of one block,
+    allowing the Playlist to insert, remove and move songs in any position of big queues without scanning all of them
+
+    If a key function is passed, each item is indexed by its key, that must be unique in the queue, and then
+    finding, checking and removing one item by the key doesn't need to scan the queue
+    """
+    BLOCK_SIZE = 128
+
+    def __init__(self, items: Iterable = (), key: Callable[[Any], Hashable] = None) -> None:
+        self.__blocks: List[List] = []
+        self.__tree: List[int] = [0]
+        self.__length = 0
+        self.__key = key
+        # Map the key of each item to the block storing it and each block to its index
+        self.__keysBlocks: Dict[Hashable, List] = {}
+        self.__blocksIndexes: Dict[int, int] = {}
+        self.__build(list(items))
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator:
+        for block in self.__blocks:
+            yield from block
+
+    def __reversed__(self) -> Iterator:
+        for block in reversed(self.__blocks):
+            yield from reversed(block)
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        blockIndex, position = self.__locate(index)
+        return self.__blocks[blockIndex][position]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        blockIndex, position = self.__locate(index)
+        block = self.__blocks[blockIndex]
+        self.__unindexItem(block[position])
+        block[position] = value
+        self.__indexItems([value], block)
+
+    def __getstate__(self) -> Tuple:
+        """Only the items are pickled, the blocks and the indexes are rebuilt when unpickled"""
+        return (list(self), self.__key)
+
+    def __setstate__(self, state: Tuple) -> None:
+        items, key = state
+        self.__init__(items, key)
+
+    def __repr__(self) -> str:
+        return f'IndexedQueue({list(self)})'
+
+    def append(self, item: Any) -> None:
+        if len(self.__blocks) == 0:
+            self.__build([item])
+            return
+        self.__insertInBlock(len(self.__blocks) - 1, len(self.__blocks[-1]), item)
+
+    def appendleft(self, item: Any) -> None:
+        self.insert(0, item)
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert the item before the position index, as the list.insert the index is clamped to the queue limits"""
+        if index < 0:
+            index = max(0, self.__length + index)
+        if index >= self.__length:
+            return self.append(item)
+
+        blockIndex, position = self.__locate(index)
+        self.__insertInBlock(blockIndex, position, item)
+
+    def extend(self, items: Iterable) -> None:
+        items = list(items)
+        if len(items) == 0:
+            return
+        # Fill the last block and then create the new ones directly
+        if len(self.__blocks) > 0:
+            items = list(self.__blocks.pop()) + items
+        for start in range(0, len(items), self.BLOCK_SIZE):
+            block = items[start:start + self.BLOCK_SIZE]
+            self.__blocks.append(block)
+            self.__indexItems(block, block)
+        self.__length = sum(len(block) for block in self.__blocks)
+        self.__rebuildTree()
+
+    def pop(self, index: int = -1) -> Any:
+        if self.__length == 0:
+            raise IndexError('pop from an empty queue')
+        blockIndex, position = self.__locate(index)
+        block = self.__blocks[blockIndex]
+        item = block.pop(position)
+        self.__unindexItem(item)
+        self.__length -= 1
+
+        if len(block) == 0:
+            del self.__blocks[blockIndex]
+            self.__rebuildTree()
+        else:
+            self.__updateTree(blockIndex, -1)
+        return item
+
+    def popleft(self) -> Any:
+        return self.pop(0)
+
+    def remove(self, item: Any) -> None:
+        """Remove the first occurrence of the item, needs to scan the queue"""
+        for index, queued in enumerate(self):
+            if queued is item or queued == item:
+                self.pop(index)
+                return
+        raise ValueError('item not in queue')
+
+    def containsKey(self, key: Hashable) -> bool:
+        return key in self.__keysBlocks.keys()
+
+    def getByKey(self, key: Hashable) -> Optional[Any]:
+        """Return the item with the key or None, only the block storing the item is scanned"""
+        block = self.__keysBlocks.get(key)
+        if block is None:
+            return None
+        for item in block:
+            if self.__key(item) == key:
+                return item
+
+    def indexOfKey(self, key: Hashable) -> Optional[int]:
+        """Return the current index of the item with the key or None if it's not in the queue"""
+        block = self.__keysBlocks.get(key)
+        if block is None:
+            return None
+
+        blockIndex = self.__blocksIndexes[id(block)]
+        for position, item in enumerate(block):
+            if self.__key(item) == key:
+                return self.__prefixLength(blockIndex) + position
+
+    def removeKey(self, key: Hashable) -> Optional[Any]:
+        """Remove and return the item with the key, returns None if the item is not in the queue"""
+        index = self.indexOfKey(key)
+        if index is None:
+            return None
+        return self.pop(index)
+
+    def move(self, origin: int, destination: int) -> Any:
+        """Move the item in the origin position to the destination position, returns the item moved"""
+        item = self.pop(origin)
+        self.insert(destination, item)
+        return item
+
+    def slice(self, start: int, end: int) -> List:
+        """Return the items between start and end without going through the items before start"""
+        start = max(0, start)
+        end = min(end, self.__length)
+        if start >= end:
+            return []
+
+        items = []
+        blockIndex, position = self.__locate(start)
+        while len(items) < end - start:
+            block = self.__blocks[blockIndex]
+            items.extend(block[position:position + (end - start - len(items))])
+            blockIndex += 1
+            position = 0
+        return items
+
+    def clear(self) -> None:
+        self.__build([])
+
+    def reverse(self) -> None:
+        self.__blocks.reverse()
+        for block in self.__blocks:
+            block.reverse()
+        self.__rebuildTree()
+
+    def shuffle(self) -> None:
+        items = list(self)
+        random.shuffle(items)
+        self.__build(items)
+
+    def __build(self, items: List) -> None:
+        self.__blocks = [items[start:start + self.BLOCK_SIZE] for start in range(0, len(items), self.BLOCK_SIZE)]
+        self.__length = len(items)
+        self.__keysBlocks = {}
+        for block in self.__blocks:
+            self.__indexItems(block, block)
+        self.__rebuildTree()
+
+    def __insertInBlock(self, blockIndex: int, position: int, item: Any) -> None:
+        block = self.__blocks[blockIndex]
+        block.insert(position, item)
+        self.__indexItems([item], block)
+        self.__length += 1
+
+        # Split the block if it's too big, to keep the insertions cost low
+        if len(block) > 2 * self.BLOCK_SIZE:
+            newBlock = block[self.BLOCK_SIZE:]
+            del block[self.BLOCK_SIZE:]
+            self.__blocks.insert(blockIndex + 1, newBlock)
+            self.__indexItems(newBlock, newBlock)
+            self.__rebuildTree()
+        else:
+            self.__updateTree(blockIndex, 1)
+
+    def __indexItems(self, items: List, block: List) -> None:
+        if self.__key is None:
+            return
+        for item in items:
+            self.__keysBlocks[self.__key(item)] = block
+
+    def __unindexItem(self, item: Any) -> None:
+        if self.__key is None:
+            return
+        self.__keysBlocks.pop(self.__key(item), None)
+
+    def __prefixLength(self, blockIndex: int) -> int:
+        """Quant of items stored in the blocks before the blockIndex"""
+        total = 0
+        while blockIndex > 0:
+            total += self.__tree[blockIndex]
+            blockIndex -= blockIndex & -blockIndex
+        return total
+
+    def __locate(self, index: int) -> Tuple[int, int]:
+        """Return the block index and the position inside the block of the item in the index"""
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError('queue index out of range')
+
+        # Descend the Fenwick tree looking for the block that contains the index
+        blockIndex = 0
+        remaining = index
+        step = 1 << (len(self.__tree) - 1).bit_length()
+        while step > 0:
+            nextIndex = blockIndex + step
+            if nextIndex < len(self.__tree) and self.__tree[nextIndex] <= remaining:
+                blockIndex = nextIndex
+                remaining -= self.__tree[nextIndex]
+            step >>= 1
+        return blockIndex, remaining
+
+    def __updateTree(self, blockIndex: int, delta: int) -> None:
+        treeIndex = blockIndex + 1
+        while treeIndex < len(self.__tree):
+            self.__tree[treeIndex] += delta
+            treeIndex += treeIndex & -treeIndex
+
+    def __rebuildTree(self) -> None:
+        tree = [0] * (len(self.__blocks) + 1)
+        for index, block in enumerate(self.__blocks, start=1):
+            tree[index] += len(block)
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self.__tree = tree
+        self.__blocksIndexes = {id(block): index for index, block in enumerate(self.__blocks)}
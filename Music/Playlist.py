@@ -1,25 +1,62 @@
 from collections import deque
-from typing import List
+from operator import attrgetter
+from threading import RLock
+from typing import List, Optional, Tuple
 from Config.Configs import VConfigs
+from Music.TieredQueue import TieredQueue
+from Music.PlaylistChanges import PlaylistChange, PlaylistChangeType
+from Music.PlaylistStats import PlaylistStats
 from Music.Song import Song
-import random
+from Music.SongsPage import SongsPage
 
 
 class Playlist:
+    # Quant of the last changes stored, older versions must read all the Playlist again
+    MAX_CHANGES_STORED = 200
 
     def __init__(self) -> None:
         self.__configs = VConfigs()
-        self.__queue = deque()  # Store the musics to play
+        # Store the musics to play indexed by the songID, only the first songs are kept in memory
+        self.__queue = TieredQueue(attrgetter('songID'), self.__configs.MAX_SONGS_IN_MEMORY,
+                                   self.__configs.PLAYLISTS_SPILL_FOLDER, self.__bindSong)
         self.__songs_history = deque()  # Store the musics played
+        self.__stats = PlaylistStats()  # Aggregates of the queue, updated in each song added, removed or downloaded
 
         self.__looping_one = False
         self.__looping_all = False
 
         self.__current: Song = None
 
-    def getSongs(self) -> deque[Song]:
+        # Increased in each change of the queue or the current song
+        self.__version = 0
+        self.__changes: deque[PlaylistChange] = deque(maxlen=self.MAX_CHANGES_STORED)
+        # The songs change the Playlist when downloaded, without the player lock, the exports can't read at the same time
+        self.__songsLock = RLock()
+
+    def getVersion(self) -> int:
+        return self.__version
+
+    def getChangesSince(self, version: int) -> Optional[List[PlaylistChange]]:
+        """Return the changes made after the version, or None if they are not stored anymore"""
+        if version >= self.__version:
+            return []
+        if len(self.__changes) == 0 or self.__changes[0].version > version + 1:
+            return None
+        return [change for change in self.__changes if change.version > version]
+
+    def __notifyChange(self, type: PlaylistChangeType, songID: int = None, position: int = None, newPosition: int = None,
+                       songsIDs: Tuple[int, ...] = None) -> None:
+        self.__version += 1
+        change = PlaylistChange(self.__version, type, songID, position, newPosition, songsIDs)
+        self.__changes.append(change)
+
+    def getSongs(self) -> TieredQueue:
         return self.__queue
 
+    def getQueueLength(self) -> int:
+        """Use instead of len(getSongs()), that through the Playlist proxy would send all the songs"""
+        return len(self.__queue)
+
     def validate_position(self, position: int) -> bool:
         if position not in range(1, len(self.__queue) + 1):
             return False
@@ -46,18 +83,30 @@ class Playlist:
 
     def setCurrentSong(self, song: Song) -> Song:
         self.__current = song
+        self.__notifyChange(PlaylistChangeType.CURRENT_CHANGED, self.__getSongID(song))
 
     def getSongsToPreload(self) -> List[Song]:
-        return list(self.__queue)[:self.__configs.MAX_PRELOAD_SONGS]
+        return self.getSongsPage(0, self.__configs.MAX_PRELOAD_SONGS).songs
+
+    def getSongsPage(self, pageNumber: int, pageSize: int = None) -> SongsPage:
+        """Return only the songs in the page, the pageNumber starts in 0 and is truncated to the closest existing page"""
+        if pageSize is None:
+            pageSize = self.__configs.MAX_SONGS_IN_PAGE
+
+        totalSongs = len(self.__queue)
+        pagesQuant = max(1, -(-totalSongs // pageSize))
+        pageNumber = min(max(pageNumber, 0), pagesQuant - 1)
 
-    def getSongsPages(self) -> List[List[Song]]:
-        songsPages = []
-        for x in range(0, len(self.__queue), self.__configs.MAX_SONGS_IN_PAGE):
-            endIndex = x + self.__configs.MAX_SONGS_IN_PAGE
-            startIndex = x
-            songsPages.append(list(self.__queue)[startIndex:endIndex])
+        startIndex = pageNumber * pageSize
+        songs = self.__queue.slice(startIndex, startIndex + pageSize)
+        return SongsPage(songs, pageNumber, pagesQuant, totalSongs, pageSize)
 
-        return songsPages
+    def getTotalDuration(self) -> int:
+        return self.__stats.totalDuration
+
+    def getStats(self) -> PlaylistStats:
+        """Return a copy of the queue aggregates, without going through the songs"""
+        return self.__stats.copy()
 
     def __len__(self) -> int:
         return len(self.__queue)
@@ -79,16 +128,24 @@ class Playlist:
 
             elif self.__looping_one:  # Insert the current song to play again
                 self.__queue.appendleft(played_song)
+                self.__stats.addSong(played_song)
+                self.__notifyChange(PlaylistChangeType.ADDED, played_song.songID, 1)
 
             elif self.__looping_all:  # Insert the current song in the end of queue
                 self.__queue.append(played_song)
+                self.__stats.addSong(played_song)
+                self.__notifyChange(PlaylistChangeType.ADDED, played_song.songID, len(self.__queue))
 
         # Get the new song
         if len(self.__queue) == 0:
             self.__current = None
+            self.__notifyChange(PlaylistChangeType.CURRENT_CHANGED)
             return None
 
         self.__current: Song = self.__queue.popleft()
+        self.__stats.removeSong(self.__current)
+        self.__notifyChange(PlaylistChangeType.REMOVED, self.__current.songID, 1)
+        self.__notifyChange(PlaylistChangeType.CURRENT_CHANGED, self.__current.songID)
         return self.__current
 
     def prev_song(self) -> Song:
@@ -97,27 +154,50 @@ class Playlist:
         else:
             if self.__current != None:
                 self.__queue.appendleft(self.__current)
+                self.__stats.addSong(self.__current)
+                self.__notifyChange(PlaylistChangeType.ADDED, self.__current.songID, 1)
 
             last_song = self.__songs_history.popleft()  # Get the last song
             self.__current = last_song
+            self.__notifyChange(PlaylistChangeType.CURRENT_CHANGED, last_song.songID)
             return self.__current  # return the song
 
     def add_song(self, song: Song) -> Song:
         self.__queue.append(song)
+        self.__stats.addSong(song)
+        self.__notifyChange(PlaylistChangeType.ADDED, song.songID, len(self.__queue))
         return song
 
+    def add_songs(self, songs: List[Song]) -> int:
+        """Add all the songs in the end of the queue in one call, returns the new size of the queue"""
+        start = len(self.__queue)
+        self.__queue.extend(songs)
+        for song in songs:
+            self.__stats.addSong(song)
+        if len(songs) > 0:
+            # Only one change for all the songs, from the first to the last position added
+            self.__notifyChange(PlaylistChangeType.ADDED_MANY, None, start + 1, len(self.__queue),
+                                tuple(song.songID for song in songs))
+        return len(self.__queue)
+
     def add_song_start(self, song: Song) -> Song:
-        self.__queue.insert(0, song)
+        self.__queue.appendleft(song)
+        self.__stats.addSong(song)
+        self.__notifyChange(PlaylistChangeType.ADDED, song.songID, 1)
         return song
 
     def shuffle(self) -> None:
-        random.shuffle(self.__queue)
+        self.__queue.shuffle()
+        self.__notifyChange(PlaylistChangeType.SHUFFLED)
 
     def revert(self) -> None:
         self.__queue.reverse()
+        self.__notifyChange(PlaylistChangeType.REVERSED)
 
     def clear(self) -> None:
         self.__queue.clear()
+        self.__stats.clear()
+        self.__notifyChange(PlaylistChangeType.CLEARED)
 
     def loop_one(self) -> None:
         self.__looping_one = True
@@ -131,24 +211,170 @@ class Playlist:
         self.__looping_all = False
         self.__looping_one = False
 
+    def update_song(self, song: Song) -> None:
+        """Called by the song when it finishes the download, the duration and state in the stats may change"""
+        with self.__songsLock:
+            self.__stats.updateSong(song)
+
     def destroy_song(self, song_destroy: Song) -> None:
-        for song in self.__queue:
-            if song == song_destroy:
-                self.__queue.remove(song)
-                break
+        # The stats know the queued songs, so the songs never queued don't read the index of the spilled songs
+        if not self.__stats.containsSong(song_destroy.songID):
+            return
+        with self.__songsLock:
+            position = self.getSongPosition(song_destroy.songID)
+            if position is None:
+                return
+            song = self.__queue.pop(position-1)
+            self.__stats.removeSong(song)
+            self.__notifyChange(PlaylistChangeType.REMOVED, song_destroy.songID, position)
+
+    def getSongByID(self, songID: int) -> Optional[Song]:
+        return self.__queue.getByKey(songID)
+
+    def isSongQueued(self, songID: int) -> bool:
+        return self.__queue.containsKey(songID)
+
+    def getSongPosition(self, songID: int) -> Optional[int]:
+        """Return the current position of the song in the queue, starting in 1, or None if not queued"""
+        index = self.__queue.indexOfKey(songID)
+        if index is None:
+            return None
+        return index + 1
 
-    def move_songs(self, pos1, pos2) -> str:
-        song = self.__queue[pos1-1]
-        self.__queue.remove(song)
-        self.__queue.insert(pos2-1, song)
+    def move_songs(self, pos1, pos2) -> Song:
+        song = self.__queue.move(pos1-1, pos2-1)
+        self.__notifyChange(PlaylistChangeType.MOVED, song.songID, pos1, pos2)
+        return song
 
+    def remove_song(self, position) -> Song:
+        song = self.__queue.pop(position-1)
+        self.__stats.removeSong(song)
+        self.__notifyChange(PlaylistChangeType.REMOVED, song.songID, position)
         return song
 
-    def remove_song(self, position) -> str:
-        song = self.__queue[position-1]
-        self.__queue.remove(song)
+    def move_many(self, moves: List[Tuple[int, int]]) -> List[Song]:
+        """Apply each (origin, destination) move in order, the positions of each move consider the previous ones"""
+        return [self.move_songs(pos1, pos2) for pos1, pos2 in moves]
+
+    def remove_range(self, start: int, end: int) -> List[Song]:
+        """
+        Remove the songs between the positions start and end, both included and starting in 1
+        The end after the last song is limited to it, raises IndexError if start is not valid or after the end
+        """
+        if not self.validate_position(start) or start > end:
+            raise IndexError(f'invalid range of positions {start} to {end}')
+        end = min(end, len(self.__queue))
+        removed = []
+        for _ in range(start, end + 1):
+            song = self.__queue.pop(start-1)
+            self.__stats.removeSong(song)
+            self.__notifyChange(PlaylistChangeType.REMOVED, song.songID, start)
+            removed.append(song)
+        return removed
+
+    def exportState(self) -> dict:
+        """Persistent form of the Playlist, with the songs stored in the Song.toRecord form"""
+        with self.__songsLock:
+            return {'version': self.__version,
+                    'current': self.__current.toRecord() if self.__current is not None else None,
+                    'queue': [song.toRecord() for song in self.__queue],
+                    'history': [song.toRecord() for song in self.__songs_history],
+                    'loopingOne': self.__looping_one,
+                    'loopingAll': self.__looping_all}
+
+    def exportChangesSince(self, version: int) -> Optional[dict]:
+        """
+        Persistent form of the changes made after the version, to be applied with applyChanges in the state exported
+        in that version. Only the songs added are read, returns None if the changes are not stored anymore or if the
+        order of the queue changed randomly, in these cases the whole state must be exported
+        """
+        with self.__songsLock:
+            return self.__exportChangesSince(version)
+
+    def __exportChangesSince(self, version: int) -> Optional[dict]:
+        changes = self.getChangesSince(version)
+        if changes is None:
+            return None
 
-        return song
+        operations = []
+        for change in changes:
+            if change.type == PlaylistChangeType.ADDED:
+                operations.append(['add', change.position, [self.__getRecord(change.songID)]])
+            elif change.type == PlaylistChangeType.ADDED_MANY:
+                operations.append(['add', change.position, [self.__getRecord(songID) for songID in change.songsIDs]])
+            elif change.type == PlaylistChangeType.REMOVED:
+                operations.append(['remove', change.position])
+            elif change.type == PlaylistChangeType.MOVED:
+                operations.append(['move', change.position, change.newPosition])
+            elif change.type == PlaylistChangeType.CLEARED:
+                operations.append(['clear'])
+            elif change.type in (PlaylistChangeType.SHUFFLED, PlaylistChangeType.REVERSED):
+                return None
+
+        # The current song and the history are small, they are always sent whole
+        return {'version': self.__version,
+                'operations': operations,
+                'current': self.__current.toRecord() if self.__current is not None else None,
+                'history': [song.toRecord() for song in self.__songs_history],
+                'loopingOne': self.__looping_one,
+                'loopingAll': self.__looping_all}
+
+    @classmethod
+    def applyChanges(cls, state: dict, changes: dict) -> dict:
+        """Apply in the exported state the changes exported by exportChangesSince, returns the state updated"""
+        queue = state['queue']
+        for operation in changes['operations']:
+            if operation[0] == 'add':
+                position, records = operation[1], operation[2]
+                queue[position-1:position-1] = records
+            elif operation[0] == 'remove':
+                del queue[operation[1]-1]
+            elif operation[0] == 'move':
+                queue.insert(operation[2]-1, queue.pop(operation[1]-1))
+            elif operation[0] == 'clear':
+                queue.clear()
+
+        for key in ('version', 'current', 'history', 'loopingOne', 'loopingAll'):
+            state[key] = changes[key]
+        return state
+
+    def __getRecord(self, songID: int) -> dict:
+        # A song added that is not in the queue anymore is removed by one of the next operations
+        song = self.__queue.getByKey(songID)
+        return song.toRecord() if song is not None else {}
+
+    def getRecords(self) -> List[dict]:
+        """Return the current song and the songs in the queue in the Song.toRecord form"""
+        songs = [self.__current] if self.__current is not None else []
+        songs.extend(self.__queue)
+        return [song.toRecord() for song in songs]
+
+    def restoreState(self, state: dict) -> int:
+        """
+        Add the songs of an exported state in the end of the queue, the song that was playing is added
+        before the others to be played again. Returns the quant of songs added to the queue
+        """
+        records = state.get('queue', [])
+        if state.get('current') is not None:
+            records = [state['current']] + records
+        songs = [Song.fromRecord(record, self) for record in records]
+        self.add_songs(songs)
+
+        for record in reversed(state.get('history', [])):
+            self.__songs_history.appendleft(Song.fromRecord(record, self))
+        while len(self.__songs_history) > self.__configs.MAX_SONGS_HISTORY:
+            self.__songs_history.pop()
+
+        self.__looping_one = state.get('loopingOne', False)
+        self.__looping_all = state.get('loopingAll', False)
+        return len(songs)
+
+    def __bindSong(self, song: Song) -> None:
+        """The songs read from the disk lose the reference to the Playlist, needed to destroy themselves"""
+        song.playlist = self
+
+    def __getSongID(self, song: Song) -> Optional[int]:
+        return song.songID if song is not None else None
 
     def getHistory(self) -> list:
         titles = []
@@ -0,0 +1,67 @@
+from enum import Enum
+from typing import Optional, Tuple
+
+
+class PlaylistChangeType(Enum):
+    ADDED = 'Added'
+    # Many songs added at once in the end of the queue, from the position to the newPosition
+    ADDED_MANY = 'Added Many'
+    REMOVED = 'Removed'
+    MOVED = 'Moved'
+    CLEARED = 'Cleared'
+    # The order of all the queue changed randomly
+    SHUFFLED = 'Shuffled'
+    # The order of all the queue was inverted
+    REVERSED = 'Reversed'
+    CURRENT_CHANGED = 'Current Changed'
+
+
+class PlaylistChange:
+    """Compact description of one change in the Playlist, the version is the Playlist version after the change"""
+    __slots__ = ('__version', '__type', '__songID', '__position', '__newPosition', '__songsIDs')
+
+    def __init__(self, version: int, type: PlaylistChangeType, songID: Optional[int] = None,
+                 position: Optional[int] = None, newPosition: Optional[int] = None,
+                 songsIDs: Optional[Tuple[int, ...]] = None) -> None:
+        self.__version = version
+        self.__type = type
+        self.__songID = songID
+        self.__position = position
+        self.__newPosition = newPosition
+        self.__songsIDs = songsIDs
+
+    def __getstate__(self) -> tuple:
+        return (self.__version, self.__type, self.__songID, self.__position, self.__newPosition, self.__songsIDs)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.__version, self.__type, self.__songID, self.__position, self.__newPosition, self.__songsIDs = state
+
+    def __repr__(self) -> str:
+        return f'PlaylistChange({self.__version}, {self.__type.name}, {self.__songID}, {self.__position}, {self.__newPosition})'
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    @property
+    def type(self) -> PlaylistChangeType:
+        return self.__type
+
+    @property
+    def songID(self) -> Optional[int]:
+        return self.__songID
+
+    @property
+    def position(self) -> Optional[int]:
+        """Position in the queue, starting in 1, where the song was added or removed from"""
+        return self.__position
+
+    @property
+    def newPosition(self) -> Optional[int]:
+        """Position where the song was moved to in MOVED changes, or the last song added in ADDED_MANY changes"""
+        return self.__newPosition
+
+    @property
+    def songsIDs(self) -> Optional[Tuple[int, ...]]:
+        """The songs added in ADDED_MANY changes, in the order of the queue"""
+        return self.__songsIDs
@@ -0,0 +1,84 @@
+from typing import Dict, Tuple
+from Music.Song import Song
+
+
+class PlaylistStats:
+    """
+    Aggregates of the songs in the queue, updated by the Playlist in each song added, removed or downloaded
+    The contribution of each song is stored to be subtracted even if the song object changed while queued,
+    a song that finishes the download while queued has its contribution replaced by the new one
+    """
+
+    def __init__(self) -> None:
+        self.__totalDuration = 0
+        self.__resolvedQuant = 0
+        self.__pendingQuant = 0
+        self.__requesters: Dict[str, int] = {}
+        self.__contributions: Dict[int, Tuple[int, bool, str]] = {}
+
+    def addSong(self, song: Song) -> None:
+        contribution = (int(song.duration), song.source is not None, song.requester)
+        self.__contributions[song.songID] = contribution
+        self.__apply(contribution, 1)
+
+    def removeSong(self, song: Song) -> None:
+        contribution = self.__contributions.pop(song.songID, None)
+        if contribution is not None:
+            self.__apply(contribution, -1)
+
+    def containsSong(self, songID: int) -> bool:
+        return songID in self.__contributions
+
+    def updateSong(self, song: Song) -> None:
+        """Recompute the contribution of a queued song, ignored if the song is not in the queue"""
+        if song.songID not in self.__contributions:
+            return
+        self.removeSong(song)
+        self.addSong(song)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def __apply(self, contribution: Tuple[int, bool, str], signal: int) -> None:
+        duration, resolved, requester = contribution
+        self.__totalDuration += signal * duration
+        if resolved:
+            self.__resolvedQuant += signal
+        else:
+            self.__pendingQuant += signal
+
+        quant = self.__requesters.get(requester, 0) + signal
+        if quant > 0:
+            self.__requesters[requester] = quant
+        else:
+            self.__requesters.pop(requester, None)
+
+    def copy(self) -> 'PlaylistStats':
+        """Snapshot with only the aggregates, to be read outside the Playlist"""
+        stats = PlaylistStats()
+        stats.__totalDuration = self.__totalDuration
+        stats.__resolvedQuant = self.__resolvedQuant
+        stats.__pendingQuant = self.__pendingQuant
+        stats.__requesters = dict(self.__requesters)
+        return stats
+
+    @property
+    def totalDuration(self) -> int:
+        return self.__totalDuration
+
+    @property
+    def resolvedQuant(self) -> int:
+        return self.__resolvedQuant
+
+    @property
+    def pendingQuant(self) -> int:
+        return self.__pendingQuant
+
+    @property
+    def songsQuant(self) -> int:
+        return self.__resolvedQuant + self.__pendingQuant
+
+    @property
+    def requesters(self) -> Dict[str, int]:
+        """Quant of songs in the queue requested by each user"""
+        return self.__requesters
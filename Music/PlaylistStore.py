@@ -0,0 +1,135 @@
+import json
+import os
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Dict, List, Optional, Set
+from Config.Configs import VConfigs
+from Config.Singleton import Singleton
+from Music.Playlist import Playlist
+
+
+class PlaylistStore(Singleton):
+    """
+    Store the last snapshot of each guild Playlist in a SQLite database, allowing the queues to be restored
+    after the Bot restarts. Each snapshot is restored only once, in the first Player created for the guild
+    The changes after the snapshot are appended in the Playlist.exportChangesSince form, and compacted in a new
+    snapshot after some of them, so a big queue is not written whole in each change
+    Also store the playlists saved by name in each guild, with the songs in the Song.toRecord form
+    """
+
+    def __init__(self) -> None:
+        if not super().created:
+            self.__config = VConfigs()
+            self.__lock = Lock()
+            self.__restoredGuilds: Set[int] = set()
+            folder = os.path.dirname(self.__config.PLAYLISTS_DATABASE_PATH)
+            if folder != '':
+                os.makedirs(folder, exist_ok=True)
+            self.__connection = sqlite3.connect(self.__config.PLAYLISTS_DATABASE_PATH, check_same_thread=False)
+            self.__connection.execute('''CREATE TABLE IF NOT EXISTS playlists_snapshots (
+                                            guild_id INTEGER PRIMARY KEY,
+                                            version INTEGER NOT NULL,
+                                            saved_at REAL NOT NULL,
+                                            state TEXT NOT NULL)''')
+            self.__connection.execute('''CREATE TABLE IF NOT EXISTS playlists_changes (
+                                            guild_id INTEGER NOT NULL,
+                                            version INTEGER NOT NULL,
+                                            changes TEXT NOT NULL,
+                                            PRIMARY KEY (guild_id, version))''')
+            self.__connection.execute('''CREATE TABLE IF NOT EXISTS saved_playlists (
+                                            guild_id INTEGER NOT NULL,
+                                            name TEXT NOT NULL,
+                                            saved_at REAL NOT NULL,
+                                            songs TEXT NOT NULL,
+                                            PRIMARY KEY (guild_id, name))''')
+            self.__connection.commit()
+
+    def saveSnapshots(self, states: Dict[int, Optional[dict]]) -> None:
+        """
+        Save the state of each guild in one transaction, replacing the snapshot and the changes stored for the guild
+        None or an empty state deletes the guild snapshot
+        """
+        with self.__lock:
+            with self.__connection:
+                for guildID, state in states.items():
+                    self.__writeSnapshot(guildID, state)
+
+    def saveChanges(self, guildID: int, changes: dict) -> int:
+        """Append the changes to the snapshot of the guild, returns the quant of changes stored for the guild"""
+        with self.__lock:
+            with self.__connection:
+                self.__connection.execute('INSERT OR REPLACE INTO playlists_changes VALUES (?, ?, ?)',
+                                          (guildID, changes['version'], json.dumps(changes)))
+                row = self.__connection.execute('SELECT COUNT(*) FROM playlists_changes WHERE guild_id = ?',
+                                                (guildID,)).fetchone()
+        return row[0]
+
+    def compactSnapshot(self, guildID: int) -> None:
+        """Apply the changes stored for the guild in its snapshot, only the database is read and written"""
+        with self.__lock:
+            with self.__connection:
+                state = self.__readState(guildID)
+                if state is not None:
+                    self.__writeSnapshot(guildID, state)
+
+    def loadSnapshot(self, guildID: int) -> Optional[dict]:
+        """Return the stored state of the guild only in the first call for the guild, otherwise returns None"""
+        with self.__lock:
+            if guildID in self.__restoredGuilds:
+                return None
+            self.__restoredGuilds.add(guildID)
+            try:
+                return self.__readState(guildID)
+            except (ValueError, KeyError, IndexError) as e:
+                print(f'[ERROR LOADING PLAYLIST SNAPSHOT] -> {guildID} - {e}')
+                return None
+
+    def __readState(self, guildID: int) -> Optional[dict]:
+        """Return the snapshot of the guild with the changes after it applied, or None if nothing is stored"""
+        row = self.__connection.execute('SELECT version, state FROM playlists_snapshots WHERE guild_id = ?',
+                                        (guildID,)).fetchone()
+        # Without snapshot the changes start from an empty queue
+        version, state = (row[0], json.loads(row[1])) if row is not None else (0, None)
+        rows = self.__connection.execute('SELECT changes FROM playlists_changes WHERE guild_id = ? AND version > ? '
+                                         'ORDER BY version', (guildID, version)).fetchall()
+        if state is None and len(rows) == 0:
+            return None
+
+        state = state if state is not None else {'version': version, 'current': None, 'queue': [], 'history': []}
+        for changesRow in rows:
+            state = Playlist.applyChanges(state, json.loads(changesRow[0]))
+        return state
+
+    def __writeSnapshot(self, guildID: int, state: Optional[dict]) -> None:
+        self.__connection.execute('DELETE FROM playlists_changes WHERE guild_id = ?', (guildID,))
+        if state is None or self.__isEmpty(state):
+            self.__connection.execute('DELETE FROM playlists_snapshots WHERE guild_id = ?', (guildID,))
+        else:
+            self.__connection.execute('INSERT OR REPLACE INTO playlists_snapshots VALUES (?, ?, ?, ?)',
+                                      (guildID, state['version'], time(), json.dumps(state)))
+
+    def savePlaylist(self, guildID: int, name: str, records: List[dict]) -> None:
+        """Save the songs records with the name, replacing the playlist with the same name in the guild"""
+        with self.__lock:
+            with self.__connection:
+                self.__connection.execute('INSERT OR REPLACE INTO saved_playlists VALUES (?, ?, ?, ?)',
+                                          (guildID, name, time(), json.dumps(records)))
+
+    def loadPlaylist(self, guildID: int, name: str) -> Optional[List[dict]]:
+        """Return the songs records of the saved playlist or None if there is no playlist with the name"""
+        with self.__lock:
+            row = self.__connection.execute('SELECT songs FROM saved_playlists WHERE guild_id = ? AND name = ?',
+                                            (guildID, name)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def getPlaylistsNames(self, guildID: int) -> List[str]:
+        with self.__lock:
+            rows = self.__connection.execute('SELECT name FROM saved_playlists WHERE guild_id = ? ORDER BY name',
+                                             (guildID,)).fetchall()
+        return [row[0] for row in rows]
+
+    def __isEmpty(self, state: dict) -> bool:
+        return state.get('current') is None and len(state.get('queue', [])) == 0
@@ -0,0 +1,33 @@
+from discord import AudioSource
+from discord.opus import Encoder
+
+
+class PositionTrackedSource(AudioSource):
+    """
+    Audio source that counts the frames read by the voice client, giving the position of the song being played
+    The voice client reads one frame of 20ms each time, only while playing, so the pauses are not counted
+    A source started in the middle of the song receives the startPosition, the seconds skipped by ffmpeg
+    """
+    FRAME_SECONDS = Encoder.FRAME_LENGTH / 1000
+
+    def __init__(self, source: AudioSource, startPosition: float = 0.0) -> None:
+        self.__source = source
+        self.__startPosition = startPosition
+        self.__framesRead = 0
+
+    @property
+    def position(self) -> float:
+        """Seconds of the song already sent to Discord"""
+        return self.__startPosition + self.__framesRead * self.FRAME_SECONDS
+
+    def read(self) -> bytes:
+        data = self.__source.read()
+        if data:
+            self.__framesRead += 1
+        return data
+
+    def is_opus(self) -> bool:
+        return self.__source.is_opus()
+
+    def cleanup(self) -> None:
+        self.__source.cleanup()
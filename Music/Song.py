@@ -1,73 +1,155 @@
+from collections.abc import Mapping
+from itertools import count
+from os import getpid
 from time import time
+from typing import Iterator, Optional, Tuple
 
 
 class Song:
+    """
+    Store the information of one song, the fields are slotted to keep the memory low with big queues
+    Only the fields used by the Bot are kept from the information downloaded
+    """
+    __slots__ = ('__songID', '__identifier', '__requester', '__problematic', '__playlist', '__downloadTime',
+                 '__source', '__title', '__duration', '__id', '__webpageUrl', '__originalUrl',
+                 '__channel', '__uploader', '__thumbnail', '__codec')
+
+    # Default minimum duration
+    DEFAULT_DURATION = 5.0
+    __IDS_COUNTER = count()
+
     def __init__(self, identifier: str, playlist, requester: str) -> None:
-        self.__identifier = identifier
-        self.__info = {'requester': requester}
-        self.__problematic = False
+        # Stable id of this song, kept when pickled, unique also between songs created in different processes
+        self.__songID: int = (getpid() << 40) | next(Song.__IDS_COUNTER)
+        self.__identifier: str = identifier
+        self.__requester: str = requester
+        self.__problematic: bool = False
         self.__playlist = playlist
-        self.__downloadTime: int = time()
+        self.__downloadTime: float = time()
+        self.__source: Optional[str] = None
+        self.__title: Optional[str] = None
+        self.__duration: Optional[float] = None
+        self.__id: Optional[str] = None
+        self.__webpageUrl: Optional[str] = None
+        self.__originalUrl: Optional[str] = None
+        self.__channel: Optional[str] = None
+        self.__uploader: Optional[str] = None
+        self.__thumbnail: Optional[str] = None
+        self.__codec: Optional[str] = None
 
     def finish_down(self, info: dict) -> None:
         if info is None or info == {}:
             self.destroy()
             return None
 
+        if 'url' not in info.keys():
+            print(f'DEVELOPER NOTE -> Required information [url] was not found in the music: {self.identifier}')
+            self.destroy()
+            return
+
         self.__downloadTime = time()
-        self.__useful_keys = ['duration',
-                              'title', 'webpage_url',
-                              'channel', 'id', 'uploader',
-                              'thumbnail', 'original_url']
-        self.__required_keys = ['url']
-
-        for key in self.__required_keys:
-            if key in info.keys():
-                self.__info[key] = info[key]
-            else:
-                print(
-                    f'DEVELOPER NOTE -> Required information [{key}] was not found in the music: {self.identifier}')
-                self.destroy()
-                return
-
-        for key in self.__useful_keys:
-            if key in info.keys():
-                self.__info[key] = info[key]
+        self.__source = info['url']
+        self.__duration = info.get('duration', self.__duration)
+        self.__title = info.get('title', self.__title)
+        self.__webpageUrl = info.get('webpage_url', self.__webpageUrl)
+        self.__originalUrl = info.get('original_url', self.__originalUrl)
+        self.__channel = info.get('channel', self.__channel)
+        self.__id = info.get('id', self.__id)
+        self.__uploader = info.get('uploader', self.__uploader)
+        self.__thumbnail = info.get('thumbnail', self.__thumbnail)
+        self.__codec = info.get('acodec', self.__codec)
 
         self.__cleanTitle()
+        # The playlist updates the stats if the song is already queued
+        if self.__playlist is not None:
+            self.__playlist.update_song(self)
 
     def __cleanTitle(self) -> None:
-        self.__info['title'] = ''.join(char if char.isalnum() or char ==
-                                       ' ' else ' ' for char in self.__info['title'])
+        if self.__title is None:
+            return
+        self.__title = ''.join(char if char.isalnum() or char == ' ' else ' ' for char in self.__title)
+
+    def __getstate__(self) -> Tuple:
+        """Compact pickle form, the values are stored in a tuple and the playlist reference is not sent"""
+        return (self.__songID, self.__identifier, self.__requester, self.__problematic, self.__downloadTime,
+                self.__source, self.__title, self.__duration, self.__id, self.__webpageUrl,
+                self.__originalUrl, self.__channel, self.__uploader, self.__thumbnail, self.__codec)
+
+    def __setstate__(self, state: Tuple) -> None:
+        (self.__songID, self.__identifier, self.__requester, self.__problematic, self.__downloadTime,
+         self.__source, self.__title, self.__duration, self.__id, self.__webpageUrl,
+         self.__originalUrl, self.__channel, self.__uploader, self.__thumbnail, self.__codec) = state
+        self.__playlist = None
+
+    def toRecord(self) -> dict:
+        """Persistent form of the Song, the source is not stored because it expires"""
+        return {'identifier': self.__identifier,
+                'requester': self.__requester,
+                'title': self.__title,
+                'duration': self.__duration,
+                'id': self.__id,
+                'webpage_url': self.__webpageUrl,
+                'original_url': self.__originalUrl,
+                'channel': self.__channel,
+                'uploader': self.__uploader,
+                'thumbnail': self.__thumbnail}
+
+    @classmethod
+    def fromRecord(cls, record: dict, playlist) -> 'Song':
+        """
+        Create a Song from the toRecord form with all the metadata but without source, the song is resolved
+        by the url of the video when played, so the title never needs to be searched again
+        """
+        identifier = record.get('webpage_url') or record.get('original_url') or record.get('identifier')
+        song = cls(identifier, playlist, record.get('requester'))
+        song.__title = record.get('title')
+        song.__duration = record.get('duration')
+        song.__id = record.get('id')
+        song.__webpageUrl = record.get('webpage_url')
+        song.__originalUrl = record.get('original_url')
+        song.__channel = record.get('channel')
+        song.__uploader = record.get('uploader')
+        song.__thumbnail = record.get('thumbnail')
+        return song
 
     @property
-    def downloadTime(self) -> int:
+    def songID(self) -> int:
+        return self.__songID
+
+    @property
+    def downloadTime(self) -> float:
         return self.__downloadTime
 
     @property
     def source(self) -> str:
-        if 'url' in self.__info.keys():
-            return self.__info['url']
-        else:
-            return None
+        return self.__source
 
     @source.setter
     def source(self, value) -> None:
-        self.__info['url'] = value
+        self.__source = value
+
+    @property
+    def playlist(self):
+        return self.__playlist
+
+    @playlist.setter
+    def playlist(self, value) -> None:
+        self.__playlist = value
 
     @property
     def title(self) -> str:
-        if 'title' in self.__info.keys():
-            return self.__info['title']
-        else:
-            return None
+        return self.__title
 
     @property
-    def duration(self) -> str:
-        if 'duration' in self.__info.keys():
-            return self.__info['duration']
-        else:  # Default minimum duration
-            return 5.0
+    def duration(self) -> float:
+        if self.__duration is None:
+            return self.DEFAULT_DURATION
+        return self.__duration
+
+    @property
+    def downloadedDuration(self) -> Optional[float]:
+        """The duration retrieved in the download, without the default value"""
+        return self.__duration
 
     @property
     def identifier(self) -> str:
@@ -77,6 +159,39 @@ class Song:
     def identifier(self, value) -> None:
         self.__identifier = value
 
+    @property
+    def requester(self) -> str:
+        return self.__requester
+
+    @property
+    def videoID(self) -> str:
+        return self.__id
+
+    @property
+    def webpageUrl(self) -> str:
+        return self.__webpageUrl
+
+    @property
+    def originalUrl(self) -> str:
+        return self.__originalUrl
+
+    @property
+    def channel(self) -> str:
+        return self.__channel
+
+    @property
+    def uploader(self) -> str:
+        return self.__uploader
+
+    @property
+    def thumbnail(self) -> str:
+        return self.__thumbnail
+
+    @property
+    def codec(self) -> Optional[str]:
+        """Audio codec of the source, like 'opus', None if it's not known"""
+        return self.__codec
+
     @property
     def problematic(self) -> bool:
         return self.__problematic
@@ -84,8 +199,55 @@ class Song:
     def destroy(self) -> None:
         print(f'MUSIC ERROR -> Music self destroying {self.__identifier}')
         self.__problematic = True
-        self.__playlist.destroy_song(self)
+        if self.__playlist is not None:
+            self.__playlist.destroy_song(self)
 
     @property
-    def info(self):
-        return self.__info
+    def info(self) -> 'SongInfo':
+        return SongInfo(self)
+
+
+class SongInfo(Mapping):
+    """
+    Read only dict view of the Song fields, only the fields with values are present
+    Used where the info dict is expected, like the VEmbeds.SONG_INFO
+    """
+    __slots__ = ('__song',)
+
+    __KEYS = {'requester': 'requester',
+              'url': 'source',
+              'duration': 'downloadedDuration',
+              'title': 'title',
+              'webpage_url': 'webpageUrl',
+              'original_url': 'originalUrl',
+              'channel': 'channel',
+              'id': 'videoID',
+              'uploader': 'uploader',
+              'thumbnail': 'thumbnail'}
+
+    def __init__(self, song: Song) -> None:
+        self.__song = song
+
+    def __getitem__(self, key: str):
+        if key not in self.__KEYS.keys():
+            raise KeyError(key)
+
+        value = getattr(self.__song, self.__KEYS[key])
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__KEYS.keys():
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
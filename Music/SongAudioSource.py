@@ -0,0 +1,24 @@
+from discord import AudioSource, FFmpegOpusAudio, FFmpegPCMAudio
+from Config.Configs import VConfigs
+from Music.Song import Song
+
+
+class SongAudioSource:
+    """
+    Create the ffmpeg source that plays a song
+    The PCM sources are encoded to Opus by the voice client in each 20ms frame, when the song is already in Opus
+    the stream is copied by ffmpeg and sent as it is, the frames are not decoded or encoded in any process
+    """
+    OPUS_CODECS = ('opus',)
+
+    @classmethod
+    def create(cls, song: Song, ffmpegOptions: dict, volume: float) -> AudioSource:
+        if cls.canPassthrough(song, volume):
+            # With the codec of the song already in Opus the FFmpegOpusAudio copies the stream instead of encoding it
+            return FFmpegOpusAudio(song.source, codec=song.codec, **ffmpegOptions)
+        return FFmpegPCMAudio(song.source, **ffmpegOptions)
+
+    @classmethod
+    def canPassthrough(cls, song: Song, volume: float) -> bool:
+        """The Opus frames can't have the volume changed, so only the songs in the default volume are copied"""
+        return VConfigs().OPUS_PASSTHROUGH and song.codec in cls.OPUS_CODECS and volume == 1
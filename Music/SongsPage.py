@@ -0,0 +1,41 @@
+from typing import List
+from Music.Song import Song
+
+
+class SongsPage:
+    """Store only the songs of one page of the queue, together with the information to navigate between pages"""
+
+    def __init__(self, songs: List[Song], pageNumber: int, pagesQuant: int, totalSongs: int, pageSize: int) -> None:
+        self.__songs = songs
+        self.__pageNumber = pageNumber
+        self.__pagesQuant = pagesQuant
+        self.__totalSongs = totalSongs
+        self.__pageSize = pageSize
+
+    @property
+    def songs(self) -> List[Song]:
+        return self.__songs
+
+    @property
+    def pageNumber(self) -> int:
+        """Index of the page starting in 0, already truncated to the existing pages"""
+        return self.__pageNumber
+
+    @property
+    def pagesQuant(self) -> int:
+        return self.__pagesQuant
+
+    @property
+    def totalSongs(self) -> int:
+        return self.__totalSongs
+
+    @property
+    def startPosition(self) -> int:
+        """Position in the queue of the first song in this page, starting in 1"""
+        return self.__pageNumber * self.__pageSize + 1
+
+    def hasPrevious(self) -> bool:
+        return self.__pageNumber > 0
+
+    def hasNext(self) -> bool:
+        return self.__pageNumber < self.__pagesQuant - 1
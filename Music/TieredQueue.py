@@ -0,0 +1,330 @@
+import pickle
+import random
+import tempfile
+from array import array
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from Music.IndexedQueue import IndexedQueue
+
+
+class TieredQueue:
+    """
+    Queue that keeps in memory only a window of items in the start, stored in an IndexedQueue, and spills the
+    other items to a segment file in the disk. For the spilled items only the position in the file and the key
+    are kept in memory, so the length, paging, shuffle and reverse work without loading them
+
+    The key function must return an int, like the Song.songID, because the keys of the spilled items are
+    stored in an array. The onRead function receives each item read from the disk, to bind again the references
+    that are not pickled, like the Playlist of the Song
+    """
+    # Minimum size of the segment file before compacting the space of the removed items
+    MIN_COMPACT_SIZE = 1024 * 1024
+
+    def __init__(self, key: Callable[[Any], int], windowSize: int = 200, folder: Optional[str] = None,
+                 onRead: Optional[Callable[[Any], None]] = None) -> None:
+        self.__key = key
+        self.__onRead = onRead
+        self.__windowSize = max(1, windowSize)
+        self.__folder = folder
+        self.__head = IndexedQueue(key=key)
+        # Position, size and key of each spilled item, in the queue order
+        self.__offsets = array('q')
+        self.__lengths = array('q')
+        self.__keys = array('q')
+        # Position in the spilled items of each key, None when it must be rebuilt after the positions changed
+        self.__keysIndex: Optional[Dict[int, int]] = {}
+        self.__segment = None  # The file is only created when the first item is spilled
+        # The readers of other threads, like the snapshotter, share the position of the file
+        self.__segmentLock = Lock()
+        self.__segmentSize = 0
+        self.__liveBytes = 0
+
+    def __len__(self) -> int:
+        return len(self.__head) + len(self.__keys)
+
+    def __iter__(self) -> Iterator:
+        yield from self.__head
+        for index in range(len(self.__keys)):
+            yield self.__read(index)
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        index = self.__normalize(index)
+        if index < len(self.__head):
+            return self.__head[index]
+        return self.__read(index - len(self.__head))
+
+    def __getstate__(self) -> Tuple:
+        """
+        The spilled items are loaded to be pickled, the segment file is only valid in this process
+        The onRead function is not pickled, the owner of the unpickled queue must set it again
+        """
+        return (list(self), self.__key, self.__windowSize, self.__folder)
+
+    def __setstate__(self, state: Tuple) -> None:
+        items, key, windowSize, folder = state
+        self.__init__(key, windowSize, folder)
+        self.extend(items)
+
+    def __repr__(self) -> str:
+        return f'TieredQueue({len(self.__head)} in memory, {len(self.__keys)} in disk)'
+
+    @property
+    def spilledQuant(self) -> int:
+        return len(self.__keys)
+
+    def append(self, item: Any) -> None:
+        if len(self.__keys) > 0:
+            self.__spill([item], len(self.__keys))
+        else:
+            self.__head.append(item)
+            self.__balance()
+
+    def appendleft(self, item: Any) -> None:
+        self.__head.appendleft(item)
+        self.__balance()
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert the item before the position index, as the list.insert the index is clamped to the queue limits"""
+        if index < 0:
+            index = max(0, len(self) + index)
+        index = min(index, len(self))
+
+        if index < len(self.__head) or len(self.__keys) == 0:
+            self.__head.insert(index, item)
+            self.__balance()
+        else:
+            self.__spill([item], index - len(self.__head))
+
+    def extend(self, items: Iterable) -> None:
+        items = list(items)
+        if len(self.__keys) == 0:
+            # Fill the memory window first, only the remaining items are written
+            inMemoryQuant = max(0, 2 * self.__windowSize - len(self.__head))
+            self.__head.extend(items[:inMemoryQuant])
+            items = items[inMemoryQuant:]
+        if len(items) > 0:
+            self.__spill(items, len(self.__keys))
+
+    def pop(self, index: int = -1) -> Any:
+        if len(self) == 0:
+            raise IndexError('pop from an empty queue')
+        index = self.__normalize(index)
+
+        if index < len(self.__head):
+            item = self.__head.pop(index)
+        else:
+            tailIndex = index - len(self.__head)
+            item = self.__read(tailIndex)
+            self.__deleteSpilled(tailIndex, tailIndex + 1)
+        self.__balance()
+        return item
+
+    def popleft(self) -> Any:
+        return self.pop(0)
+
+    def containsKey(self, key: int) -> bool:
+        return self.__head.containsKey(key) or self.__tailIndexOfKey(key) is not None
+
+    def getByKey(self, key: int) -> Optional[Any]:
+        item = self.__head.getByKey(key)
+        if item is not None:
+            return item
+        tailIndex = self.__tailIndexOfKey(key)
+        if tailIndex is not None:
+            return self.__read(tailIndex)
+
+    def indexOfKey(self, key: int) -> Optional[int]:
+        index = self.__head.indexOfKey(key)
+        if index is not None:
+            return index
+        tailIndex = self.__tailIndexOfKey(key)
+        if tailIndex is not None:
+            return len(self.__head) + tailIndex
+
+    def removeKey(self, key: int) -> Optional[Any]:
+        index = self.indexOfKey(key)
+        if index is None:
+            return None
+        return self.pop(index)
+
+    def move(self, origin: int, destination: int) -> Any:
+        """Move the item in the origin position to the destination position, returns the item moved"""
+        item = self.pop(origin)
+        self.insert(destination, item)
+        return item
+
+    def slice(self, start: int, end: int) -> List:
+        """Return the items between start and end, only the spilled items inside the interval are read"""
+        start = max(0, start)
+        end = min(end, len(self))
+        if start >= end:
+            return []
+
+        headLength = len(self.__head)
+        items = self.__head.slice(start, min(end, headLength))
+        for tailIndex in range(max(start, headLength) - headLength, end - headLength):
+            items.append(self.__read(tailIndex))
+        return items
+
+    def clear(self) -> None:
+        self.__head.clear()
+        self.__offsets = array('q')
+        self.__lengths = array('q')
+        self.__keys = array('q')
+        self.__keysIndex = {}
+        self.__resetSegment()
+
+    def reverse(self) -> None:
+        self.__reorder(list(reversed(range(len(self)))))
+
+    def shuffle(self) -> None:
+        order = list(range(len(self)))
+        random.shuffle(order)
+        self.__reorder(order)
+
+    def __reorder(self, order: List[int]) -> None:
+        """Rebuild the queue in the order, where each value is a current position. Only the items that enter
+        the memory window are read and only the items that leave the window are written"""
+        headItems = list(self.__head)
+        headLength = len(headItems)
+        oldSpilled = (self.__offsets, self.__lengths, self.__keys)
+
+        newHead = []
+        for position in order[:self.__windowSize]:
+            if position < headLength:
+                newHead.append(headItems[position])
+            else:
+                newHead.append(self.__read(position - headLength))
+
+        offsets, lengths, keys = array('q'), array('q'), array('q')
+        leavingWindow = []
+        for position in order[self.__windowSize:]:
+            if position < headLength:
+                # Store the place of the item, the offset is defined when the items are written
+                leavingWindow.append(headItems[position])
+                offsets.append(-len(leavingWindow))
+                lengths.append(0)
+                keys.append(self.__key(headItems[position]))
+            else:
+                tailIndex = position - headLength
+                offsets.append(oldSpilled[0][tailIndex])
+                lengths.append(oldSpilled[1][tailIndex])
+                keys.append(oldSpilled[2][tailIndex])
+
+        written = self.__write(leavingWindow)
+        for index in range(len(offsets)):
+            if offsets[index] < 0:
+                offsets[index], lengths[index] = written[-offsets[index] - 1]
+
+        self.__head = IndexedQueue(newHead, key=self.__key)
+        self.__offsets, self.__lengths, self.__keys = offsets, lengths, keys
+        self.__keysIndex = None
+        self.__liveBytes = sum(self.__lengths)
+        self.__compactIfNeeded()
+
+    def __balance(self) -> None:
+        """Keep the memory window between half and twice the window size while there are spilled items"""
+        if len(self.__head) > 2 * self.__windowSize:
+            leaving = [self.__head.pop() for _ in range(len(self.__head) - self.__windowSize)]
+            leaving.reverse()
+            self.__spill(leaving, 0)
+        elif len(self.__head) < self.__windowSize // 2 and len(self.__keys) > 0:
+            quant = min(self.__windowSize - len(self.__head), len(self.__keys))
+            self.__head.extend([self.__read(index) for index in range(quant)])
+            self.__deleteSpilled(0, quant)
+
+    def __spill(self, items: List, tailIndex: int) -> None:
+        """Write the items and insert them in the spilled items before the tailIndex"""
+        if tailIndex == len(self.__keys) and self.__keysIndex is not None:
+            # Items added in the end don't change the position of the others
+            for index, item in enumerate(items, start=tailIndex):
+                self.__keysIndex.setdefault(self.__key(item), index)
+        else:
+            self.__keysIndex = None
+        written = self.__write(items)
+        self.__offsets[tailIndex:tailIndex] = array('q', (offset for offset, _ in written))
+        self.__lengths[tailIndex:tailIndex] = array('q', (length for _, length in written))
+        self.__keys[tailIndex:tailIndex] = array('q', (self.__key(item) for item in items))
+        self.__liveBytes += sum(length for _, length in written)
+
+    def __deleteSpilled(self, start: int, end: int) -> None:
+        self.__liveBytes -= sum(self.__lengths[start:end])
+        if end == len(self.__keys) and self.__keysIndex is not None:
+            for key in self.__keys[start:end]:
+                if self.__keysIndex.get(key, -1) >= start:
+                    del self.__keysIndex[key]
+        else:
+            self.__keysIndex = None
+        del self.__offsets[start:end]
+        del self.__lengths[start:end]
+        del self.__keys[start:end]
+        self.__compactIfNeeded()
+
+    def __write(self, items: List) -> List[Tuple[int, int]]:
+        """Append the items in the end of the segment, returns the offset and size of each one"""
+        if len(items) == 0:
+            return []
+        if self.__segment is None:
+            self.__segment = tempfile.TemporaryFile(prefix='vulkan_queue_', dir=self.__folder)
+
+        written = []
+        data = bytearray()
+        for item in items:
+            record = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+            written.append((self.__segmentSize + len(data), len(record)))
+            data.extend(record)
+
+        with self.__segmentLock:
+            self.__segment.seek(self.__segmentSize)
+            self.__segment.write(data)
+        self.__segmentSize += len(data)
+        return written
+
+    def __read(self, tailIndex: int) -> Any:
+        with self.__segmentLock:
+            self.__segment.seek(self.__offsets[tailIndex])
+            data = self.__segment.read(self.__lengths[tailIndex])
+        item = pickle.loads(data)
+        if self.__onRead is not None:
+            self.__onRead(item)
+        return item
+
+    def __tailIndexOfKey(self, key: int) -> Optional[int]:
+        """Position of the key in the spilled items, the index is rebuilt only in the first lookup after a change"""
+        if self.__keysIndex is None:
+            self.__keysIndex = {}
+            for index, spilledKey in enumerate(self.__keys):
+                self.__keysIndex.setdefault(spilledKey, index)
+        return self.__keysIndex.get(key)
+
+    def __resetSegment(self) -> None:
+        """Without spilled items the segment file can be discarded"""
+        with self.__segmentLock:
+            if self.__segment is not None:
+                self.__segment.close()
+            self.__segment = None
+        self.__segmentSize = 0
+        self.__liveBytes = 0
+
+    def __compactIfNeeded(self) -> None:
+        if len(self.__keys) == 0:
+            self.__resetSegment()
+        elif self.__segmentSize > self.MIN_COMPACT_SIZE and self.__segmentSize > 2 * self.__liveBytes:
+            self.__compact()
+
+    def __compact(self) -> None:
+        """Rewrite only the spilled items that are still in the queue, releasing the space of the removed ones"""
+        items = [self.__read(index) for index in range(len(self.__keys))]
+        self.__resetSegment()
+        self.__offsets, self.__lengths, self.__keys = array('q'), array('q'), array('q')
+        self.__keysIndex = {}
+        self.__spill(items, 0)
+
+    def __normalize(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError('queue index out of range')
+        return index
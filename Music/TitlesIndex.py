@@ -0,0 +1,126 @@
+import heapq
+from collections import OrderedDict
+from time import time
+from typing import Dict, List, Set
+from Config.Singleton import Singleton
+from Config.Configs import VConfigs
+from Music.Song import Song
+
+
+class IndexedTitle:
+    """Store the already resolved information of one song that can be suggested to the users"""
+
+    def __init__(self, videoID: str, title: str, url: str) -> None:
+        self.__videoID = videoID
+        self.__title = title
+        self.__url = url
+        self.__globalUses = 0
+        self.__guildsUses: Dict[int, int] = {}
+        self.__lastUse: float = time()
+
+    @property
+    def videoID(self) -> str:
+        return self.__videoID
+
+    @property
+    def title(self) -> str:
+        return self.__title
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def globalUses(self) -> int:
+        return self.__globalUses
+
+    @property
+    def lastUse(self) -> float:
+        return self.__lastUse
+
+    def getGuildUses(self, guildID: int) -> int:
+        return self.__guildsUses.get(guildID, 0)
+
+    def registerUse(self, guildID: int) -> None:
+        self.__globalUses += 1
+        self.__guildsUses[guildID] = self.__guildsUses.get(guildID, 0) + 1
+        self.__lastUse = time()
+
+
+class TitlesIndex(Singleton):
+    """
+    Local prefix index over the titles recently resolved by the Bot, used to give suggestions
+    in the play command without having to search anything in Youtube
+    """
+    __MAX_PREFIX_LENGTH = 15
+
+    def __init__(self) -> None:
+        if not super().created:
+            self.__config = VConfigs()
+            # Store the titles by the url of the song, ordered from the least to the most recently used
+            self.__titles: OrderedDict[str, IndexedTitle] = OrderedDict()
+            # Map each prefix of each word in the titles to the urls of the songs containing them
+            self.__prefixes: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__titles)
+
+    def addResolvedSong(self, song: Song, guildID: int) -> None:
+        """Register the song as requested in the guild, only songs already downloaded are stored"""
+        # The url of the page is played again by any extractor, the video id is only an url in Youtube
+        url = song.webpageUrl or song.originalUrl
+        if song.problematic or url is None or not song.title or self.__config.MAX_AUTOCOMPLETE_TITLES <= 0:
+            return
+
+        if url not in self.__titles.keys():
+            if len(self.__titles) >= self.__config.MAX_AUTOCOMPLETE_TITLES:
+                self.__removeOldest()
+
+            self.__titles[url] = IndexedTitle(song.videoID, song.title, url)
+            for prefix in self.__getPrefixes(song.title):
+                self.__prefixes.setdefault(prefix, set()).add(url)
+
+        self.__titles.move_to_end(url)
+        self.__titles[url].registerUse(guildID)
+
+    def isResolvedURL(self, track: str) -> bool:
+        """Returns if the track is the URL of one suggestion, in that case no search is needed"""
+        return track in self.__titles.keys()
+
+    def getSuggestions(self, query: str, guildID: int, quant: int = 25) -> List[IndexedTitle]:
+        """Return the titles matching the query, the most used in the guild first and then the most used globally"""
+        words = self.__normalize(query).split()
+        if len(words) == 0:
+            candidates = self.__titles.keys()
+        else:
+            candidates = None
+            for word in words:
+                matching = self.__prefixes.get(word[:self.__MAX_PREFIX_LENGTH], set())
+                candidates = matching if candidates is None else candidates & matching
+                if len(candidates) == 0:
+                    return []
+
+        titles = [self.__titles[url] for url in candidates]
+        return heapq.nlargest(quant, titles,
+                              key=lambda title: (title.getGuildUses(guildID), title.globalUses, title.lastUse))
+
+    def __removeOldest(self) -> None:
+        url, indexed = self.__titles.popitem(last=False)
+        for prefix in self.__getPrefixes(indexed.title):
+            urls = self.__prefixes.get(prefix)
+            if urls is None:
+                continue
+
+            urls.discard(url)
+            if len(urls) == 0:
+                del self.__prefixes[prefix]
+
+    def __getPrefixes(self, title: str) -> Set[str]:
+        prefixes = set()
+        for word in self.__normalize(title).split():
+            for length in range(1, min(len(word), self.__MAX_PREFIX_LENGTH) + 1):
+                prefixes.add(word[:length])
+        return prefixes
+
+    def __normalize(self, text: str) -> str:
+        return ''.join(char if char.isalnum() else ' ' for char in text.lower())
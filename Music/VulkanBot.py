@@ -1,8 +1,8 @@
 from asyncio import AbstractEventLoop
-from discord import Guild, Status, Game, Message
+from discord import ApplicationCommand, Guild, Interaction, Status, Game, Message
 from discord.ext.commands.errors import CommandNotFound, MissingRequiredArgument
 from Config.Configs import VConfigs
-from discord.ext.commands import Bot, Context
+from discord.ext.commands import AutoShardedBot, Bot, Context
 from Config.Messages import Messages
 from Config.Embeds import VEmbeds
 
@@ -50,6 +50,12 @@ class VulkanBot(Bot):
         if self.__listingSlash:
             print(self.__messages.STARTUP_COMPLETE_MESSAGE)
 
+    async def on_application_command_auto_complete(self, interaction: Interaction, command: ApplicationCommand) -> None:
+        # Only the Bot listening to commands should answer, otherwise the Players Processes would race with it
+        if not self.__listingSlash:
+            return
+        await super().on_application_command_auto_complete(interaction, command)
+
     async def on_command_error(self, ctx, error):
         if isinstance(error, MissingRequiredArgument):
             embed = self.__embeds.MISSING_ARGUMENTS()
@@ -76,6 +82,11 @@ class VulkanBot(Bot):
         await self.invoke(ctx)
 
 
+class VulkanShardedBot(VulkanBot, AutoShardedBot):
+    """VulkanBot connected to Discord by many gateway shards, each shard receives the events of part of the guilds"""
+    pass
+
+
 class Context(Context):
     bot: VulkanBot
     guild: Guild
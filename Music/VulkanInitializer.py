@@ -2,7 +2,7 @@ from random import choices
 import string
 from discord.bot import Bot
 from discord import Intents
-from Music.VulkanBot import VulkanBot
+from Music.VulkanBot import VulkanBot, VulkanShardedBot
 from os import listdir
 from Config.Configs import VConfigs
 from Config.Exceptions import VulkanError
@@ -23,6 +23,8 @@ class VulkanInitializer:
     def __create_bot(self, willListen: bool) -> VulkanBot:
         if willListen:
             prefix = self.__config.BOT_PREFIX
+            if self.__config.isSharded():
+                return self.__create_sharded_bot(prefix)
             bot = VulkanBot(listingSlash=True,
                             command_prefix=prefix,
                             pm_help=True,
@@ -37,6 +39,23 @@ class VulkanInitializer:
                             intents=self.__intents)
         return bot
 
+    def __create_sharded_bot(self, prefix: str) -> VulkanShardedBot:
+        """With the SHARD_COUNT the shards are fixed, optionally only the SHARD_IDS, otherwise Discord decides"""
+        shardsArgs = {}
+        if self.__config.SHARD_COUNT > 0:
+            shardsArgs['shard_count'] = self.__config.SHARD_COUNT
+            if self.__config.SHARD_IDS is not None:
+                shardsArgs['shard_ids'] = self.__config.SHARD_IDS
+        elif self.__config.SHARD_IDS is not None:
+            print('DEVELOPER NOTE -> SHARD_IDS is ignored without the SHARD_COUNT')
+
+        return VulkanShardedBot(listingSlash=True,
+                                command_prefix=prefix,
+                                pm_help=True,
+                                case_insensitive=True,
+                                intents=self.__intents,
+                                **shardsArgs)
+
     def __add_cogs(self, bot: Bot) -> None:
         try:
             cogsStatus = []
@@ -0,0 +1,45 @@
+from random import choices
+import string
+from discord import Intents, MemberCacheFlags
+from Music.VulkanBot import VulkanBot
+
+
+class VulkanPlayerInitializer:
+    """
+    Create the bot instance of the player processes, that only connect to voice channels and play songs
+    No cog is loaded and no command is registered, the commands are always received from the main process.
+    Only the guilds and voice states events are received and only the members in voice channels are cached,
+    that is required to know if the bot is alone in the channel
+    With a sharded Bot the player must connect as the shard of its guild, otherwise it won't receive the guild
+    """
+
+    def __init__(self, shardID: int = None, shardCount: int = None) -> None:
+        self.__shardID = shardID
+        self.__shardCount = shardCount
+        self.__intents = Intents.none()
+        self.__intents.guilds = True
+        self.__intents.voice_states = True
+        self.__bot = self.__create_bot()
+
+    def getBot(self) -> VulkanBot:
+        return self.__bot
+
+    def __create_bot(self) -> VulkanBot:
+        memberCacheFlags = MemberCacheFlags.none()
+        memberCacheFlags.voice = True
+
+        # The prefix is never used, without the message content intent no command can be read
+        prefix = ''.join(choices(string.ascii_uppercase + string.digits, k=4))
+        shardsArgs = {}
+        if self.__shardCount is not None:
+            shardsArgs = {'shard_id': self.__shardID, 'shard_count': self.__shardCount}
+        bot = VulkanBot(listingSlash=False,
+                        command_prefix=prefix,
+                        intents=self.__intents,
+                        member_cache_flags=memberCacheFlags,
+                        chunk_guilds_at_startup=False,
+                        max_messages=None,
+                        # Without cogs the sync would remove the slash commands registered by the main process
+                        auto_sync_commands=False,
+                        **shardsArgs)
+        return bot
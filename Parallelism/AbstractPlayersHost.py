@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+from Parallelism.Commands import VCommands
+
+
+class PlayerHandle(ABC):
+    """Reference to a player of one guild, wherever it runs, used to send the commands and receive the events"""
+
+    @abstractmethod
+    def getName(self) -> str:
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start the player if it's not started yet"""
+        pass
+
+    @abstractmethod
+    def isAlive(self) -> bool:
+        pass
+
+    @abstractmethod
+    def send(self, command: VCommands) -> None:
+        """Send a command to the player, raises an exception if it can't be sent"""
+        pass
+
+    @abstractmethod
+    def listen(self, callback: Callable[[VCommands], None]) -> None:
+        """Call the callback in the bot loop with each command sent by the player"""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop to send and receive commands of the player, it may still be finishing"""
+        pass
+
+    @abstractmethod
+    def kill(self) -> None:
+        """Finish the player immediately, even if it's stuck"""
+        pass
+
+
+class AbstractPlayersHost(ABC):
+    """Place where the players run, the players manager only reaches the players by the PlayerHandle"""
+
+    @abstractmethod
+    def createPlayer(self, guildName: str, guildID: int, voiceID: int, shardID: int, shardCount: int) -> PlayerHandle:
+        """Create the player of the guild, it only starts playing after the start of the handle"""
+        pass
+
+    def canCreatePlayers(self) -> bool:
+        """Return if the new players can be placed out of the draining places"""
+        return True
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from threading import Lock
-from typing import Union
+from typing import Dict, Tuple, Union
 from discord.ext.commands import Context
 from discord import Guild, Interaction
 from Music.Playlist import Playlist
 from Music.Song import Song
 from Parallelism.Commands import VCommands
+from Parallelism.PlayerLock import PlayerLock
 
 
 class AbstractPlayersManager(ABC):
@@ -23,8 +24,13 @@ class AbstractPlayersManager(ABC):
         pass
 
     @abstractmethod
-    def getPlayerLock(self, guild: Guild) -> Lock:
-        """If there is a player process for the guild, then return the lock of the guild"""
+    def getPlayerLock(self, guild: Guild) -> PlayerLock:
+        """If there is a player for the guild, then return the awaitable lock of the guild, to use in the bot loop"""
+        pass
+
+    @abstractmethod
+    def getPlayersPlaylists(self) -> Dict[int, Tuple[Playlist, Lock]]:
+        """Return the playlist and the lock of each existing player, by the guild id"""
         pass
 
     @abstractmethod
@@ -45,3 +51,8 @@ class AbstractPlayersManager(ABC):
     @abstractmethod
     async def showNowPlaying(self, guildID: int, song: Song) -> None:
         pass
+
+    @abstractmethod
+    async def waitPlaylistChange(self, guild: Guild, timeout: float) -> bool:
+        """Wait the player of the guild to change the current song, returns False if the timeout is reached"""
+        pass
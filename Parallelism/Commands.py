@@ -15,6 +15,14 @@ class VCommandsType(Enum):
     TERMINATE = 'Terminate'
     VOLUME = 'Volume'
     SLEEPING = 'Sleeping'
+    SONG_FINISHED = 'Song Finished'
+    SONG_RETURNED = 'Song Returned'
+    HEARTBEAT = 'Heartbeat'
+    PLAY_AT = 'Play At'
+    DRAINING = 'Draining'
+    AUTHENTICATE = 'Authenticate'
+    # Only created in the bot when the connection with the player node drops, it's never sent
+    PLAYER_LOST = 'Player Lost'
 
 
 class VCommands:
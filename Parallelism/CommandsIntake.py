@@ -0,0 +1,86 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Awaitable, Callable, Tuple
+from Parallelism.Commands import VCommands
+from Parallelism.CommandsProtocol import CommandsProtocol
+
+
+class CommandsIntake:
+    """
+    Receive the commands of a pipe in the loop and execute them in the arrival order, one at a time
+    The pipe is watched by the loop, so no thread waits for the commands. The quant of commands waiting
+    and the latency of each command, from the arrival until the end of the execution, are measured
+    """
+    # Latency in seconds from which the executed command is reported
+    SLOW_COMMAND_LATENCY = 1.0
+
+    def __init__(self, loop: AbstractEventLoop, connection: Connection, executor: Callable[[VCommands], Awaitable[None]]) -> None:
+        self.__loop = loop
+        self.__connection = connection
+        self.__executor = executor
+        self.__commands: asyncio.Queue[Tuple[float, VCommands]] = asyncio.Queue()
+        self.__consumer: asyncio.Task = None
+        self.__executedQuant = 0
+        self.__totalLatency = 0.0
+        self.__maxLatency = 0.0
+        self.__lastLatency = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Quant of commands received and not executed yet"""
+        return self.__commands.qsize()
+
+    @property
+    def executedQuant(self) -> int:
+        return self.__executedQuant
+
+    @property
+    def lastLatency(self) -> float:
+        return self.__lastLatency
+
+    @property
+    def maxLatency(self) -> float:
+        return self.__maxLatency
+
+    @property
+    def averageLatency(self) -> float:
+        if self.__executedQuant == 0:
+            return 0.0
+        return self.__totalLatency / self.__executedQuant
+
+    def start(self) -> None:
+        self.__loop.add_reader(self.__connection.fileno(), self.__receive)
+        self.__consumer = self.__loop.create_task(self.__consume(), name='Commands Intake')
+
+    def stop(self) -> None:
+        self.__loop.remove_reader(self.__connection.fileno())
+        if self.__consumer is not None:
+            self.__consumer.cancel()
+
+    def __receive(self) -> None:
+        try:
+            while self.__connection.poll():
+                command = CommandsProtocol.decode(self.__connection.recv_bytes())
+                self.__commands.put_nowait((perf_counter(), command))
+        except (EOFError, OSError):
+            # The main process closed the pipe, no more commands will arrive
+            self.__loop.remove_reader(self.__connection.fileno())
+        except Exception as e:
+            print(f'[ERROR RECEIVING COMMAND] -> {e}')
+
+    async def __consume(self) -> None:
+        while True:
+            receivedAt, command = await self.__commands.get()
+            try:
+                await self.__executor(command)
+            except Exception as e:
+                print(f'[ERROR EXECUTING COMMAND] -> {command.getType()} - {e}')
+
+            self.__lastLatency = perf_counter() - receivedAt
+            if self.__lastLatency > self.SLOW_COMMAND_LATENCY:
+                print(f'[SLOW COMMAND] -> {command.getType()} took {self.__lastLatency:.2f}s, {self.depth} waiting')
+            self.__maxLatency = max(self.__maxLatency, self.__lastLatency)
+            self.__totalLatency += self.__lastLatency
+            self.__executedQuant += 1
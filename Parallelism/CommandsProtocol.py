@@ -0,0 +1,228 @@
+import hmac
+from asyncio import StreamReader
+from hashlib import sha256
+from math import isnan
+from struct import Struct, error as StructError
+from typing import List, Optional, Tuple
+from Music.Song import Song
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.PlayerSupervisor import PlayerHeartbeat, VoiceState
+
+
+class InvalidFrameError(ValueError):
+    """The frame was read whole but its message is not valid, the next frames of the stream can still be read"""
+
+    def __init__(self, playerID: int, error: ValueError) -> None:
+        super().__init__(f'Invalid frame of the player {playerID}: {error}')
+        self.playerID = playerID
+
+
+class CommandsProtocol:
+    """
+    Binary form of the VCommands sent between the main process and the player processes
+    Each message has a fixed header with the protocol version, the command id and the args size, followed by
+    the args in a fixed layout for each command. The events of the players reference the songs by the songID,
+    only the commands sending a song to be played carry the song values
+    In a stream, like the sockets of the player nodes, each message is inside a frame with the player id,
+    the frames with the NODE_ID are about the whole node, not one of its players
+    """
+    VERSION = 3
+    NODE_ID = 0
+    # Bigger frames are refused before being read, no command needs more than a few kilobytes
+    MAX_FRAME_SIZE = 1024 * 1024
+
+    __FRAME = Struct('!QI')
+    __HEADER = Struct('!BBI')
+    __INT = Struct('!q')
+    __DOUBLE = Struct('!d')
+    __STRING_SIZE = Struct('!I')
+    __SONG_VALUES = Struct('!q?dd')
+    __HEARTBEAT_VALUES = Struct('!dBqqd')
+    __NONE_SIZE = 0xFFFFFFFF
+    # Every field of the song is a text, except the 4 in the __SONG_VALUES and the playlist, that is not sent
+    __SONG_TEXTS_QUANT = len(Song.__slots__) - 5
+
+    # The ids are part of the protocol, new commands must receive new ids
+    __COMMANDS_IDS = {VCommandsType.PREV: 1,
+                      VCommandsType.SKIP: 2,
+                      VCommandsType.PAUSE: 3,
+                      VCommandsType.RESUME: 4,
+                      VCommandsType.CONTEXT: 5,
+                      VCommandsType.PLAY: 6,
+                      VCommandsType.STOP: 7,
+                      VCommandsType.RESET: 8,
+                      VCommandsType.NOW_PLAYING: 9,
+                      VCommandsType.TERMINATE: 10,
+                      VCommandsType.VOLUME: 11,
+                      VCommandsType.SLEEPING: 12,
+                      VCommandsType.SONG_FINISHED: 13,
+                      VCommandsType.SONG_RETURNED: 14,
+                      VCommandsType.HEARTBEAT: 15,
+                      VCommandsType.PLAY_AT: 16,
+                      VCommandsType.DRAINING: 17,
+                      VCommandsType.AUTHENTICATE: 18}
+    __IDS_COMMANDS = {commandID: commandType for commandType, commandID in __COMMANDS_IDS.items()}
+
+    @classmethod
+    def encode(cls, command: VCommands) -> bytes:
+        commandType = command.getType()
+        args = command.getArgs()
+        payload = bytearray()
+
+        if commandType in (VCommandsType.PLAY, VCommandsType.PREV):
+            # PLAY carries the song to play or None, PREV the voice channel id and the song
+            if commandType == VCommandsType.PREV:
+                voiceID, args = args
+                payload += cls.__INT.pack(voiceID)
+            if args is not None:
+                cls.__encodeSong(payload, args)
+        elif commandType == VCommandsType.PLAY_AT:
+            song, position = args
+            cls.__encodeSong(payload, song)
+            payload += cls.__DOUBLE.pack(position)
+        elif commandType in (VCommandsType.NOW_PLAYING, VCommandsType.SONG_RETURNED):
+            # The decoded events already have only the songID, the player nodes encode them again
+            payload += cls.__INT.pack(args if isinstance(args, int) else args.songID)
+        elif commandType == VCommandsType.CONTEXT:
+            guildName, guildID, voiceID, shardID, shardCount = args
+            payload += cls.__INT.pack(guildID)
+            payload += cls.__INT.pack(voiceID)
+            payload += cls.__INT.pack(-1 if shardID is None else shardID)
+            payload += cls.__INT.pack(-1 if shardCount is None else shardCount)
+            cls.__encodeString(payload, guildName)
+        elif commandType in (VCommandsType.VOLUME, VCommandsType.DRAINING):
+            payload += cls.__DOUBLE.pack(args)
+        elif commandType in (VCommandsType.SONG_FINISHED, VCommandsType.AUTHENTICATE):
+            cls.__encodeString(payload, args)
+        elif commandType == VCommandsType.HEARTBEAT:
+            voiceChannelID = -1 if args.voiceChannelID is None else args.voiceChannelID
+            songID = -1 if args.songID is None else args.songID
+            position = float('nan') if args.position is None else args.position
+            payload += cls.__HEARTBEAT_VALUES.pack(args.loopLag, args.voiceState, voiceChannelID, songID, position)
+
+        header = cls.__HEADER.pack(cls.VERSION, cls.__COMMANDS_IDS[commandType], len(payload))
+        return header + payload
+
+    @classmethod
+    def decode(cls, data: bytes) -> VCommands:
+        """Return the command of the message, raises ValueError if the message is not valid"""
+        try:
+            return cls.__decode(data)
+        except (StructError, IndexError) as e:
+            # The sizes in the message don't match its data
+            raise ValueError(f'Malformed message: {e}')
+
+    @classmethod
+    def __decode(cls, data: bytes) -> VCommands:
+        version, commandID, size = cls.__HEADER.unpack_from(data)
+        if version != cls.VERSION:
+            raise ValueError(f'Unsupported commands protocol version: {version}')
+        if commandID not in cls.__IDS_COMMANDS.keys():
+            raise ValueError(f'Unknown command id: {commandID}')
+        offset = cls.__HEADER.size
+        if len(data) != offset + size:
+            raise ValueError(f'Expected {size} bytes of args, received {len(data) - offset}')
+
+        commandType = cls.__IDS_COMMANDS[commandID]
+        args = None
+        if commandType in (VCommandsType.PLAY, VCommandsType.PREV):
+            voiceID = None
+            if commandType == VCommandsType.PREV:
+                voiceID, = cls.__INT.unpack_from(data, offset)
+                offset += cls.__INT.size
+            if offset < len(data):
+                args, offset = cls.__decodeSong(data, offset)
+            if commandType == VCommandsType.PREV:
+                args = (voiceID, args)
+        elif commandType == VCommandsType.PLAY_AT:
+            song, offset = cls.__decodeSong(data, offset)
+            position, = cls.__DOUBLE.unpack_from(data, offset)
+            args = (song, position)
+        elif commandType in (VCommandsType.NOW_PLAYING, VCommandsType.SONG_RETURNED):
+            args, = cls.__INT.unpack_from(data, offset)
+        elif commandType == VCommandsType.CONTEXT:
+            guildID, voiceID, shardID, shardCount = (cls.__INT.unpack_from(data, offset + index * cls.__INT.size)[0]
+                                                     for index in range(4))
+            guildName, offset = cls.__decodeString(data, offset + 4 * cls.__INT.size)
+            args = (guildName, guildID, voiceID,
+                    None if shardID == -1 else shardID, None if shardCount == -1 else shardCount)
+        elif commandType in (VCommandsType.VOLUME, VCommandsType.DRAINING):
+            args, = cls.__DOUBLE.unpack_from(data, offset)
+        elif commandType in (VCommandsType.SONG_FINISHED, VCommandsType.AUTHENTICATE):
+            args, offset = cls.__decodeString(data, offset)
+        elif commandType == VCommandsType.HEARTBEAT:
+            loopLag, voiceState, voiceChannelID, songID, position = cls.__HEARTBEAT_VALUES.unpack_from(data, offset)
+            args = PlayerHeartbeat(loopLag, VoiceState(voiceState),
+                                   None if voiceChannelID == -1 else voiceChannelID,
+                                   None if songID == -1 else songID,
+                                   None if isnan(position) else position)
+
+        return VCommands(commandType, args)
+
+    @classmethod
+    def encodeFrame(cls, playerID: int, command: VCommands) -> bytes:
+        message = cls.encode(command)
+        return cls.__FRAME.pack(playerID, len(message)) + message
+
+    @classmethod
+    async def readFrame(cls, reader: StreamReader) -> Tuple[int, VCommands]:
+        """
+        Read the next frame of the stream, raises IncompleteReadError if the stream ends
+        Raises InvalidFrameError if the message of the frame is not valid, and ValueError if the frame is too big,
+        then the stream can't be read anymore
+        """
+        playerID, size = cls.__FRAME.unpack(await reader.readexactly(cls.__FRAME.size))
+        if size > cls.MAX_FRAME_SIZE:
+            raise ValueError(f'Frame of {size} bytes is bigger than the maximum')
+        message = await reader.readexactly(size)
+        try:
+            return playerID, cls.decode(message)
+        except ValueError as e:
+            raise InvalidFrameError(playerID, e)
+
+    @classmethod
+    def signChallenge(cls, challenge: str, secret: str) -> str:
+        """Answer to the challenge of a player node, proves that the bot knows the secret without sending it"""
+        return hmac.new(secret.encode('utf-8'), challenge.encode('utf-8'), sha256).hexdigest()
+
+    @classmethod
+    def __encodeSong(cls, payload: bytearray, song: Song) -> None:
+        (songID, identifier, requester, problematic, downloadTime, source, title, duration, *texts) = song.__getstate__()
+        duration = float('nan') if duration is None else duration
+        payload += cls.__SONG_VALUES.pack(songID, problematic, downloadTime, duration)
+        for text in [identifier, requester, source, title, *texts]:
+            cls.__encodeString(payload, text)
+
+    @classmethod
+    def __decodeSong(cls, data: bytes, offset: int) -> Tuple[Song, int]:
+        songID, problematic, downloadTime, duration = cls.__SONG_VALUES.unpack_from(data, offset)
+        offset += cls.__SONG_VALUES.size
+
+        texts: List[Optional[str]] = []
+        for _ in range(cls.__SONG_TEXTS_QUANT):
+            text, offset = cls.__decodeString(data, offset)
+            texts.append(text)
+        identifier, requester, source, title, *others = texts
+
+        duration = None if isnan(duration) else duration
+        song = Song.__new__(Song)
+        song.__setstate__((songID, identifier, requester, problematic, downloadTime,
+                           source, title, duration, *others))
+        return song, offset
+
+    @classmethod
+    def __encodeString(cls, payload: bytearray, text: Optional[str]) -> None:
+        if text is None:
+            payload += cls.__STRING_SIZE.pack(cls.__NONE_SIZE)
+            return
+        encoded = text.encode('utf-8')
+        payload += cls.__STRING_SIZE.pack(len(encoded))
+        payload += encoded
+
+    @classmethod
+    def __decodeString(cls, data: bytes, offset: int) -> Tuple[Optional[str], int]:
+        size, = cls.__STRING_SIZE.unpack_from(data, offset)
+        offset += cls.__STRING_SIZE.size
+        if size == cls.__NONE_SIZE:
+            return None, offset
+        return bytes(data[offset:offset + size]).decode('utf-8'), offset + size
@@ -0,0 +1,42 @@
+from bisect import bisect
+from hashlib import blake2b
+from typing import Dict, Hashable, List
+
+
+class ConsistentHashRing:
+    """
+    Assign keys to nodes by consistent hashing, each node is placed in several points of the ring to
+    balance the keys. Adding or removing one node only moves the keys of that node
+    """
+
+    def __init__(self, nodes: List[Hashable] = (), virtualNodes: int = 160) -> None:
+        self.__virtualNodes = virtualNodes
+        self.__points: List[int] = []
+        self.__pointsNodes: Dict[int, Hashable] = {}
+        for node in nodes:
+            self.addNode(node)
+
+    def addNode(self, node: Hashable) -> None:
+        for replica in range(self.__virtualNodes):
+            point = self.__hash(f'{node}-{replica}')
+            if point in self.__pointsNodes.keys():
+                continue
+            self.__pointsNodes[point] = node
+            self.__points.insert(bisect(self.__points, point), point)
+
+    def removeNode(self, node: Hashable) -> None:
+        for replica in range(self.__virtualNodes):
+            point = self.__hash(f'{node}-{replica}')
+            if self.__pointsNodes.get(point) == node:
+                del self.__pointsNodes[point]
+                self.__points.remove(point)
+
+    def getNode(self, key: Hashable) -> Hashable:
+        if len(self.__points) == 0:
+            raise LookupError('there is no node in the ring')
+        index = bisect(self.__points, self.__hash(str(key))) % len(self.__points)
+        return self.__pointsNodes[self.__points[index]]
+
+    def __hash(self, value: str) -> int:
+        # The builtin hash of str changes between processes, the ring must be the same in every run
+        return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), 'big')
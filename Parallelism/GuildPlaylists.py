@@ -0,0 +1,38 @@
+from typing import Callable, Dict, Optional
+from Music.Playlist import Playlist
+from Music.PlaylistStore import PlaylistStore
+
+
+class GuildPlaylists:
+    """
+    Playlists of the guilds of a players manager, kept while the guild has a player
+    The Playlist saved before the Bot restarted is restored lazily, in the first time the manager gets the guild
+    Playlist from any path, so a player created, recreated or replaced always receives the restored queue
+    """
+
+    def __init__(self, store: Optional[PlaylistStore], createPlaylist: Callable[[], Playlist] = Playlist) -> None:
+        self.__store = store
+        self.__createPlaylist = createPlaylist
+        self.__playlists: Dict[int, Playlist] = {}
+
+    def get(self, guildID: int) -> Playlist:
+        """Return the Playlist of the guild, creating and restoring it in the first call"""
+        playlist = self.__playlists.get(guildID)
+        if playlist is None:
+            playlist = self.__createPlaylist()
+            self.__restore(guildID, playlist)
+            self.__playlists[guildID] = playlist
+        return playlist
+
+    def remove(self, guildID: int) -> None:
+        """Forget the Playlist of the guild, the next player starts with an empty one"""
+        self.__playlists.pop(guildID, None)
+
+    def __restore(self, guildID: int, playlist: Playlist) -> None:
+        # The store only returns the snapshot of each guild once
+        if self.__store is None:
+            return
+        state = self.__store.loadSnapshot(guildID)
+        if state is not None:
+            songsQuant = playlist.restoreState(state)
+            print(f'[GUILD PLAYLISTS] -> Restored {songsQuant} songs for guild {guildID}')
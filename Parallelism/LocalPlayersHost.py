@@ -0,0 +1,105 @@
+from asyncio import AbstractEventLoop
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from typing import Callable
+from Parallelism.AbstractPlayersHost import AbstractPlayersHost, PlayerHandle
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsProtocol import CommandsProtocol
+from Parallelism.PlayerEventsChannel import PlayerEventsChannel
+from Parallelism.ProcessPlayer import ProcessPlayer
+from Parallelism.StandbyPlayersPool import StandbyPlayersPool
+
+
+class LocalPlayerHandle(PlayerHandle):
+    """Player running in a ProcessPlayer of this machine, reached by pipes"""
+
+    def __init__(self, process: ProcessPlayer, connectionToPlayer: Connection, connectionToMain: Connection, eventsChannel: PlayerEventsChannel) -> None:
+        self.__process = process
+        self.__connectionToPlayer = connectionToPlayer
+        self.__connectionToMain = connectionToMain
+        self.__eventsChannel = eventsChannel
+        self.__callback: Callable[[VCommands], None] = None
+
+    def getName(self) -> str:
+        return self.__process.name
+
+    def start(self) -> None:
+        # The standby processes are already running
+        if self.__process.pid is None:
+            self.__process.start()
+
+    def isAlive(self) -> bool:
+        try:
+            return self.__process.is_alive()
+        except ValueError:
+            # The process was already closed
+            return False
+
+    def send(self, command: VCommands) -> None:
+        self.__connectionToPlayer.send_bytes(CommandsProtocol.encode(command))
+
+    def listen(self, callback: Callable[[VCommands], None]) -> None:
+        self.__callback = callback
+        self.__eventsChannel.register(self, self.__connectionToMain)
+
+    def notify(self, command: VCommands) -> None:
+        """Called by the events channel with each command of the process"""
+        if self.__callback is not None:
+            self.__callback(command)
+
+    def close(self) -> None:
+        self.__callback = None
+        self.__eventsChannel.unregister(self)
+        self.__connectionToPlayer.close()
+
+    def kill(self) -> None:
+        try:
+            # The process may be stuck, so it's killed instead of asked to finish
+            if self.__process.is_alive():
+                self.__process.kill()
+                self.__process.join(timeout=1)
+            self.__process.close()
+        except ValueError:
+            pass
+        except Exception as e:
+            print(f'[WARNINGS] -> {e}')
+
+
+class LocalPlayersHost(AbstractPlayersHost):
+    """
+    Run each player in its own process in this machine, the commands of all processes are received in the loop
+    If the standbyQuant is greater than 0, the new players use the processes kept by a StandbyPlayersPool
+    """
+
+    def __init__(self, loop: AbstractEventLoop, standbyQuant: int = 0) -> None:
+        self.__eventsChannel = PlayerEventsChannel(loop, self.__receiveCommand)
+        self.__standbyPool = StandbyPlayersPool(standbyQuant) if standbyQuant > 0 else None
+
+    def getStandbyPool(self) -> StandbyPlayersPool:
+        """Return the pool of standby processes, None if it's not enabled"""
+        return self.__standbyPool
+
+    def close(self) -> None:
+        if self.__standbyPool is not None:
+            self.__standbyPool.close()
+
+    def createPlayer(self, guildName: str, guildID: int, voiceID: int, shardID: int, shardCount: int) -> LocalPlayerHandle:
+        """Assign the guild to a standby process if there is one available, otherwise create a new process"""
+        standbyPlayer = self.__standbyPool.take() if self.__standbyPool is not None else None
+        if standbyPlayer is None:
+            connectionToReceive, connectionToPlayer = Pipe(duplex=False)
+            connectionToMain, connectionToSend = self.__eventsChannel.createPipe()
+            process = ProcessPlayer(guildName, connectionToReceive, connectionToSend, guildID, voiceID, shardID, shardCount)
+            return LocalPlayerHandle(process, connectionToPlayer, connectionToMain, self.__eventsChannel)
+
+        player = LocalPlayerHandle(standbyPlayer.getProcess(), standbyPlayer.getConnectionToPlayer(),
+                                   standbyPlayer.getConnectionToMain(), self.__eventsChannel)
+        player.send(VCommands(VCommandsType.CONTEXT, (guildName, guildID, voiceID, shardID, shardCount)))
+
+        hits, misses, hitRate = self.__standbyPool.getStats()
+        print(f'[PLAYERS HOST] -> Standby process used for guild {guildID}, '
+              f'hit rate {hitRate:.0%} ({hits} hits, {misses} misses)')
+        return player
+
+    def __receiveCommand(self, player: LocalPlayerHandle, command: VCommands) -> None:
+        player.notify(command)
@@ -0,0 +1,61 @@
+from asyncio import AbstractEventLoop
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from typing import Callable, Dict, Hashable, Tuple
+from Parallelism.Commands import VCommands
+from Parallelism.CommandsProtocol import CommandsProtocol
+
+
+class PlayerEventsChannel:
+    """
+    Receive the commands sent by all player processes directly in the bot loop, without a thread for each player
+    Each player writes in its own pipe, in the CommandsProtocol form, and the reading side of all pipes is watched
+    by the loop, so the callback is called in the loop as soon as a command arrives, with the player key and command
+    """
+
+    def __init__(self, loop: AbstractEventLoop, callback: Callable[[Hashable, VCommands], None]) -> None:
+        self.__loop = loop
+        self.__callback = callback
+        self.__connections: Dict[Hashable, Connection] = {}
+
+    def createPipe(self) -> Tuple[Connection, Connection]:
+        """Return the reading and the writing connections, the writing one must be sent to the player process"""
+        return Pipe(duplex=False)
+
+    def register(self, key: Hashable, connection: Connection) -> None:
+        """Start to receive the commands of the connection, can be called from any thread"""
+        self.__loop.call_soon_threadsafe(self.__addReader, key, connection)
+
+    def unregister(self, key: Hashable) -> None:
+        """Stop to receive the commands of the player and close its connection, can be called from any thread"""
+        self.__loop.call_soon_threadsafe(self.__removeReader, key)
+
+    def __addReader(self, key: Hashable, connection: Connection) -> None:
+        self.__connections[key] = connection
+        self.__loop.add_reader(connection.fileno(), self.__receive, key)
+
+    def __removeReader(self, key: Hashable) -> None:
+        connection = self.__connections.pop(key, None)
+        if connection is None:
+            return
+        self.__loop.remove_reader(connection.fileno())
+        connection.close()
+
+    def __receive(self, key: Hashable) -> None:
+        connection = self.__connections.get(key)
+        if connection is None:
+            return
+
+        try:
+            # The reader is only called when there is data, the loop is not blocked
+            while connection.poll():
+                command: VCommands = CommandsProtocol.decode(connection.recv_bytes())
+                self.__callback(key, command)
+                # The callback may have removed the player
+                if key not in self.__connections:
+                    return
+        except (EOFError, OSError):
+            # The process has finished and closed the pipe
+            self.__removeReader(key)
+        except Exception as e:
+            print(f'[ERROR IN PLAYER EVENTS CHANNEL] -> {e}')
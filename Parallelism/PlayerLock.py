@@ -0,0 +1,114 @@
+import asyncio
+from time import perf_counter
+
+
+class PlayerLock:
+    """
+    Awaitable lock of a guild player, used by the handlers in the bot loop instead of the blocking acquire
+    Wraps the lock shared with the player, a threading, multiprocessing or proxy lock. The coroutines of the
+    bot loop wait in order in an asyncio.Lock, only the first one tries the shared lock, that can be held by
+    other threads or processes, so the loop is never blocked
+    Measures the acquisitions that had to wait, the time waiting and the time holding the lock
+    The shared lock can't be awaited, so it's tried again in intervals while it's held outside the loop. This only
+    happens when the snapshotter or the player thread hold it, for a short time, the handlers of the loop wait in the
+    asyncio.Lock without polling. Waiting the shared lock in an executor thread would block one thread by waiter
+    """
+    # Interval in seconds to try again the shared lock while it's held outside the bot loop
+    RETRY_INTERVAL = 0.02
+
+    def __init__(self, lock) -> None:
+        self.__lock = lock
+        self.__loopLock = asyncio.Lock()
+        # Coroutines inside acquire, the wait_for only takes the free loop lock after the others started to wait
+        self.__entered = 0
+        self.__acquiredAt = 0.0
+        self.__acquisitions = 0
+        self.__contentions = 0
+        self.__timeouts = 0
+        self.__totalWait = 0.0
+        self.__maxWait = 0.0
+        self.__totalHold = 0.0
+        self.__maxHold = 0.0
+
+    def getLock(self):
+        """Return the wrapped lock, to be used outside the bot loop"""
+        return self.__lock
+
+    def locked(self) -> bool:
+        return self.__loopLock.locked()
+
+    async def acquire(self, timeout: float) -> bool:
+        """Wait the lock up to timeout seconds, returns if it was acquired"""
+        start = perf_counter()
+        contended = self.__loopLock.locked() or self.__entered > 0
+        self.__entered += 1
+        try:
+            await asyncio.wait_for(self.__loopLock.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.__timeouts += 1
+            return False
+        finally:
+            self.__entered -= 1
+
+        # The argument is positional because the multiprocessing lock calls it block instead of blocking
+        while not self.__lock.acquire(False):
+            contended = True
+            if perf_counter() - start >= timeout:
+                self.__loopLock.release()
+                self.__timeouts += 1
+                return False
+            await asyncio.sleep(self.RETRY_INTERVAL)
+
+        self.__acquiredAt = perf_counter()
+        wait = self.__acquiredAt - start
+        self.__acquisitions += 1
+        self.__totalWait += wait
+        self.__maxWait = max(self.__maxWait, wait)
+        if contended:
+            self.__contentions += 1
+        return True
+
+    def release(self) -> None:
+        hold = perf_counter() - self.__acquiredAt
+        self.__totalHold += hold
+        self.__maxHold = max(self.__maxHold, hold)
+        self.__lock.release()
+        self.__loopLock.release()
+
+    @property
+    def acquisitions(self) -> int:
+        return self.__acquisitions
+
+    @property
+    def contentions(self) -> int:
+        """Quant of acquisitions that found the lock held"""
+        return self.__contentions
+
+    @property
+    def timeouts(self) -> int:
+        return self.__timeouts
+
+    @property
+    def averageWait(self) -> float:
+        if self.__acquisitions == 0:
+            return 0.0
+        return self.__totalWait / self.__acquisitions
+
+    @property
+    def maxWait(self) -> float:
+        return self.__maxWait
+
+    @property
+    def averageHold(self) -> float:
+        if self.__acquisitions == 0:
+            return 0.0
+        return self.__totalHold / self.__acquisitions
+
+    @property
+    def maxHold(self) -> float:
+        return self.__maxHold
+
+    def __repr__(self) -> str:
+        return (f'PlayerLock({self.__acquisitions} acquisitions, {self.__contentions} contended, '
+                f'{self.__timeouts} timeouts, wait avg {self.averageWait * 1000:.1f}ms max {self.__maxWait * 1000:.1f}ms, '
+                f'hold avg {self.averageHold * 1000:.1f}ms max {self.__maxHold * 1000:.1f}ms)')
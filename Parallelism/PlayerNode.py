@@ -0,0 +1,201 @@
+import hmac
+from asyncio import AbstractEventLoop, IncompleteReadError, StreamReader, StreamWriter, TimeoutError, new_event_loop, set_event_loop, start_server, start_unix_server, wait_for
+from multiprocessing import Process
+from secrets import token_hex
+from signal import SIGTERM
+from time import monotonic
+from typing import Dict
+from Config.Configs import VConfigs
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsProtocol import CommandsProtocol, InvalidFrameError
+from Parallelism.LocalPlayersHost import LocalPlayersHost, LocalPlayerHandle
+
+
+class PlayerNode:
+    """
+    Host the player processes of the bots connected by socket, so the playback runs in other machines than the bot
+    Each bot connection sends the commands of its players in frames with the player id, the first command of a
+    player is the CONTEXT, that creates the player process. The TERMINATE sent by the bot kills the player, and
+    all players of a connection are killed when it drops, the bot recreates them in the nodes still connected
+    With SIGTERM the node drains, the bots hand off its players to other nodes and it exits when it has no players
+    or after the PLAYER_DRAIN_TIMEOUT, so the nodes can be deployed one at a time without stopping all songs
+    Each bot must answer a challenge with the PLAYER_NODE_SECRET before sending commands, and can have at most
+    PLAYER_NODE_MAX_PLAYERS players. The commands are not encrypted, by default the node only listens in localhost
+    Without a secret the node only starts in a unix socket, where the permissions of the file protect it
+    """
+    # Seconds the bot has to answer the authentication challenge
+    AUTHENTICATION_TIMEOUT = 10
+    # Discord limits the name of the guilds to 100 characters
+    MAX_GUILD_NAME_SIZE = 100
+
+    def __init__(self, address: str, secret: str) -> None:
+        self.__address = address
+        self.__secret = secret
+        self.__config = VConfigs()
+        self.__loop: AbstractEventLoop = None
+        self.__playersHost: LocalPlayersHost = None
+        self.__connections: Dict[StreamWriter, Dict[int, LocalPlayerHandle]] = {}
+        # Moment when the draining node exits, None if it's not draining
+        self.__drainDeadline: float = None
+
+    def run(self) -> None:
+        """Serve the bots until the process is finished or drained, raises ValueError if the node is not protected"""
+        if self.__secret == '' and not self.__address.startswith('unix:'):
+            raise ValueError(f'The player node in {self.__address} needs a PLAYER_NODE_SECRET, any peer could create players')
+        self.__loop = new_event_loop()
+        set_event_loop(self.__loop)
+        self.__playersHost = LocalPlayersHost(self.__loop, self.__config.PLAYER_STANDBY_PROCESSES)
+        server = self.__loop.run_until_complete(self.__startServer())
+        self.__loop.add_signal_handler(SIGTERM, self.drain)
+        print(f'[PLAYER NODE] -> Listening in {self.__address}')
+        try:
+            self.__loop.run_forever()
+        finally:
+            server.close()
+            for players in self.__connections.values():
+                for player in players.values():
+                    player.close()
+                    player.kill()
+            self.__playersHost.close()
+            print('[PLAYER NODE] -> Finished')
+
+    def drain(self) -> None:
+        """Ask the bots to move the players to other nodes, the node exits when it has no players or after the timeout"""
+        if self.__drainDeadline is not None:
+            return
+        timeout = self.__config.PLAYER_DRAIN_TIMEOUT
+        self.__drainDeadline = monotonic() + timeout
+        print(f'[PLAYER NODE] -> Draining, exiting in at most {timeout}s')
+        for writer, players in self.__connections.items():
+            self.__sendDraining(writer, players)
+        self.__loop.call_later(timeout, self.__loop.stop)
+        self.__stopIfDrained()
+
+    def __sendDraining(self, writer: StreamWriter, players: Dict[int, LocalPlayerHandle]) -> None:
+        command = VCommands(VCommandsType.DRAINING, max(self.__drainDeadline - monotonic(), 0.0))
+        # The bot stops to create players in this node, and each player is handed off
+        for playerID in [CommandsProtocol.NODE_ID, *players.keys()]:
+            writer.write(CommandsProtocol.encodeFrame(playerID, command))
+
+    def __stopIfDrained(self) -> None:
+        if self.__drainDeadline is None:
+            return
+        if all(len(players) == 0 for players in self.__connections.values()):
+            self.__loop.stop()
+
+    async def __startServer(self):
+        if self.__address.startswith('unix:'):
+            return await start_unix_server(self.__serveBot, self.__address[len('unix:'):])
+        host, port = self.__address.rsplit(':', 1)
+        return await start_server(self.__serveBot, host, int(port))
+
+    async def __serveBot(self, reader: StreamReader, writer: StreamWriter) -> None:
+        peer = writer.get_extra_info('peername')
+        if not await self.__authenticate(reader, writer):
+            print(f'[PLAYER NODE] -> Connection from {peer} failed to authenticate')
+            writer.close()
+            return
+
+        players: Dict[int, LocalPlayerHandle] = {}
+        self.__connections[writer] = players
+        print(f'[PLAYER NODE] -> Bot connected from {peer}')
+        if self.__drainDeadline is not None:
+            self.__sendDraining(writer, players)
+        try:
+            while True:
+                try:
+                    playerID, command = await CommandsProtocol.readFrame(reader)
+                except InvalidFrameError as e:
+                    # Only the invalid command is lost, the players of the bot keep playing
+                    print(f'[PLAYER NODE] -> Ignored frame from {peer}: {e}')
+                    continue
+                self.__executeCommand(players, writer, playerID, command)
+        except (IncompleteReadError, OSError):
+            print('[PLAYER NODE] -> Bot disconnected')
+        except Exception as e:
+            print(f'[ERROR IN PLAYER NODE] -> {e}')
+        finally:
+            del self.__connections[writer]
+            for player in players.values():
+                player.close()
+                player.kill()
+            writer.close()
+            self.__stopIfDrained()
+
+    async def __authenticate(self, reader: StreamReader, writer: StreamWriter) -> bool:
+        """Send a random challenge, the bot must answer with it signed with the secret"""
+        challenge = token_hex(16)
+        expected = CommandsProtocol.signChallenge(challenge, self.__secret)
+        try:
+            writer.write(CommandsProtocol.encodeFrame(CommandsProtocol.NODE_ID, VCommands(VCommandsType.AUTHENTICATE, challenge)))
+            playerID, command = await wait_for(CommandsProtocol.readFrame(reader), self.AUTHENTICATION_TIMEOUT)
+        except (IncompleteReadError, OSError, TimeoutError, ValueError):
+            return False
+        if playerID != CommandsProtocol.NODE_ID or command.getType() != VCommandsType.AUTHENTICATE:
+            return False
+        return isinstance(command.getArgs(), str) and hmac.compare_digest(command.getArgs(), expected)
+
+    def __canCreatePlayer(self, players: Dict[int, LocalPlayerHandle], playerID: int, context: tuple) -> bool:
+        if playerID == CommandsProtocol.NODE_ID or playerID in players.keys():
+            print(f'[PLAYER NODE] -> Refused the player {playerID}, the id is already used')
+            return False
+        if len(players) >= self.__config.PLAYER_NODE_MAX_PLAYERS:
+            print(f'[PLAYER NODE] -> Refused the player {playerID}, the bot reached the maximum of players')
+            return False
+
+        guildName, guildID, voiceID, shardID, shardCount = context
+        validShard = (shardID is None and shardCount is None) or \
+            (shardID is not None and shardCount is not None and 0 <= shardID < shardCount)
+        if guildName is None or len(guildName) > self.MAX_GUILD_NAME_SIZE or guildID <= 0 or voiceID <= 0 or not validShard:
+            print(f'[PLAYER NODE] -> Refused the player {playerID}, invalid context {context}')
+            return False
+        return True
+
+    def __executeCommand(self, players: Dict[int, LocalPlayerHandle], writer: StreamWriter, playerID: int, command: VCommands) -> None:
+        commandType = command.getType()
+        if commandType == VCommandsType.CONTEXT:
+            # The refused player never starts, so the bot recreates it when the heartbeats are missing
+            if not self.__canCreatePlayer(players, playerID, command.getArgs()):
+                return
+            player = self.__playersHost.createPlayer(*command.getArgs())
+            player.listen(lambda event: self.__forwardEvent(players, writer, playerID, event))
+            players[playerID] = player
+            player.start()
+            return
+
+        player = players.get(playerID)
+        if player is None:
+            return
+        if commandType == VCommandsType.TERMINATE:
+            del players[playerID]
+            player.close()
+            player.kill()
+            self.__stopIfDrained()
+        else:
+            player.send(command)
+
+    def __forwardEvent(self, players: Dict[int, LocalPlayerHandle], writer: StreamWriter, playerID: int, event: VCommands) -> None:
+        if not writer.is_closing():
+            writer.write(CommandsProtocol.encodeFrame(playerID, event))
+        # The player process is finishing by itself
+        if event.getType() in (VCommandsType.SLEEPING, VCommandsType.TERMINATE):
+            player = players.pop(playerID, None)
+            if player is not None:
+                player.close()
+                self.__stopIfDrained()
+
+    @classmethod
+    def startLocalNode(cls, address: str, secret: str) -> Process:
+        """Start a node in a process of this machine, used when no node is configured"""
+        process = Process(target=cls.__runNode, args=(address, secret), name='Player Node', daemon=False)
+        process.start()
+        return process
+
+    @classmethod
+    def __runNode(cls, address: str, secret: str) -> None:
+        PlayerNode(address, secret).run()
+
+
+if __name__ == '__main__':
+    config = VConfigs()
+    PlayerNode(config.PLAYER_NODE_ADDRESS, config.PLAYER_NODE_SECRET).run()
@@ -0,0 +1,156 @@
+from asyncio import AbstractEventLoop
+from enum import IntEnum
+from time import monotonic
+from typing import Callable, Dict, Hashable, Optional
+from Config.Configs import VConfigs
+
+
+class VoiceState(IntEnum):
+    DISCONNECTED = 0
+    CONNECTED = 1
+    PLAYING = 2
+    PAUSED = 3
+
+
+class PlayerHeartbeat:
+    """Health of a player, sent periodically to the main process"""
+
+    def __init__(self, loopLag: float, voiceState: VoiceState, voiceChannelID: Optional[int], songID: Optional[int], position: Optional[float]) -> None:
+        self.loopLag = loopLag
+        self.voiceState = voiceState
+        self.voiceChannelID = voiceChannelID
+        # The song of the position, None if there is no song playing or paused
+        self.songID = songID
+        self.position = position
+
+    def __repr__(self) -> str:
+        return (f'PlayerHeartbeat(lag {self.loopLag * 1000:.0f}ms, {self.voiceState.name}, '
+                f'channel {self.voiceChannelID}, song {self.songID} at {self.position})')
+
+
+class PlayerHealth:
+    """Store the last heartbeat of a player and the quant of consecutive unhealthy heartbeats"""
+
+    def __init__(self, group: Hashable) -> None:
+        self.lastBeatAt = monotonic()
+        self.lastHeartbeat: PlayerHeartbeat = None
+        self.unhealthyBeats = 0
+        # The restarts of the players of the same group, like the players of a guild, are delayed together
+        self.group = group
+        # Last time the player was playing or not expecting a song, the start grace is counted from it
+        self.activeAt = self.lastBeatAt
+
+
+class PlayerSupervisor:
+    """
+    Watch the heartbeats of the players and restart the unhealthy ones before the users notice
+    A player is unhealthy if it stops sending heartbeats, or if during consecutive heartbeats its loop is
+    delayed, the song it should play is not playing or the position of the song playing doesn't advance
+    The checks are executed in the bot loop, the restart callback receives the player key and the reason
+    A player has the PLAYER_START_GRACE to start playing a song, the new players must login, connect and resolve
+    the song. The restarts of a group restarted recently are delayed, so a guild that can't play is not restarted
+    in a loop
+    """
+    # Consecutive unhealthy heartbeats after which the player is restarted
+    UNHEALTHY_BEATS_LIMIT = 3
+
+    def __init__(self, loop: AbstractEventLoop, restartCallback: Callable[[Hashable, str], None]) -> None:
+        config = VConfigs()
+        self.__loop = loop
+        self.__restartCallback = restartCallback
+        self.__interval = config.PLAYER_HEARTBEAT_INTERVAL
+        self.__timeout = config.PLAYER_HEARTBEAT_TIMEOUT
+        self.__maxLoopLag = config.PLAYER_MAX_LOOP_LAG
+        self.__startGrace = config.PLAYER_START_GRACE
+        self.__restartBackoff = config.PLAYER_RESTART_BACKOFF
+        self.__restartMaxBackoff = config.PLAYER_RESTART_MAX_BACKOFF
+        self.__players: Dict[Hashable, PlayerHealth] = {}
+        self.__restarts: Dict[str, int] = {}
+        # Consecutive restarts of each group, forgotten when a player of the group plays
+        self.__groupsRestarts: Dict[Hashable, int] = {}
+        self.__loop.call_soon_threadsafe(self.__scheduleCheck)
+
+    def watch(self, key: Hashable, group: Hashable = None) -> None:
+        """Start to watch the player, the heartbeat timeout and the start grace are counted from now"""
+        self.__players[key] = PlayerHealth(key if group is None else group)
+
+    def unwatch(self, key: Hashable) -> None:
+        self.__players.pop(key, None)
+
+    def beat(self, key: Hashable, heartbeat: PlayerHeartbeat, expectingSong: bool) -> None:
+        """Register the heartbeat of the player, expectingSong must be True if a song was sent to be played"""
+        health = self.__players.get(key)
+        if health is None:
+            return
+
+        reason = self.__findProblem(health, heartbeat, expectingSong)
+        health.lastBeatAt = monotonic()
+        health.lastHeartbeat = heartbeat
+        if not expectingSong or heartbeat.voiceState in (VoiceState.PLAYING, VoiceState.PAUSED):
+            health.activeAt = health.lastBeatAt
+        if reason is None:
+            health.unhealthyBeats = 0
+            if heartbeat.voiceState == VoiceState.PLAYING:
+                self.__groupsRestarts.pop(health.group, None)
+            return
+
+        health.unhealthyBeats += 1
+        if health.unhealthyBeats >= self.UNHEALTHY_BEATS_LIMIT:
+            self.__restart(key, reason)
+
+    def fail(self, key: Hashable, reason: str) -> None:
+        """Restart now a watched player that is known to be lost, without waiting the heartbeats timeout"""
+        if key in self.__players.keys():
+            self.__restart(key, reason)
+
+    def getRestarts(self) -> Dict[str, int]:
+        """Return the quant of restarts by reason"""
+        return dict(self.__restarts)
+
+    def getHealth(self, key: Hashable) -> Optional[PlayerHealth]:
+        return self.__players.get(key)
+
+    def __findProblem(self, health: PlayerHealth, heartbeat: PlayerHeartbeat, expectingSong: bool) -> Optional[str]:
+        previous = health.lastHeartbeat
+        if heartbeat.loopLag > self.__maxLoopLag:
+            return 'loop lag'
+        if (expectingSong and heartbeat.voiceState in (VoiceState.DISCONNECTED, VoiceState.CONNECTED)
+                and monotonic() - health.activeAt > self.__startGrace):
+            return 'song not playing'
+        if (heartbeat.voiceState == VoiceState.PLAYING and previous is not None
+                and previous.voiceState == VoiceState.PLAYING and previous.position == heartbeat.position):
+            return 'song stalled'
+        return None
+
+    def __scheduleCheck(self) -> None:
+        self.__loop.call_later(self.__interval, self.__check)
+
+    def __check(self) -> None:
+        try:
+            now = monotonic()
+            for key, health in list(self.__players.items()):
+                if now - health.lastBeatAt > self.__timeout:
+                    self.__restart(key, 'no heartbeat')
+        except Exception as e:
+            print(f'[ERROR IN PLAYER SUPERVISOR] -> {e}')
+        finally:
+            self.__scheduleCheck()
+
+    def __restart(self, key: Hashable, reason: str) -> None:
+        health = self.__players.pop(key)
+        self.__restarts[reason] = self.__restarts.get(reason, 0) + 1
+
+        groupRestarts = self.__groupsRestarts.get(health.group, 0)
+        self.__groupsRestarts[health.group] = groupRestarts + 1
+        if groupRestarts == 0:
+            return self.__callRestart(key, reason)
+
+        delay = min(self.__restartBackoff * 2 ** (groupRestarts - 1), self.__restartMaxBackoff)
+        print(f'[PLAYER SUPERVISOR] -> Restart {groupRestarts + 1} of {health.group} delayed by {delay:.0f}s: {reason}')
+        self.__loop.call_later(delay, self.__callRestart, key, reason)
+
+    def __callRestart(self, key: Hashable, reason: str) -> None:
+        try:
+            self.__restartCallback(key, reason)
+        except Exception as e:
+            print(f'[ERROR RESTARTING PLAYER] -> {reason} - {e}')
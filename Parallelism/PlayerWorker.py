@@ -0,0 +1,109 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from multiprocessing import Process, Queue
+from threading import Thread
+from typing import Dict, Tuple
+from discord import Guild, VoiceChannel
+from Music.Playlist import Playlist
+from Music.Song import Song
+from Music.VulkanBot import VulkanBot
+from Music.VulkanPlayerInitializer import VulkanPlayerInitializer
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.ThreadPlayer import ThreadPlayer
+
+
+class PlayerWorker(Process):
+    """
+    Process that hosts the players of many guilds with only one bot instance and one event loop
+    Receives from the main process tuples of (guildID, VCommands) and sends back the commands of the players in
+    the same format. The CONTEXT command creates the player of the guild, with the args
+    (guildName, playlist, lock, voiceID), the playlist and lock must be proxies of the manager
+    """
+
+    def __init__(self, name: str, queueToReceive: Queue, queueToSend: Queue) -> None:
+        Process.__init__(self, name=name, group=None, target=None, args=(), kwargs={})
+        self.__queueReceive: Queue = queueToReceive
+        self.__queueSend: Queue = queueToSend
+        self.__loop: AbstractEventLoop = None
+        self.__bot: VulkanBot = None
+        self.__players: Dict[int, ThreadPlayer] = {}
+        # The commands of each guild are executed in order, without waiting the commands of other guilds
+        self.__guildsCommands: Dict[int, asyncio.Queue] = {}
+
+    def run(self) -> None:
+        """Method called by process.start(), this will exec the actually _run method in a event loop"""
+        try:
+            print(f'Starting Player Worker {self.name}')
+            self.__loop = asyncio.get_event_loop_policy().new_event_loop()
+            asyncio.set_event_loop(self.__loop)
+            self.__loop.run_until_complete(self._run())
+        except Exception as e:
+            print(f'[ERROR IN PLAYER WORKER {self.name}] -> {e}')
+
+    async def _run(self) -> None:
+        initializer = VulkanPlayerInitializer()
+        self.__bot = initializer.getBot()
+        await self.__bot.startBotCoro(self.__loop)
+        await self.__bot.wait_until_ready()
+
+        # Thread that will receive the commands of all guilds of this worker
+        Thread(target=self.__commandsReceiver, daemon=True).start()
+        # The worker lives while the main process is running
+        await self.__loop.create_future()
+
+    def __commandsReceiver(self) -> None:
+        while True:
+            guildID, command = self.__queueReceive.get()
+            self.__loop.call_soon_threadsafe(self.__enqueueCommand, guildID, command)
+
+    def __enqueueCommand(self, guildID: int, command: VCommands) -> None:
+        if guildID not in self.__guildsCommands.keys():
+            self.__guildsCommands[guildID] = asyncio.Queue()
+            self.__loop.create_task(self.__guildCommandsConsumer(guildID), name=f'Guild {guildID} Commands')
+        self.__guildsCommands[guildID].put_nowait(command)
+
+    async def __guildCommandsConsumer(self, guildID: int) -> None:
+        queue = self.__guildsCommands[guildID]
+        while True:
+            command = await queue.get()
+            await self.__executeCommand(guildID, command)
+
+    async def __executeCommand(self, guildID: int, command: VCommands) -> None:
+        try:
+            if command.getType() == VCommandsType.CONTEXT:
+                await self.__createPlayer(guildID, *command.getArgs())
+                return
+
+            player = self.__players.get(guildID)
+            if player is None:
+                print(f'[PLAYER WORKER {self.name}] -> No player for guild {guildID}, command {command.getType()}')
+                return
+            await player.receiveCommand(command)
+        except Exception as e:
+            print(f'[PLAYER WORKER {self.name} -> ERROR EXECUTING COMMAND] -> {guildID} - {e}')
+
+    async def __createPlayer(self, guildID: int, guildName: str, playlist: Playlist, lock, voiceID: int) -> None:
+        """Create the player of the guild, if the guild already has a player it's kept"""
+        if guildID in self.__players.keys():
+            return
+
+        guild, voiceChannel = await self.__getGuildAndChannel(guildID, voiceID)
+        player = ThreadPlayer(self.__bot, guild, guildName, voiceChannel, playlist, lock, guildID, voiceID,
+                              self.__receivePlayerCommand, self.__deletePlayer)
+        self.__players[guildID] = player
+
+    async def __getGuildAndChannel(self, guildID: int, voiceID: int) -> Tuple[Guild, VoiceChannel]:
+        """Wait until the guild is in the cache of this bot instance"""
+        guild = self.__bot.get_guild(guildID)
+        while guild is None:
+            await asyncio.sleep(0.2)
+            guild = self.__bot.get_guild(guildID)
+        return guild, guild.get_channel(voiceID)
+
+    async def __receivePlayerCommand(self, command: VCommands, guild: Guild, song: Song) -> None:
+        self.__queueSend.put((guild.id, command))
+
+    def __deletePlayer(self, guild: Guild) -> None:
+        """Called by the player when it has nothing more to play"""
+        self.__players.pop(guild.id, None)
+        self.__queueSend.put((guild.id, VCommands(VCommandsType.SLEEPING)))
@@ -0,0 +1,242 @@
+import asyncio
+from multiprocessing import Queue
+from multiprocessing.managers import AcquirerProxy
+from threading import Lock, Thread
+from typing import Dict, List, Tuple, Union
+from Config.Configs import VConfigs
+from Config.Singleton import Singleton
+from discord import Guild, Interaction, TextChannel
+from discord.ext.commands import Context
+from Music.Playlist import Playlist
+from Music.PlaylistStore import PlaylistStore
+from Music.Song import Song
+from Music.VulkanBot import VulkanBot
+from Parallelism.AbstractProcessManager import AbstractPlayersManager
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.ConsistentHashRing import ConsistentHashRing
+from Parallelism.PlayerLock import PlayerLock
+from Parallelism.PlayerWorker import PlayerWorker
+from Parallelism.PlaylistSnapshotter import PlaylistSnapshotter
+from Parallelism.GuildPlaylists import GuildPlaylists
+from Parallelism.PlaylistWatcher import PlaylistWatcher
+from Parallelism.ProcessExecutor import ProcessCommandsExecutor
+from Parallelism.ProcessPlayerManager import ProcessStatus, VManager
+
+
+class WorkerInfo:
+    """Store the process and the queues of one player worker"""
+
+    def __init__(self, worker: PlayerWorker, queueToWorker: Queue, queueToMain: Queue) -> None:
+        self.__worker = worker
+        self.__queueToWorker = queueToWorker
+        self.__queueToMain = queueToMain
+
+    def getWorker(self) -> PlayerWorker:
+        return self.__worker
+
+    def getQueueToWorker(self) -> Queue:
+        return self.__queueToWorker
+
+    def getQueueToMain(self) -> Queue:
+        return self.__queueToMain
+
+
+class GuildPlayerInfo:
+    """Store the structures of the player of one guild hosted in a worker"""
+
+    def __init__(self, workerIndex: int, playlist: Playlist, lock: AcquirerProxy, textChannel: TextChannel) -> None:
+        self.__workerIndex = workerIndex
+        self.__playlist = playlist
+        self.__lock = lock
+        self.__playerLock = PlayerLock(lock)
+        self.__textChannel = textChannel
+        self.__status = ProcessStatus.RUNNING
+
+    def getWorkerIndex(self) -> int:
+        return self.__workerIndex
+
+    def getPlaylist(self) -> Playlist:
+        return self.__playlist
+
+    def getLock(self) -> AcquirerProxy:
+        return self.__lock
+
+    def getPlayerLock(self) -> PlayerLock:
+        return self.__playerLock
+
+    def getTextChannel(self) -> TextChannel:
+        return self.__textChannel
+
+    def setTextChannel(self, textChannel: TextChannel) -> None:
+        self.__textChannel = textChannel
+
+    def getStatus(self) -> ProcessStatus:
+        return self.__status
+
+    def setStatus(self, status: ProcessStatus) -> None:
+        self.__status = status
+
+
+class PlayerWorkersManager(Singleton, AbstractPlayersManager):
+    """
+    Manage a fixed pool of player worker processes, each one hosting the players of many guilds
+    The guilds are assigned to the workers by consistent hashing of the guild id, so a guild is always
+    played by the same worker while the quant of workers doesn't change
+    The workers are not supervised, so a stuck worker is only recreated when it dies, and the song playing is not
+    resumed. The configs reject the workers with the player nodes and the sharding, that they don't support
+    """
+
+    def __init__(self, bot: VulkanBot = None) -> None:
+        if not super().created:
+            self.__bot = bot
+            self.__config = VConfigs()
+            workersQuant = self.__config.PLAYER_WORKERS_QUANT
+            self.__ring = ConsistentHashRing(range(workersQuant))
+            self.__workers: List[WorkerInfo] = [None] * workersQuant
+            self.__workersLock = Lock()
+            self.__guildsPlayers: Dict[int, GuildPlayerInfo] = {}
+            self.__commandsExecutors: Dict[int, ProcessCommandsExecutor] = {}
+            self.__playlistWatcher = PlaylistWatcher()
+
+            # Only the bot listening to the commands manages the players
+            if bot is not None and bot.listingSlash:
+                VManager.register('Playlist', Playlist)
+                VManager.register('Lock', Lock, AcquirerProxy)
+                self.__manager = VManager()
+                self.__manager.start()
+                self.__guildPlaylists = GuildPlaylists(PlaylistStore(), self.__manager.Playlist)
+                PlaylistSnapshotter(self).start()
+            else:
+                self.__manager = None
+                self.__guildPlaylists = None
+
+    async def sendCommandToPlayer(self, command: VCommands, guild: Guild, context: Union[Context, Interaction], forceCreation: bool = False):
+        if forceCreation:
+            playerInfo = self.createPlayerForGuild(guild, context)
+        else:
+            playerInfo = self.__guildsPlayers.get(guild.id)
+        if playerInfo is None:
+            return
+
+        # If the worker of the guild died it's started again and the player must be recreated
+        self.__getWorker(playerInfo.getWorkerIndex())
+        if playerInfo.getStatus() == ProcessStatus.SLEEPING:
+            self.resetPlayer(guild, context)
+
+        self.__putCommand(playerInfo.getWorkerIndex(), guild.id, command)
+
+    def getPlayerPlaylist(self, guild: Guild) -> Playlist:
+        playerInfo = self.__guildsPlayers.get(guild.id)
+        if playerInfo:
+            return playerInfo.getPlaylist()
+
+    def getPlayerLock(self, guild: Guild) -> PlayerLock:
+        playerInfo = self.__guildsPlayers.get(guild.id)
+        if playerInfo:
+            return playerInfo.getPlayerLock()
+
+    def getPlayersPlaylists(self) -> Dict[int, Tuple[Playlist, AcquirerProxy]]:
+        return {guildID: (info.getPlaylist(), info.getLock()) for guildID, info in list(self.__guildsPlayers.items())}
+
+    def verifyIfPlayerExists(self, guild: Guild) -> bool:
+        return guild.id in self.__guildsPlayers.keys()
+
+    def createPlayerForGuild(self, guild: Guild, context: Union[Context, Interaction]) -> GuildPlayerInfo:
+        try:
+            if guild.id not in self.__guildsPlayers.keys():
+                playlist: Playlist = self.__guildPlaylists.get(guild.id)
+
+                workerIndex = self.__ring.getNode(guild.id)
+                playerInfo = GuildPlayerInfo(workerIndex, playlist, self.__manager.Lock(), context.channel)
+                self.__guildsPlayers[guild.id] = playerInfo
+                self.__commandsExecutors[guild.id] = ProcessCommandsExecutor(self.__bot, guild.id)
+                self.__sendContext(guild, context, playerInfo)
+
+            return self.__guildsPlayers[guild.id]
+        except Exception as e:
+            print(f'[Error In GetPlayerContext] -> {e}')
+
+    def resetPlayer(self, guild: Guild, context: Context) -> None:
+        """Create the player again in the worker if it was sleeping, otherwise ask the player to reconnect"""
+        playerInfo = self.__guildsPlayers.get(guild.id)
+        if playerInfo is None:
+            return None
+
+        playerInfo.setTextChannel(context.channel)
+        if playerInfo.getStatus() == ProcessStatus.SLEEPING:
+            playerInfo.setStatus(ProcessStatus.RUNNING)
+            self.__sendContext(guild, context, playerInfo)
+        else:
+            self.__putCommand(playerInfo.getWorkerIndex(), guild.id, VCommands(VCommandsType.RESET))
+        self.__putCommand(playerInfo.getWorkerIndex(), guild.id, VCommands(VCommandsType.PLAY))
+
+    async def waitPlaylistChange(self, guild: Guild, timeout: float) -> bool:
+        return await self.__playlistWatcher.wait(guild.id, timeout)
+
+    async def showNowPlaying(self, guildID: int, song: Song) -> None:
+        self.__playlistWatcher.notify(guildID)
+        commandExecutor = self.__commandsExecutors[guildID]
+        playerInfo = self.__guildsPlayers[guildID]
+        await commandExecutor.sendNowPlaying(playerInfo.getPlaylist(), playerInfo.getTextChannel(), song)
+
+    def __sendContext(self, guild: Guild, context: Union[Context, Interaction], playerInfo: GuildPlayerInfo) -> None:
+        if isinstance(context, Interaction):
+            voiceID: int = context.user.voice.channel.id
+        else:
+            voiceID: int = context.author.voice.channel.id
+
+        args = (guild.name, playerInfo.getPlaylist(), playerInfo.getLock(), voiceID)
+        self.__putCommand(playerInfo.getWorkerIndex(), guild.id, VCommands(VCommandsType.CONTEXT, args))
+
+    def __putCommand(self, workerIndex: int, guildID: int, command: VCommands) -> None:
+        try:
+            workerInfo = self.__getWorker(workerIndex)
+            workerInfo.getQueueToWorker().put((guildID, command))
+        except Exception as e:
+            print(f'[ERROR PUTTING COMMAND IN WORKER QUEUE] -> {e}')
+
+    def __getWorker(self, workerIndex: int) -> WorkerInfo:
+        """Return the worker, starting it in the first use or if the process has died"""
+        with self.__workersLock:
+            workerInfo = self.__workers[workerIndex]
+            if workerInfo is None or not workerInfo.getWorker().is_alive():
+                if workerInfo is not None:
+                    self.__workerDied(workerIndex)
+                workerInfo = self.__createWorker(workerIndex)
+                self.__workers[workerIndex] = workerInfo
+            return workerInfo
+
+    def __createWorker(self, workerIndex: int) -> WorkerInfo:
+        queueToWorker = Queue()
+        queueToMain = Queue()
+        worker = PlayerWorker(f'Worker {workerIndex}', queueToWorker, queueToMain)
+        worker.start()
+
+        # One thread listen the commands of all guilds of the worker
+        Thread(target=self.__listenToWorker, args=(workerIndex, queueToMain), daemon=True).start()
+        return WorkerInfo(worker, queueToWorker, queueToMain)
+
+    def __workerDied(self, workerIndex: int) -> None:
+        """The players of the worker were lost, they will be created again in the next command"""
+        for playerInfo in self.__guildsPlayers.values():
+            if playerInfo.getWorkerIndex() == workerIndex:
+                playerInfo.setStatus(ProcessStatus.SLEEPING)
+
+    def __listenToWorker(self, workerIndex: int, queue: Queue) -> None:
+        while True:
+            try:
+                guildID, command = queue.get()
+                commandType = command.getType()
+
+                if commandType == VCommandsType.NOW_PLAYING:
+                    asyncio.run_coroutine_threadsafe(self.showNowPlaying(guildID, command.getArgs()), self.__bot.loop)
+                elif commandType == VCommandsType.SLEEPING:
+                    if guildID in self.__guildsPlayers.keys():
+                        self.__guildsPlayers[guildID].setStatus(ProcessStatus.SLEEPING)
+                    self.__playlistWatcher.notify(guildID)
+                else:
+                    print(f'[ERROR] -> Unknown Command Received from Worker {workerIndex}: {commandType}')
+            except (EOFError, OSError):
+                return
+            except Exception as e:
+                print(f'[ERROR IN LISTENING WORKER] -> {workerIndex} - {e}')
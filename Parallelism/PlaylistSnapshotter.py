@@ -0,0 +1,78 @@
+from threading import Thread
+from time import sleep
+from typing import Dict, Optional
+from Config.Configs import VConfigs
+from Music.PlaylistStore import PlaylistStore
+from Parallelism.AbstractProcessManager import AbstractPlayersManager
+
+
+class PlaylistSnapshotter(Thread):
+    """
+    Thread that periodically saves the Playlists of all players in the PlaylistStore
+    Only the Playlists with a version different from the last saved one are read, and only their changes since
+    that version are written, the songs not added are not read. The stored changes are compacted by the store
+    without the guild lock. The whole Playlist is exported only in the first save of the player, and when the
+    changes are not stored anymore or can't be replayed, like after a shuffle
+    """
+
+    def __init__(self, playersManager: AbstractPlayersManager) -> None:
+        super().__init__(name='Playlist Snapshotter', daemon=True)
+        self.__config = VConfigs()
+        self.__playersManager = playersManager
+        self.__store = PlaylistStore()
+        self.__savedVersions: Dict[int, int] = {}
+
+    def run(self) -> None:
+        while True:
+            sleep(self.__config.PLAYLISTS_SNAPSHOT_INTERVAL)
+            try:
+                self.snapshot()
+            except Exception as e:
+                print(f'[ERROR IN PLAYLIST SNAPSHOTTER] -> {e}')
+
+    def snapshot(self) -> None:
+        states: Dict[int, Optional[dict]] = {}
+        guildsChanges: Dict[int, dict] = {}
+        playlists = self.__playersManager.getPlayersPlaylists()
+
+        for guildID, (playlist, lock) in playlists.items():
+            version = playlist.getVersion()
+            savedVersion = self.__savedVersions.get(guildID)
+            if savedVersion == version:
+                continue
+
+            acquired = lock.acquire(timeout=self.__config.ACQUIRE_LOCK_TIMEOUT)
+            if not acquired:
+                continue
+            try:
+                # A saved version after the current one is from a Playlist that was replaced
+                changes = None
+                if savedVersion is not None and savedVersion < version:
+                    changes = playlist.exportChangesSince(savedVersion)
+                if changes is not None:
+                    guildsChanges[guildID] = changes
+                else:
+                    states[guildID] = playlist.exportState()
+            finally:
+                lock.release()
+
+        for guildID, changes in guildsChanges.items():
+            changesQuant = self.__store.saveChanges(guildID, changes)
+            self.__savedVersions[guildID] = changes['version']
+            if changesQuant >= self.__config.PLAYLISTS_CHANGES_TO_COMPACT:
+                self.__store.compactSnapshot(guildID)
+
+        # The players that don't exist anymore lost their playlists
+        for guildID in list(self.__savedVersions.keys()):
+            if guildID not in playlists.keys():
+                states[guildID] = None
+
+        if len(states) == 0:
+            return
+
+        self.__store.saveSnapshots(states)
+        for guildID, state in states.items():
+            if state is None:
+                self.__savedVersions.pop(guildID, None)
+            else:
+                self.__savedVersions[guildID] = state['version']
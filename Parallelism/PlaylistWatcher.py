@@ -0,0 +1,37 @@
+import asyncio
+from typing import Dict, List
+
+
+class PlaylistWatcher:
+    """
+    Allow coroutines of the main process to wait for the Player of a guild to change the current song,
+    the Players Manager notify the watcher when receives the NOW_PLAYING or when the Player stops
+    """
+
+    def __init__(self) -> None:
+        self.__waiters: Dict[int, List[asyncio.Future]] = {}
+
+    async def wait(self, guildID: int, timeout: float) -> bool:
+        """Return True if the guild was notified before the timeout"""
+        future = asyncio.get_running_loop().create_future()
+        self.__waiters.setdefault(guildID, []).append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters = self.__waiters.get(guildID, [])
+            if future in waiters:
+                waiters.remove(future)
+            if len(waiters) == 0:
+                self.__waiters.pop(guildID, None)
+
+    def notify(self, guildID: int) -> None:
+        """Wake all the coroutines waiting for the guild, can be called from any thread"""
+        for future in list(self.__waiters.get(guildID, [])):
+            future.get_loop().call_soon_threadsafe(self.__setResult, future)
+
+    def __setResult(self, future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(True)
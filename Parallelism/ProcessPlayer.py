@@ -1,19 +1,25 @@
 import asyncio
-from time import sleep, time
+from time import perf_counter, time
 from urllib.parse import parse_qs, urlparse
-from Music.VulkanInitializer import VulkanInitializer
+from Music.VulkanPlayerInitializer import VulkanPlayerInitializer
 from discord import PCMVolumeTransformer, VoiceClient
-from asyncio import AbstractEventLoop, Semaphore, Queue
-from multiprocessing import Process, RLock, Lock, Queue
-from threading import Thread
-from typing import Callable
-from discord import Guild, FFmpegPCMAudio, VoiceChannel
-from Music.Playlist import Playlist
+from asyncio import AbstractEventLoop, Event, Semaphore
+from multiprocessing import Process, RLock
+from multiprocessing.connection import Connection
+from threading import Lock
+from typing import Callable, Optional
+from discord import Guild, VoiceChannel
 from Music.Song import Song
+from Music.PositionTrackedSource import PositionTrackedSource
+from Music.SongAudioSource import SongAudioSource
 from Config.Configs import VConfigs
+from Config.Exceptions import DownloadingError
 from Music.VulkanBot import VulkanBot
 from Music.Downloader import Downloader
 from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsIntake import CommandsIntake
+from Parallelism.CommandsProtocol import CommandsProtocol
+from Parallelism.PlayerSupervisor import PlayerHeartbeat, VoiceState
 
 
 class TimeoutClock:
@@ -30,58 +36,105 @@ class TimeoutClock:
 
 
 class ProcessPlayer(Process):
-    """Process that will play songs, receive commands from the main process by a Queue"""
-
-    def __init__(self, name: str, playlist: Playlist, lock: Lock, queueToReceive: Queue,  queueToSend: Queue, guildID: int, voiceID: int) -> None:
+    """
+    Process that will play songs, receive commands from the main process by a pipe, in the CommandsProtocol form
+    The Playlist is kept in the main process, that sends in the PLAY command the song to play now, or None when
+    there is nothing more to play. When a song ends the process sends back a SONG_FINISHED command
+    A standby process is started without a guild, it logs in Discord and waits in the queue the CONTEXT command
+    with the args (guildName, guildID, voiceID, shardID, shardCount). With a sharded Bot the standby process only
+    logs in after receiving the guild, it must connect as the shard of the guild
+    After knowing the guild the process sends periodically a HEARTBEAT command, watched by the PlayerSupervisor
+    The PLAY_AT command plays the song from a position, used when a new process continues the song of another
+    """
+    # Seconds before the song duration from which an end is considered normal, earlier ends are resumed
+    PREMATURE_END_TOLERANCE = 5
+    # Times the same song can be resumed, to not keep trying a song that always fails in the same point
+    MAX_RESUME_ATTEMPTS = 3
+
+    def __init__(self, name: str, connectionToReceive: Connection, connectionToSend: Connection, guildID: int, voiceID: int, shardID: int = None, shardCount: int = None) -> None:
         """
         Start a new process that will have his own bot instance 
         Due to pickle serialization, no objects are stored, the values initialization are being made in the run method
         """
         Process.__init__(self, name=name, group=None, target=None, args=(), kwargs={})
         # Synchronization objects
-        self.__playlist: Playlist = playlist
-        self.__playlistLock: Lock = lock
-        self.__queueReceive: Queue = queueToReceive
-        self.__queueSend: Queue = queueToSend
+        self.__connectionReceive: Connection = connectionToReceive
+        self.__connectionSend: Connection = connectionToSend
+        self.__sendLock: Lock = None
         self.__semStopPlaying: Semaphore = None
         self.__loop: AbstractEventLoop = None
         # Discord context ID
         self.__guildID = guildID
         self.__voiceChannelID = voiceID
+        # Gateway shard of the guild, None if the Bot is not sharded
+        self.__shardID = shardID
+        self.__shardCount = shardCount
         # All information of discord context will be retrieved directly with discord API
         self.__guild: Guild = None
         self.__bot: VulkanBot = None
         self.__voiceChannel: VoiceChannel = None
         self.__voiceClient: VoiceClient = None
+        self.__songPlaying: Song = None
+        self.__songSource: PositionTrackedSource = None
+        # Times that the current song was resumed after ending before its duration
+        self.__resumeAttempts = 0
 
         self.__songVolumeUsing = 1
         self.__currentSongChangeVolume = False
 
         self.__playing = False
         self.__forceStop = False
-        self.__botCompletedLoad = False
+        self.__botCompletedLoad: Event = None
+        self.__guildAssigned: Event = None
+        self.__commandsIntake: CommandsIntake = None
+        self.__heartbeatTask: asyncio.Task = None
         self.FFMPEG_OPTIONS = {'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
                                'options': '-vn'}
 
+    @classmethod
+    def standby(cls, name: str, connectionToReceive: Connection, connectionToSend: Connection) -> 'ProcessPlayer':
+        """Create a process that will only know the guild to play when receiving the CONTEXT command"""
+        return cls(name, connectionToReceive, connectionToSend, None, None)
+
     def run(self) -> None:
         """Method called by process.start(), this will exec the actually _run method in a event loop"""
         try:
             print(f'Starting Player Process for Guild {self.name}')
             self.__playerLock = RLock()
+            self.__sendLock = Lock()
             self.__loop = asyncio.get_event_loop_policy().new_event_loop()
             asyncio.set_event_loop(self.__loop)
 
             self.__downloader = Downloader()
 
             self.__semStopPlaying = Semaphore(0)
+            self.__botCompletedLoad = Event()
+            self.__guildAssigned = Event()
             self.__loop.run_until_complete(self._run())
         except Exception as e:
             print(f'[ERROR IN PROCESS {self.name}] -> {e}')
 
     async def _run(self) -> None:
-        # Recreate the bot instance and objects using discord API
-        self.__bot = await self.__createBotInstance()
-        self.__botCompletedLoad = True
+        isStandby = self.__guildID is None
+        if not isStandby:
+            self.__startHeartbeats()
+        # The commands are received and executed in this loop, in the order they were sent
+        self.__commandsIntake = CommandsIntake(self.__loop, self.__connectionReceive, self.__executeCommand)
+        self.__commandsIntake.start()
+        # Recreate the bot instance and objects using discord API, a sharded standby must know the guild first
+        if not isStandby or not VConfigs().isSharded():
+            self.__bot = await self.__createBotInstance()
+        # A standby process must wait the guild to play in the CONTEXT command
+        if isStandby:
+            await self.__guildAssigned.wait()
+        else:
+            self.__guildAssigned.set()
+
+        if self.__bot is None:
+            self.__bot = await self.__createBotInstance()
+        elif isStandby:
+            await self.__ensureDiscordConnection(self.__bot)
+
         self.__guild = self.__bot.get_guild(self.__guildID)
         self.__voiceChannel = self.__bot.get_channel(self.__voiceChannelID)
         # Connect to voice Channel
@@ -89,17 +142,16 @@ class ProcessPlayer(Process):
 
         # Start the timeout function
         self.__timer = TimeoutClock(self.__timeoutHandler, self.__loop)
-        # Thread that will receive commands to be executed in this Process
-        self.__commandsReceiver = Thread(target=self.__commandsReceiver, daemon=True)
-        self.__commandsReceiver.start()
+        # The commands received while loading can be executed now
+        self.__botCompletedLoad.set()
 
-        # Start a Task to play songs
-        self.__loop.create_task(self.__playPlaylistSongs())
         # Try to acquire a semaphore, it'll be release when timeout function trigger, we use the Semaphore
         # from the asyncio lib to not block the event loop
         await self.__semStopPlaying.acquire()
         # In this point the process should finalize
         self.__timer.cancel()
+        self.__commandsIntake.stop()
+        self.__heartbeatTask.cancel()
 
     def __set_volume(self, volume: float) -> None:
         """Set the volume of the player, must be values between 0 and 100"""
@@ -118,12 +170,12 @@ class ProcessPlayer(Process):
 
             volume = volume / 100
 
-            if not self.__currentSongChangeVolume:
-                print('[PROCESS ERROR] -> Cannot change the volume of this song')
-                return
-            
             self.__songVolumeUsing = volume
-            self.__voiceClient.source.volume = volume
+            if self.__currentSongChangeVolume:
+                self.__voiceClient.source.volume = volume
+            elif self.__verifyIfIsPlaying():
+                # The Opus frames are sent without decoding, so the song continues decoded to change the volume
+                self.__loop.create_task(self.__restartCurrentSong())
         except Exception as e:
             print(e)
 
@@ -134,28 +186,34 @@ class ProcessPlayer(Process):
             return False
         return self.__voiceClient.is_playing() or self.__voiceClient.is_paused()
 
-    async def __playPlaylistSongs(self) -> None:
-        """If the player is not running trigger to play a new song"""
-        self.__playing = self.__verifyIfIsPlaying()
-        if not self.__playing:
-            song = None
-            with self.__playlistLock:
-                with self.__playerLock:
-                    song = self.__playlist.next_song()
-
-            if song is not None:
-                self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
-                self.__playing = True
-
-    async def __playSong(self, song: Song) -> None:
-        """Function that will trigger the player to play the song"""
+    async def __playReceivedSong(self, song: Song, position: float = 0.0) -> None:
+        """Play the song sent by the main process, None means that the playlist has finished"""
+        if song is None:
+            with self.__playerLock:
+                self.__songPlaying = None
+                self.__playing = False
+                # The main process already considers this one sleeping, the process can finish
+                self.__sendCommand(VCommands(VCommandsType.SLEEPING))
+                self.__semStopPlaying.release()
+            return
+
+        self.__playing = True
+        self.__loop.create_task(self.__playSong(song, position), name=f'Song {song.identifier}')
+
+    async def __playSong(self, song: Song, position: float = 0.0) -> None:
+        """Function that will trigger the player to play the song, from the position in seconds"""
         try:
             self.__playerLock.acquire()
             if song is None:
                 return
 
+            # Songs restored from the stored playlists only have the metadata, the source is resolved now
             if song.source is None:
-                return self.__playNext(None)
+                song = await self.__downloadSongAgain(song)
+            if song is None or song.source is None:
+                # Not playing, so the song that played before is not resumed
+                self.__playing = False
+                return self.__playNext('Song could not be downloaded')
 
             # If not connected, connect to bind channel
             if self.__voiceClient is None:
@@ -168,18 +226,25 @@ class ProcessPlayer(Process):
             # If the player is connected and playing return the song to the playlist
             elif self.__voiceClient.is_playing():
                 print('[PROCESS PLAYER -> SONG ALREADY PLAYING, RETURNING]')
-                self.__playlist.add_song_start(song)
+                self.__sendCommand(VCommands(VCommandsType.SONG_RETURNED, song))
                 return
 
             songStillAvailable = self.__verifyIfSongAvailable(song)
             if not songStillAvailable:
                 print('[PROCESS PLAYER -> SONG NOT AVAILABLE ANYMORE, DOWNLOADING AGAIN]')
-                song = self.__downloadSongAgain(song)
+                song = await self.__downloadSongAgain(song)
+                if song is None or song.source is None:
+                    self.__playing = False
+                    return self.__playNext('Song could not be downloaded again')
 
+            if self.__songPlaying is None or self.__songPlaying.songID != song.songID:
+                self.__resumeAttempts = 0
             self.__playing = True
             self.__songPlaying = song
 
-            player = FFmpegPCMAudio(song.source, **self.FFMPEG_OPTIONS)
+            player = SongAudioSource.create(song, self.__getFFmpegOptions(position), self.__songVolumeUsing)
+            # The position of the song is reported in the heartbeats
+            player = self.__songSource = PositionTrackedSource(player, position)
             if not player.is_opus():
                 player = PCMVolumeTransformer(player, self.__songVolumeUsing)
                 self.__currentSongChangeVolume = True
@@ -189,38 +254,78 @@ class ProcessPlayer(Process):
             self.__timer.cancel()
             self.__timer = TimeoutClock(self.__timeoutHandler, self.__loop)
 
-            nowPlayingCommand = VCommands(VCommandsType.NOW_PLAYING, song)
-            self.__queueSend.put(nowPlayingCommand)
+            # A song continued from a position was already shown
+            if position == 0:
+                nowPlayingCommand = VCommands(VCommandsType.NOW_PLAYING, song)
+                self.__sendCommand(nowPlayingCommand)
         except Exception as e:
             print(f'[PROCESS PLAYER -> ERROR IN PLAY SONG FUNCTION] -> {e}, {type(e)}')
-            self.__playNext(None)
+            self.__playing = False
+            self.__playNext(e)
         finally:
             self.__playerLock.release()
 
     def __playNext(self, error) -> None:
+        """Called when the song ends, the main process will answer with the next song to play"""
         if error is not None:
             print(f'[PROCESS PLAYER -> ERROR PLAYING SONG] -> {error}')
-        with self.__playlistLock:
-            with self.__playerLock:
-                self.__currentSongChangeVolume = False
+        with self.__playerLock:
+            self.__currentSongChangeVolume = False
 
-                if self.__forceStop:  # If it's forced to stop player
-                    self.__forceStop = False
-                    return None
+            if self.__forceStop:  # If it's forced to stop player
+                self.__forceStop = False
+                return None
 
-                song = self.__playlist.next_song()
+            # The song was not stopped by a command, but ended before the time, continue from where it stopped
+            if self.__playing and self.__shouldResumeSong():
+                song = self.__songPlaying
+                position = self.__songSource.position
+                self.__resumeAttempts += 1
+                print(f'[PROCESS PLAYER -> SONG ENDED AT {position:.0f}s OF {song.duration}s, RESUMING]')
+                asyncio.run_coroutine_threadsafe(self.__resumeSong(song, position), self.__loop)
+                return None
 
-                if song is not None:
-                    self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
-                else:
-                    self.__playlist.loop_off()
-                    self.__songPlaying = None
-                    self.__playing = False
-                    # Send a command to the main process put this one to sleep
-                    sleepCommand = VCommands(VCommandsType.SLEEPING)
-                    self.__queueSend.put(sleepCommand)
-                    # Release the semaphore to finish the process
-                    self.__semStopPlaying.release()
+            self.__playing = False
+            errorMessage = None if error is None else str(error)
+            self.__sendCommand(VCommands(VCommandsType.SONG_FINISHED, errorMessage))
+
+    def __shouldResumeSong(self) -> bool:
+        song = self.__songPlaying
+        if song is None or song.duration is None or self.__songSource is None:
+            return False
+        if self.__resumeAttempts >= self.MAX_RESUME_ATTEMPTS:
+            return False
+        return self.__songSource.position < song.duration - self.PREMATURE_END_TOLERANCE
+
+    async def __resumeSong(self, song: Song, position: float) -> None:
+        # Usually the stream URL expired or the connection dropped, so the source is resolved again
+        print('[PROCESS PLAYER -> REFRESHING THE SONG SOURCE]')
+        refreshedSong = await self.__downloadSongAgain(song)
+        if refreshedSong is None or refreshedSong.source is None:
+            self.__playing = False
+            return self.__playNext('Song could not be downloaded again')
+        await self.__playSong(refreshedSong, position)
+
+    def __getSongPosition(self) -> float:
+        if self.__songSource is None:
+            return 0.0
+        return self.__songSource.position
+
+    def __getFFmpegOptions(self, position: float) -> dict:
+        if position <= 0:
+            return self.FFMPEG_OPTIONS
+        # With the -ss before the input ffmpeg seeks in the stream, instead of decoding and discarding until it
+        options = dict(self.FFMPEG_OPTIONS)
+        options['before_options'] = f'-ss {position:.2f} {options["before_options"]}'
+        return options
+
+    def __sendCommand(self, command: VCommands) -> None:
+        """Send a command to the main process, the commands are sent by the loop and by the voice thread"""
+        try:
+            with self.__sendLock:
+                self.__connectionSend.send_bytes(CommandsProtocol.encode(command))
+        except Exception as e:
+            print(f'[PROCESS PLAYER -> ERROR SENDING COMMAND] -> {command.getType()} - {e}')
 
     def __verifyIfSongAvailable(self, song: Song) -> bool:
         """Verify the song source to see if it's already expired"""
@@ -242,78 +347,77 @@ class ProcessPlayer(Process):
             print(f'[PROCESS PLAYER -> ERROR VERIFYING SONG AVAILABILITY] -> {e}')
             return False
 
-    def __downloadSongAgain(self, song: Song) -> Song:
+    async def __downloadSongAgain(self, song: Song) -> Optional[Song]:
         """Force a download to be executed again, one use case is when the song.source expired and needs to refresh"""
-        return self.__downloader.finish_one_song(song)
+        # The download runs in a thread while the loop keeps sending the heartbeats and the audio
+        try:
+            return await self.__downloader.finish_one_song_async(song)
+        except DownloadingError as e:
+            print(f'[PROCESS PLAYER -> ERROR DOWNLOADING SONG AGAIN] -> {e}')
+            return None
 
-    async def __playPrev(self, voiceChannelID: int) -> None:
-        with self.__playlistLock:
-            song = self.__playlist.prev_song()
+    async def __playPrev(self, voiceChannelID: int, song: Song) -> None:
+        with self.__playerLock:
+            # If not connect, connect to the user voice channel, may change the channel
+            if self.__voiceClient is None or not self.__voiceClient.is_connected():
+                self.__voiceChannelID = voiceChannelID
+                self.__voiceChannel = self.__guild.get_channel(self.__voiceChannelID)
+                await self.__connectToVoiceChannel()
 
-            with self.__playerLock:
-                if song is not None:
-                    # If not connect, connect to the user voice channel, may change the channel
-                    if self.__voiceClient is None or not self.__voiceClient.is_connected():
-                        self.__voiceChannelID = voiceChannelID
-                        self.__voiceChannel = self.__guild.get_channel(self.__voiceChannelID)
-                        await self.__connectToVoiceChannel()
-
-                    # If already playing, stop the current play
-                    if self.__verifyIfIsPlaying():
-                        # Will forbidden next_song to execute after stopping current player
-                        self.__forceStop = True
-                        self.__voiceClient.stop()
-                        self.__playing = False
-
-                    self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
+            # If already playing, stop the current play
+            if self.__verifyIfIsPlaying():
+                # Will forbidden the main process to send the next song after stopping current player
+                self.__forceStop = True
+                self.__voiceClient.stop()
+                self.__playing = False
+
+            self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
 
     async def __restartCurrentSong(self) -> None:
-        song = self.__playlist.getCurrentSong()
-        if song is None:
-            song = self.__playlist.next_song()
+        """Play again the current song from the position it reached"""
+        song = self.__songPlaying
         if song is None:
             return
 
-        self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
-
-    def __commandsReceiver(self) -> None:
-        # Forces the Thread that listen to the commands to await this bot instance
-        # to stablish the connection with discord, may delay when running bots in several servers
-        while True:
-            if self.__botCompletedLoad:
-                break
-            sleep(0.1)
+        position = self.__getSongPosition()
+        if self.__verifyIfIsPlaying():
+            # Will forbidden the main process to send the next song after stopping current player
+            self.__forceStop = True
+            self.__voiceClient.stop()
+        self.__loop.create_task(self.__playSong(song, position), name=f'Song {song.identifier}')
+
+    async def __executeCommand(self, command: VCommands) -> None:
+        type = command.getType()
+        args = command.getArgs()
+        if type == VCommandsType.CONTEXT:
+            self.__assignGuild(*args)
+            return
 
-        while True:
-            command: VCommands = self.__queueReceive.get()
-            type = command.getType()
-            args = command.getArgs()
-            print(f'Player Process {self.__guild.name} received command {type}')
-
-            try:
-                self.__playerLock.acquire()
-                if type == VCommandsType.PAUSE:
-                    self.__pause()
-                elif type == VCommandsType.RESUME:
-                    asyncio.run_coroutine_threadsafe(self.__resume(), self.__loop)
-                elif type == VCommandsType.SKIP:
-                    asyncio.run_coroutine_threadsafe(self.__skip(), self.__loop)
-                elif type == VCommandsType.PLAY:
-                    asyncio.run_coroutine_threadsafe(self.__playPlaylistSongs(), self.__loop)
-                elif type == VCommandsType.PREV:
-                    asyncio.run_coroutine_threadsafe(self.__playPrev(args), self.__loop)
-                elif type == VCommandsType.RESET:
-                    asyncio.run_coroutine_threadsafe(self.__reset(), self.__loop)
-                elif type == VCommandsType.STOP:
-                    asyncio.run_coroutine_threadsafe(self.__stop(), self.__loop)
-                elif type == VCommandsType.VOLUME:
-                    self.__set_volume(args)
-                else:
-                    print(f'[PROCESS PLAYER ERROR] -> Unknown Command Received: {command}')
-            except Exception as e:
-                print(f'[PROCESS PLAYER -> ERROR IN COMMAND RECEIVER] -> {type} - {e}')
-            finally:
-                self.__playerLock.release()
+        # Forces the commands to await this bot instance to stablish the connection with discord
+        await self.__botCompletedLoad.wait()
+        print(f'Player Process {self.__guild.name} received command {type}, '
+              f'{self.__commandsIntake.depth} commands waiting')
+
+        if type == VCommandsType.PAUSE:
+            self.__pause()
+        elif type == VCommandsType.RESUME:
+            await self.__resume()
+        elif type == VCommandsType.SKIP:
+            await self.__skip()
+        elif type == VCommandsType.PLAY:
+            await self.__playReceivedSong(args)
+        elif type == VCommandsType.PLAY_AT:
+            await self.__playReceivedSong(*args)
+        elif type == VCommandsType.PREV:
+            await self.__playPrev(*args)
+        elif type == VCommandsType.RESET:
+            await self.__reset()
+        elif type == VCommandsType.STOP:
+            await self.__stop()
+        elif type == VCommandsType.VOLUME:
+            self.__set_volume(args)
+        else:
+            print(f'[PROCESS PLAYER ERROR] -> Unknown Command Received: {command}')
 
     def __pause(self) -> None:
         if self.__voiceClient is not None:
@@ -333,18 +437,15 @@ class ProcessPlayer(Process):
     async def __stop(self) -> None:
         if self.__voiceClient is not None:
             if self.__voiceClient.is_connected():
-                with self.__playlistLock:
-                    self.__playlist.loop_off()
-                    self.__playlist.clear()
-
-                # Send a command to the main process put this to sleep
+                # The playlist was cleared by the main process, send a command to put this one to sleep
                 sleepCommand = VCommands(VCommandsType.SLEEPING)
-                self.__queueSend.put(sleepCommand)
+                self.__sendCommand(sleepCommand)
+                # Before stopping, so the song is not resumed
+                self.__playing = False
                 self.__voiceClient.stop()
                 await self.__voiceClient.disconnect()
 
                 self.__songPlaying = None
-                self.__playing = False
                 self.__voiceClient = None
                 self.__semStopPlaying.release()
             # If the voiceClient is not None we finish things
@@ -360,7 +461,7 @@ class ProcessPlayer(Process):
                     return self.__voiceClient.resume()
                 # If there is a current song but the voice client is not playing
                 elif self.__songPlaying is not None and not self.__voiceClient.is_playing():
-                    await self.__playSong(self.__songPlaying)
+                    await self.__playSong(self.__songPlaying, self.__getSongPosition())
 
     async def __skip(self) -> None:
         self.__playing = self.__verifyIfIsPlaying()
@@ -369,10 +470,10 @@ class ProcessPlayer(Process):
             if self.__playing:
                 self.__playing = False
                 self.__voiceClient.stop()
-            # If for some reason the Bot has disconnect but there is still songs to play
-            elif len(self.__playlist.getSongs()) > 0:
-                print('[PROCESS PLAYER -> RESTARTING CURRENT SONG]')
-                await self.__restartCurrentSong()
+            # If for some reason the Bot has disconnect, the main process will send the next song
+            else:
+                print('[PROCESS PLAYER -> NOT PLAYING, ASKING THE NEXT SONG]')
+                self.__sendCommand(VCommands(VCommandsType.SONG_FINISHED))
 
     async def __forceBotDisconnectAndStop(self) -> None:
         # Lock to work with Player
@@ -388,19 +489,67 @@ class ProcessPlayer(Process):
                 print(f'[PROCESS PLAYER -> ERROR FORCING BOT TO STOP] -> {e}')
             finally:
                 self.__voiceClient = None
-            with self.__playlistLock:
-                self.__playlist.clear()
-                self.__playlist.loop_off()
 
     async def __createBotInstance(self) -> VulkanBot:
         """Load a new bot instance that should not be directly called."""
-        initializer = VulkanInitializer(willListen=False)
+        initializer = VulkanPlayerInitializer(self.__shardID, self.__shardCount)
         bot = initializer.getBot()
 
         await bot.startBotCoro(self.__loop)
-        await self.__ensureDiscordConnection(bot)
+        if self.__guildID is None:
+            await bot.wait_until_ready()
+        else:
+            await self.__ensureDiscordConnection(bot)
         return bot
 
+    def __assignGuild(self, guildName: str, guildID: int, voiceID: int, shardID: int, shardCount: int) -> None:
+        """Receive the guild that the standby process must play"""
+        if self.__guildAssigned.is_set():
+            print(f'[PROCESS PLAYER -> GUILD ALREADY ASSIGNED, IGNORING] -> {guildName}')
+            return
+
+        self.name = guildName
+        self.__guildID = guildID
+        self.__voiceChannelID = voiceID
+        self.__shardID = shardID
+        self.__shardCount = shardCount
+        self.__guildAssigned.set()
+        self.__startHeartbeats()
+        print(f'Standby Player Process assigned to Guild {guildName}')
+
+    def __startHeartbeats(self) -> None:
+        """Only the processes with a guild send heartbeats, nobody reads the pipe of the standby processes"""
+        self.__heartbeatTask = self.__loop.create_task(self.__sendHeartbeats(), name='Heartbeats')
+
+    async def __sendHeartbeats(self) -> None:
+        interval = VConfigs().PLAYER_HEARTBEAT_INTERVAL
+        while True:
+            # The sleep takes longer than the interval when the loop is busy, that delay is the loop lag
+            start = perf_counter()
+            await asyncio.sleep(interval)
+            loopLag = max(0.0, perf_counter() - start - interval)
+
+            voiceState = self.__getVoiceState()
+            voiceChannelID = self.__voiceChannelID
+            songID = position = None
+            if voiceState != VoiceState.DISCONNECTED:
+                # The bot may have been moved to another channel
+                voiceChannelID = self.__voiceClient.channel.id
+            if voiceState in (VoiceState.PLAYING, VoiceState.PAUSED) and self.__songPlaying is not None:
+                songID = self.__songPlaying.songID
+                position = self.__getSongPosition()
+            heartbeat = PlayerHeartbeat(loopLag, voiceState, voiceChannelID, songID, position)
+            self.__sendCommand(VCommands(VCommandsType.HEARTBEAT, heartbeat))
+
+    def __getVoiceState(self) -> VoiceState:
+        if self.__voiceClient is None or not self.__voiceClient.is_connected():
+            return VoiceState.DISCONNECTED
+        if self.__voiceClient.is_paused():
+            return VoiceState.PAUSED
+        if self.__voiceClient.is_playing():
+            return VoiceState.PLAYING
+        return VoiceState.CONNECTED
+
     async def __timeoutHandler(self) -> None:
         try:
             # If there is not voiceClient return
@@ -417,14 +566,12 @@ class ProcessPlayer(Process):
                         self.__timer = TimeoutClock(self.__timeoutHandler, self.__loop)
                         return
 
-            # Finish the process
+            # Finish the process, the main process clears the playlist when receiving the SLEEPING command
             with self.__playerLock:
-                with self.__playlistLock:
-                    self.__playlist.loop_off()
                 await self.__forceBotDisconnectAndStop()
                 # Send command to main process to finish this one
                 sleepCommand = VCommands(VCommandsType.SLEEPING)
-                self.__queueSend.put(sleepCommand)
+                self.__sendCommand(sleepCommand)
                 # Release semaphore to finish process
                 self.__semStopPlaying.release()
         except Exception as e:
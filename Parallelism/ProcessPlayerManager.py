@@ -1,17 +1,25 @@
-import asyncio
 from enum import Enum
-from multiprocessing import Lock, Process, Queue
 from multiprocessing.managers import BaseManager, NamespaceProxy
-from queue import Empty
-from threading import Thread
-from typing import Dict, Tuple, Union
+from random import uniform
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Tuple, Union
+from Config.Configs import VConfigs
 from Config.Singleton import Singleton
-from discord import Guild, Interaction, TextChannel, VoiceChannel
+from discord import Guild, Interaction, TextChannel
 from discord.ext.commands import Context
 from Parallelism.AbstractProcessManager import AbstractPlayersManager
 from Parallelism.ProcessExecutor import ProcessCommandsExecutor
 from Music.Song import Song
-from Parallelism.ProcessPlayer import ProcessPlayer
+from Parallelism.AbstractPlayersHost import AbstractPlayersHost, PlayerHandle
+from Parallelism.LocalPlayersHost import LocalPlayersHost
+from Parallelism.ShardRouter import ShardRouter
+from Parallelism.PlaylistWatcher import PlaylistWatcher
+from Parallelism.PlayerLock import PlayerLock
+from Parallelism.PlayerSupervisor import PlayerHeartbeat, PlayerSupervisor, VoiceState
+from Parallelism.PlaylistSnapshotter import PlaylistSnapshotter
+from Parallelism.GuildPlaylists import GuildPlaylists
+from Music.PlaylistStore import PlaylistStore
 from Music.Playlist import Playlist
 from Parallelism.Commands import VCommands, VCommandsType
 from Music.VulkanBot import VulkanBot
@@ -27,17 +35,20 @@ class PlayerProcessInfo:
     Class to store the reference to all structures to maintain a process player
     """
 
-    def __init__(self, process: Process, queueToPlayer: Queue, queueToMain: Queue, playlist: Playlist, lock: Lock, textChannel: TextChannel) -> None:
-        self.__process = process
-        self.__queueToPlayer = queueToPlayer
-        self.__queueToMain = queueToMain
+    def __init__(self, player: PlayerHandle, playlist: Playlist, playerLock: PlayerLock, textChannel: TextChannel, voiceChannelID: int) -> None:
+        self.__player = player
         self.__playlist = playlist
-        self.__lock = lock
+        self.__playerLock = playerLock
         self.__textChannel = textChannel
+        self.__voiceChannelID = voiceChannelID
         self.__status = ProcessStatus.RUNNING
-
-    def setProcess(self, newProcess: Process) -> None:
-        self.__process = newProcess
+        # The song sent to the process that didn't finish yet
+        self.__sentSong: Song = None
+        # Last position of the sent song reported by the process and when, None if it was not playing
+        self.__songPosition = 0.0
+        self.__songPositionAt: float = None
+        # The draining process is replaced between songs, or until this moment
+        self.__drainDeadline: float = None
 
     def getStatus(self) -> ProcessStatus:
         return self.__status
@@ -45,41 +56,97 @@ class PlayerProcessInfo:
     def setStatus(self, status: ProcessStatus) -> None:
         self.__status = status
 
-    def getProcess(self) -> Process:
-        return self.__process
-
-    def getQueueToPlayer(self) -> Queue:
-        return self.__queueToPlayer
-
-    def getQueueToMain(self) -> Queue:
-        return self.__queueToMain
+    def getPlayer(self) -> PlayerHandle:
+        return self.__player
 
     def getPlaylist(self) -> Playlist:
         return self.__playlist
 
     def getLock(self) -> Lock:
-        return self.__lock
+        return self.__playerLock.getLock()
+
+    def getPlayerLock(self) -> PlayerLock:
+        return self.__playerLock
 
     def getTextChannel(self) -> TextChannel:
         return self.__textChannel
 
+    def getVoiceChannelID(self) -> int:
+        return self.__voiceChannelID
+
+    def setVoiceChannelID(self, voiceChannelID: int) -> None:
+        self.__voiceChannelID = voiceChannelID
+
+    def isDraining(self) -> bool:
+        return self.__drainDeadline is not None
+
+    def setDraining(self, timeout: float) -> None:
+        self.__drainDeadline = monotonic() + timeout
+
+    def isSongSent(self) -> bool:
+        return self.__sentSong is not None
+
+    def getSentSong(self) -> Song:
+        return self.__sentSong
+
+    def setSentSong(self, song: Song, position: float = 0.0) -> None:
+        self.__sentSong = song
+        self.__songPosition = position
+        self.__songPositionAt = None
+
+    def setSongPosition(self, position: float, playing: bool) -> None:
+        self.__songPosition = position
+        self.__songPositionAt = monotonic() if playing else None
+
+    def getSongPosition(self) -> float:
+        """Estimate the position of the sent song, it advances since the last report only if it was playing"""
+        if self.__songPositionAt is None:
+            return self.__songPosition
+        # Without the next heartbeat it's not known if the song still advanced
+        elapsed = min(monotonic() - self.__songPositionAt, VConfigs().PLAYER_HEARTBEAT_INTERVAL)
+        return self.__songPosition + elapsed
+
 
 class ProcessPlayerManager(Singleton, AbstractPlayersManager):
     """
     Manage all running player process, creating and storing them for future calls
-    Deals with the creation of shared memory
+    The Playlists are owned by this process, the player processes only receive the song to play now and
+    send back when it finished, so the handlers access the Playlist directly in memory
+    The processes send heartbeats to the PlayerSupervisor, the unhealthy ones are recreated with the same Playlist
+    With a sharded Bot each process connects as the shard of its guild, only guilds of this Bot shards are played
+    The processes are created by the players host, by default in this machine, the subclasses may change the host
+    When the host drains a process, the guild is handed off to a new process between songs, or before the deadline
     """
+    # Fraction of the drain timeout after which a process still playing is handed off in the middle of the song,
+    # spread between the processes so the songs are not cut all at the same time
+    DRAIN_HANDOFF_WINDOW = (0.5, 0.9)
 
     def __init__(self, bot: VulkanBot = None) -> None:
         if not super().created:
             self.__bot = bot
-            VManager.register('Playlist', Playlist)
-            VManager.register('VoiceChannel', VoiceChannel)
-            self.__manager = VManager()
-            self.__manager.start()
             self.__playersProcess: Dict[int, PlayerProcessInfo] = {}
-            self.__playersListeners: Dict[int, Tuple[Thread, bool]] = {}
+            self.__playersHost: AbstractPlayersHost = None
+            self.__supervisor: PlayerSupervisor = None
+            # The commands of the players and the heartbeats are received in the bot loop
+            if bot is not None:
+                self.__playersHost = self._createPlayersHost(bot)
+                self.__supervisor = PlayerSupervisor(bot.loop, self.__restartUnhealthyPlayer)
             self.__playersCommandsExecutor: Dict[int, ProcessCommandsExecutor] = {}
+            # One lock for each guild, kept when the process is replaced because the handlers may be waiting for it
+            self.__playersLocks: Dict[int, PlayerLock] = {}
+            self.__playlistWatcher = PlaylistWatcher()
+            # Only the main process saves and restores the playlists
+            if bot is not None and bot.listingSlash:
+                self.__guildPlaylists = GuildPlaylists(PlaylistStore())
+                PlaylistSnapshotter(self).start()
+            else:
+                self.__guildPlaylists = GuildPlaylists(None)
+
+    def _createPlayersHost(self, bot: VulkanBot) -> AbstractPlayersHost:
+        """Return the host where the player processes run, the commands of all players are received in the bot loop"""
+        # Only the bot listening to the commands keeps standby processes
+        standbyQuant = VConfigs().PLAYER_STANDBY_PROCESSES if bot.listingSlash else 0
+        return LocalPlayersHost(bot.loop, standbyQuant)
 
     async def sendCommandToPlayer(self, command: VCommands, guild: Guild, context: Union[Context, Interaction], forceCreation: bool = False):
         if forceCreation:
@@ -93,33 +160,50 @@ class ProcessPlayerManager(Singleton, AbstractPlayersManager):
             self.resetPlayer(guild, context)
             processInfo = self.__getRunningPlayerInfo(guild)
 
-        queue = processInfo.getQueueToPlayer()
-        self.__putCommandInQueue(queue, command)
+        commandType = command.getType()
+        if commandType == VCommandsType.PLAY:
+            self.__withPlaylist(guild.id, self.__playNextSong)
+        elif commandType == VCommandsType.PREV:
+            self.__withPlaylist(guild.id, lambda info: self.__playPrevSong(info, command.getArgs()))
+        elif commandType == VCommandsType.STOP:
+            self.__withPlaylist(guild.id, self.__stopPlaying)
+        elif commandType in (VCommandsType.SKIP, VCommandsType.RESET) and not processInfo.isSongSent():
+            # The process is not playing, so skip or restart only means to play the next song
+            self.__withPlaylist(guild.id, self.__playNextSong)
+        else:
+            self.__sendCommandToProcess(processInfo, command)
 
     def getPlayerPlaylist(self, guild: Guild) -> Playlist:
         playerInfo = self.__getRunningPlayerInfo(guild)
         if playerInfo:
             return playerInfo.getPlaylist()
 
-    def getPlayerLock(self, guild: Guild) -> Lock:
+    def getPlayerLock(self, guild: Guild) -> PlayerLock:
         playerInfo = self.__getRunningPlayerInfo(guild)
         if playerInfo:
-            return playerInfo.getLock()
+            return playerInfo.getPlayerLock()
+
+    def getPlayersPlaylists(self) -> Dict[int, Tuple[Playlist, Lock]]:
+        return {guildID: (info.getPlaylist(), info.getLock()) for guildID, info in list(self.__playersProcess.items())}
 
     def verifyIfPlayerExists(self, guild: Guild) -> bool:
         return guild.id in self.__playersProcess.keys()
 
     def createPlayerForGuild(self, guild: Guild, context: Union[Context, Interaction]) -> None:
         try:
+            if not ShardRouter.ownsGuild(self.__bot, guild.id):
+                print(f'[PROCESS MANAGER] -> Guild {guild.id} is not in the shards of this Bot')
+                return None
+
             if guild.id not in self.__playersProcess.keys():
                 self.__playersProcess[guild.id] = self.__createProcessPlayerInfo(guild, context)
             else:
                 # If the process has ended create a new one
-                if not self.__playersProcess[guild.id].getProcess().is_alive():
+                if not self.__playersProcess[guild.id].getPlayer().isAlive():
                     self.__playersProcess[guild.id] = self.__recreateProcess(guild, context)
 
-            # Start the process
-            self.__playersProcess[guild.id].getProcess().start()
+            # Start the process, the standby processes are already running
+            self.__startProcess(self.__playersProcess[guild.id])
             return self.__playersProcess[guild.id]
         except Exception as e:
             print(f'[Error In GetPlayerContext] -> {e}')
@@ -130,12 +214,18 @@ class ProcessPlayerManager(Singleton, AbstractPlayersManager):
             return None
 
         # Recreate the process keeping the playlist
+        oldProcessInfo = self.__playersProcess[guild.id]
         newProcessInfo = self.__recreateProcess(guild, context)
-        newProcessInfo.getProcess().start()  # Start the process
-        # Send a command to start the play again
-        playCommand = VCommands(VCommandsType.PLAY)
-        self.__putCommandInQueue(newProcessInfo.getQueueToPlayer(), playCommand)
+        self.__startProcess(newProcessInfo)
         self.__playersProcess[guild.id] = newProcessInfo
+        # Continue the song that was playing, or start the next one
+        self.__continuePlaying(guild.id, oldProcessInfo, newProcessInfo)
+
+    def getSupervisor(self) -> PlayerSupervisor:
+        return self.__supervisor
+
+    def getPlayersHost(self) -> AbstractPlayersHost:
+        return self.__playersHost
 
     def __getRunningPlayerInfo(self, guild: Guild) -> PlayerProcessInfo:
         """Return the process info for the guild, if not, return None"""
@@ -149,37 +239,28 @@ class ProcessPlayerManager(Singleton, AbstractPlayersManager):
         guildID: int = context.guild.id
         voiceID: int = context.author.voice.channel.id
 
-        playlist: Playlist = self.__manager.Playlist()
-        lock = Lock()
-        queueToListen = Queue()
-        queueToSend = Queue()
-        process = ProcessPlayer(context.guild.name, playlist, lock, queueToSend,
-                                queueToListen, guildID, voiceID)
-        processInfo = PlayerProcessInfo(process, queueToSend, queueToListen,
-                                        playlist, lock, context.channel)
-
-        # Create a Thread to listen for the queue coming from the Player Process, this will redirect the Queue to a async
-        thread = Thread(target=self.__listenToCommands,
-                        args=(queueToListen, guild), daemon=True)
-        self.__playersListeners[guildID] = (thread, False)
-        thread.start()
+        playlist = self.__guildPlaylists.get(guildID)
+        playerLock = self.__playersLocks.setdefault(guildID, PlayerLock(Lock()))
+        processInfo = self.__createPlayerProcess(guildID, guild.name, voiceID, playlist, playerLock, context.channel)
+        self.__registerProcess(guildID, processInfo)
 
         # Create a Message Controller for this player
         self.__playersCommandsExecutor[guildID] = ProcessCommandsExecutor(self.__bot, guildID)
 
         return processInfo
 
+    def __createPlayerProcess(self, guildID: int, guildName: str, voiceID: int, playlist: Playlist, playerLock: PlayerLock, textChannel: TextChannel) -> PlayerProcessInfo:
+        """Assign the guild to a standby process if there is one available, otherwise create a new process"""
+        shardID, shardCount = ShardRouter.getShard(self.__bot, guildID)
+        player = self.__playersHost.createPlayer(guildName, guildID, voiceID, shardID, shardCount)
+        return PlayerProcessInfo(player, playlist, playerLock, textChannel, voiceID)
+
+    def __startProcess(self, processInfo: PlayerProcessInfo) -> None:
+        processInfo.getPlayer().start()
+
     def __stopPossiblyRunningProcess(self, guild: Guild):
-        try:
-            if guild.id in self.__playersProcess.keys():
-                playerProcess = self.__playersProcess[guild.id]
-                process = playerProcess.getProcess()
-                process.close()
-                process.kill()
-        except ValueError:
-            pass
-        except Exception as e:
-            print(f'[WARNINGS] -> {e}')
+        if guild.id in self.__playersProcess.keys():
+            self.__playersProcess[guild.id].getPlayer().kill()
 
     def __recreateProcess(self, guild: Guild, context: Union[Context, Interaction]) -> PlayerProcessInfo:
         """Create a new process info using previous playlist"""
@@ -191,80 +272,258 @@ class ProcessPlayerManager(Singleton, AbstractPlayersManager):
         else:
             voiceID: int = context.author.voice.channel.id
 
-        playlist: Playlist = self.__playersProcess[guildID].getPlaylist()
-        lock = Lock()
-        queueToListen = Queue()
-        queueToSend = Queue()
-        process = ProcessPlayer(context.guild.name, playlist, lock, queueToSend,
-                                queueToListen, guildID, voiceID)
-        processInfo = PlayerProcessInfo(process, queueToSend, queueToListen,
-                                        playlist, lock, context.channel)
-
-        # Create a Thread to listen for the queue coming from the Player Process, this will redirect the Queue to a async
-        thread = Thread(target=self.__listenToCommands,
-                        args=(queueToListen, guild), daemon=True)
-        self.__playersListeners[guildID] = (thread, False)
-        thread.start()
+        oldProcessInfo = self.__playersProcess[guildID]
+        self.__unregisterProcess((guildID, oldProcessInfo))
+        playlist: Playlist = oldProcessInfo.getPlaylist()
+        processInfo = self.__createPlayerProcess(guildID, guild.name, voiceID, playlist, oldProcessInfo.getPlayerLock(), context.channel)
+        self.__registerProcess(guildID, processInfo)
+
+        return processInfo
+
+    def __registerProcess(self, guildID: int, processInfo: PlayerProcessInfo) -> None:
+        key = (guildID, processInfo)
+        processInfo.getPlayer().listen(lambda command: self.__receivePlayerCommand(key, command))
+        self.__supervisor.watch(key, guildID)
+
+    def __unregisterProcess(self, key: Tuple[int, PlayerProcessInfo]) -> None:
+        key[1].getPlayer().close()
+        self.__supervisor.unwatch(key)
+
+    def __restartUnhealthyPlayer(self, key: Tuple[int, PlayerProcessInfo], reason: str) -> None:
+        """Called by the supervisor in the bot loop, recreate the process with the same Playlist and song"""
+        if not self.__isReplaceable(key):
+            return
 
+        print(f'[PROCESS MANAGER] -> Restarting the player of guild {key[0]}: {reason}')
+        processInfo = self.__replaceProcess(key)
+        self.__continuePlaying(key[0], key[1], processInfo)
+
+    def __isReplaceable(self, key: Tuple[int, PlayerProcessInfo]) -> bool:
+        guildID, processInfo = key
+        return self.__playersProcess.get(guildID) is processInfo and processInfo.getStatus() != ProcessStatus.SLEEPING
+
+    def __replaceProcess(self, key: Tuple[int, PlayerProcessInfo]) -> PlayerProcessInfo:
+        """Kill the process and start a new one with the same Playlist, the new one is not playing yet"""
+        guildID, oldProcessInfo = key
+        self.__unregisterProcess(key)
+        oldProcessInfo.getPlayer().kill()
+
+        guild = self.__bot.get_guild(guildID)
+        guildName = guild.name if guild is not None else str(guildID)
+        # The lock is kept, the handlers may be waiting for it
+        processInfo = self.__createPlayerProcess(guildID, guildName, oldProcessInfo.getVoiceChannelID(),
+                                                 oldProcessInfo.getPlaylist(), oldProcessInfo.getPlayerLock(),
+                                                 oldProcessInfo.getTextChannel())
+        self.__playersProcess[guildID] = processInfo
+        self.__registerProcess(guildID, processInfo)
+        self.__startProcess(processInfo)
         return processInfo
 
-    def __listenToCommands(self, queue: Queue, guild: Guild) -> None:
-        guildID = guild.id
-        while True:
-            shouldEnd = self.__playersListeners[guildID][1]
-            if shouldEnd:
-                break
-
-            try:
-                command: VCommands = queue.get(timeout=5)
-                commandType = command.getType()
-                args = command.getArgs()
-
-                print(f'Process {guild.name} sended command {commandType}')
-                if commandType == VCommandsType.NOW_PLAYING:
-                    asyncio.run_coroutine_threadsafe(self.showNowPlaying(
-                        guild.id, args), self.__bot.loop)
-                elif commandType == VCommandsType.TERMINATE:
-                    # Delete the process elements and return, to finish task
-                    self.__terminateProcess(guildID)
-                    return
-                elif commandType == VCommandsType.SLEEPING:
-                    # The process might be used again
-                    self.__sleepingProcess(guildID)
-                    return
-                else:
-                    print(f'[ERROR] -> Unknown Command Received from Process: {commandType}')
-            except Empty:
-                continue
-            except Exception as e:
-                print(f'[ERROR IN LISTENING PROCESS] -> {guild.name} - {e}')
+    def __drainProcess(self, key: Tuple[int, PlayerProcessInfo], timeout: float) -> None:
+        """The host will finish the process, the idle ones are handed off now and the others between songs"""
+        guildID, processInfo = key
+        if processInfo.isDraining():
+            return
+        processInfo.setDraining(timeout)
+        if not processInfo.isSongSent():
+            self.__handoffProcess(key, 'idle')
+            return
+        delay = timeout * uniform(*self.DRAIN_HANDOFF_WINDOW)
+        self.__bot.loop.call_later(delay, self.__handoffProcess, key, 'drain deadline')
+
+    def __handoffProcess(self, key: Tuple[int, PlayerProcessInfo], reason: str) -> None:
+        # Without other place for the players the process plays until the host finishes it
+        if not self.__isReplaceable(key) or not self.__playersHost.canCreatePlayers():
+            return
+
+        print(f'[PROCESS MANAGER] -> Handing off the draining player of guild {key[0]}: {reason}')
+        processInfo = self.__replaceProcess(key)
+        self.__continuePlaying(key[0], key[1], processInfo)
+
+    def __continuePlaying(self, guildID: int, oldProcessInfo: PlayerProcessInfo, processInfo: PlayerProcessInfo) -> None:
+        """The new process continues the song of the old one from the position it reached, or plays the next song"""
+        song = oldProcessInfo.getSentSong()
+        if song is None or oldProcessInfo.getStatus() == ProcessStatus.SLEEPING:
+            self.__withPlaylist(guildID, self.__playNextSong)
+            return
+
+        position = oldProcessInfo.getSongPosition()
+        processInfo.setSentSong(song, position)
+        print(f'[PROCESS MANAGER] -> Continuing the song of guild {guildID} from {position:.0f}s')
+        command = VCommands(VCommandsType.PLAY_AT, (song, position))
+        self.__sendCommandToProcess(processInfo, command)
+
+    def __receivePlayerCommand(self, key: Tuple[int, PlayerProcessInfo], command: VCommands) -> None:
+        """Called in the bot loop for each command sent by a player process"""
+        guildID, processInfo = key
+        commandType = command.getType()
+        args = command.getArgs()
+        # The commands of a process that was already replaced are ignored
+        isCurrentProcess = self.__playersProcess.get(guildID) is processInfo
+
+        if commandType == VCommandsType.HEARTBEAT:
+            if isCurrentProcess:
+                self.__receiveHeartbeat(key, args)
+            return
+
+        print(f'Process {processInfo.getPlayer().getName()} sended command {commandType}')
+        if commandType == VCommandsType.NOW_PLAYING:
+            song = self.__findSentSong(processInfo, args)
+            if isCurrentProcess and song is not None:
+                self.__bot.loop.create_task(self.showNowPlaying(guildID, song))
+        elif commandType == VCommandsType.SONG_FINISHED:
+            if args is not None:
+                print(f'[PROCESS PLAYER MANAGER] -> Song failed in guild {guildID}: {args}')
+            if isCurrentProcess:
+                self.__songFinished(guildID, processInfo)
+        elif commandType == VCommandsType.SONG_RETURNED:
+            song = self.__findSentSong(processInfo, args)
+            if isCurrentProcess and song is not None:
+                self.__songReturned(guildID, processInfo, song)
+        elif commandType == VCommandsType.TERMINATE:
+            # Delete the process elements, the process is finishing
+            self.__unregisterProcess(key)
+            if isCurrentProcess:
+                self.__terminateProcess(guildID)
+            self.__playlistWatcher.notify(guildID)
+        elif commandType == VCommandsType.DRAINING:
+            if isCurrentProcess:
+                self.__drainProcess(key, args)
+        elif commandType == VCommandsType.PLAYER_LOST:
+            if isCurrentProcess:
+                self.__supervisor.fail(key, 'player lost')
+        elif commandType == VCommandsType.SLEEPING:
+            # The process might be used again
+            self.__unregisterProcess(key)
+            if isCurrentProcess:
+                self.__withPlaylist(guildID, self.__clearPlaylist)
+                self.__sleepingProcess(guildID)
+            self.__playlistWatcher.notify(guildID)
+        else:
+            print(f'[ERROR] -> Unknown Command Received from Process: {commandType}')
+
+    def __receiveHeartbeat(self, key: Tuple[int, PlayerProcessInfo], heartbeat: PlayerHeartbeat) -> None:
+        processInfo = key[1]
+        # The process can't be restarted if it's finishing
+        if processInfo.getStatus() == ProcessStatus.SLEEPING:
+            return
+        if heartbeat.voiceChannelID is not None:
+            processInfo.setVoiceChannelID(heartbeat.voiceChannelID)
+        # The heartbeat may be from the song before the sent one
+        sentSong = processInfo.getSentSong()
+        if sentSong is not None and heartbeat.songID == sentSong.songID:
+            processInfo.setSongPosition(heartbeat.position, heartbeat.voiceState == VoiceState.PLAYING)
+        self.__supervisor.beat(key, heartbeat, processInfo.isSongSent())
+
+    def __findSentSong(self, processInfo: PlayerProcessInfo, songID: int) -> Song:
+        """The player processes reference the songs by the songID, the song must be the one sent or the current"""
+        for song in (processInfo.getSentSong(), processInfo.getPlaylist().getCurrentSong()):
+            if song is not None and song.songID == songID:
+                return song
+        print(f'[PROCESS PLAYER MANAGER] -> Song {songID} referenced by the process was not found')
+        return None
 
     def __terminateProcess(self, guildID: int) -> None:
         # Delete all structures associated with the Player
         del self.__playersProcess[guildID]
         del self.__playersCommandsExecutor[guildID]
-        threadListening = self.__playersListeners[guildID]
-        threadListening._stop()
-        del self.__playersListeners[guildID]
+        self.__guildPlaylists.remove(guildID)
+        self.__playersLocks.pop(guildID, None)
 
     def __sleepingProcess(self, guildID: int) -> None:
-        # Disable all process structures, except Playlist
-        queue1 = self.__playersProcess[guildID].getQueueToMain()
-        queue2 = self.__playersProcess[guildID].getQueueToPlayer()
-        queue1.close()
-        queue1.join_thread()
-        queue2.close()
-        queue2.join_thread()
         # Set the status of this process as sleeping, only the playlist object remains
         self.__playersProcess[guildID].setStatus(ProcessStatus.SLEEPING)
 
-    def __putCommandInQueue(self, queue: Queue, command: VCommands) -> None:
+    def __withPlaylist(self, guildID: int, function: Callable[[PlayerProcessInfo], None]) -> None:
+        """
+        Execute the function with the lock of the guild Playlist, must be called in the bot loop
+        The loop can't block waiting the lock, it may be held by a handler waiting in the loop, so the function is
+        executed by a task awaiting the PlayerLock, in the same order of the calls
+        """
+        processInfo = self.__playersProcess.get(guildID)
+        if processInfo is None:
+            return
+        self.__bot.loop.create_task(self.__executeWithPlaylist(guildID, processInfo.getPlayerLock(), function))
+
+    async def __executeWithPlaylist(self, guildID: int, playerLock: PlayerLock, function: Callable[[PlayerProcessInfo], None]) -> None:
+        while not await playerLock.acquire(VConfigs().ACQUIRE_LOCK_TIMEOUT):
+            print(f'[PROCESS MANAGER] -> Still waiting the lock of the playlist of guild {guildID}')
         try:
-            queue.put(command)
+            # The process may have been replaced while waiting the lock, the lock is only the same for the same guild player
+            processInfo = self.__playersProcess.get(guildID)
+            if processInfo is not None and processInfo.getPlayerLock() is playerLock:
+                function(processInfo)
         except Exception as e:
-            print(f'[ERROR PUTTING COMMAND IN QUEUE] -> {e}')
+            print(f'[ERROR IN PLAYLIST OPERATION] -> {guildID} - {e}')
+        finally:
+            playerLock.release()
+
+    def __playNextSong(self, processInfo: PlayerProcessInfo) -> None:
+        """Send the next song of the Playlist, if the process is not already playing one"""
+        if processInfo.isSongSent() or processInfo.getStatus() == ProcessStatus.SLEEPING:
+            return
+
+        song = processInfo.getPlaylist().next_song()
+        if song is None:
+            return
+        processInfo.setSentSong(song)
+        self.__sendCommandToProcess(processInfo, VCommands(VCommandsType.PLAY, song))
+
+    def __playPrevSong(self, processInfo: PlayerProcessInfo, voiceChannelID: int) -> None:
+        song = processInfo.getPlaylist().prev_song()
+        if song is None:
+            return
+        processInfo.setSentSong(song)
+        self.__sendCommandToProcess(processInfo, VCommands(VCommandsType.PREV, (voiceChannelID, song)))
+
+    def __stopPlaying(self, processInfo: PlayerProcessInfo) -> None:
+        self.__clearPlaylist(processInfo)
+        processInfo.setSentSong(None)
+        self.__sendCommandToProcess(processInfo, VCommands(VCommandsType.STOP))
+
+    def __clearPlaylist(self, processInfo: PlayerProcessInfo) -> None:
+        playlist = processInfo.getPlaylist()
+        playlist.loop_off()
+        playlist.clear()
+
+    def __songFinished(self, guildID: int, processInfo: PlayerProcessInfo) -> None:
+        """Send the next song to the process, if the Playlist ended the process will finish"""
+        processInfo.setSentSong(None)
+        self.__withPlaylist(guildID, lambda info: self.__sendSongAfterFinished(guildID, info))
+
+    def __sendSongAfterFinished(self, guildID: int, processInfo: PlayerProcessInfo) -> None:
+        if processInfo.isSongSent() or processInfo.getStatus() == ProcessStatus.SLEEPING:
+            return
+
+        playlist = processInfo.getPlaylist()
+        song = playlist.next_song()
+        if song is not None:
+            if processInfo.isDraining() and self.__playersHost.canCreatePlayers():
+                # Between songs the hand off doesn't cut the audio
+                print(f'[PROCESS MANAGER] -> Handing off the draining player of guild {guildID}: song finished')
+                processInfo = self.__replaceProcess((guildID, processInfo))
+            processInfo.setSentSong(song)
+        else:
+            playlist.loop_off()
+            # The next commands will create a new process, this one is finishing
+            processInfo.setStatus(ProcessStatus.SLEEPING)
+        self.__sendCommandToProcess(processInfo, VCommands(VCommandsType.PLAY, song))
+
+    def __songReturned(self, guildID: int, processInfo: PlayerProcessInfo, song: Song) -> None:
+        """The process was already playing when the song arrived, the song returns to the start of the queue"""
+        self.__withPlaylist(guildID, lambda info: info.getPlaylist().add_song_start(song))
+
+    def __sendCommandToProcess(self, processInfo: PlayerProcessInfo, command: VCommands) -> None:
+        try:
+            processInfo.getPlayer().send(command)
+        except Exception as e:
+            print(f'[ERROR SENDING COMMAND TO PROCESS] -> {e}')
+
+    async def waitPlaylistChange(self, guild: Guild, timeout: float) -> bool:
+        return await self.__playlistWatcher.wait(guild.id, timeout)
 
     async def showNowPlaying(self, guildID: int, song: Song) -> None:
+        self.__playlistWatcher.notify(guildID)
         commandExecutor = self.__playersCommandsExecutor[guildID]
         processInfo = self.__playersProcess[guildID]
         playlist = processInfo.getPlaylist()
@@ -0,0 +1,235 @@
+from asyncio import AbstractEventLoop, IncompleteReadError, StreamReader, StreamWriter, TimeoutError, open_connection, open_unix_connection, sleep, wait_for
+from itertools import count
+from typing import Callable, Dict, List, Optional, Set
+from Config.Configs import VConfigs
+from Parallelism.AbstractPlayersHost import AbstractPlayersHost, PlayerHandle
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsProtocol import CommandsProtocol, InvalidFrameError
+from Parallelism.ConsistentHashRing import ConsistentHashRing
+
+
+class PlayerNodeConnection:
+    """
+    Connection of the bot with one PlayerNode, the commands of all players of the node share the same stream
+    The address is 'host:port' for TCP or 'unix:/path' for a unix socket, the connection is remade if it drops
+    A draining node must not receive new players, the node at the address is only a new one after reconnecting
+    After connecting the bot answers the challenge of the node with the PLAYER_NODE_SECRET
+    """
+    RECONNECT_DELAY = 5
+    # Seconds to wait the authentication challenge of the node
+    AUTHENTICATION_TIMEOUT = 10
+
+    def __init__(self, loop: AbstractEventLoop, address: str, onStateChange: Callable[['PlayerNodeConnection'], None]) -> None:
+        self.__loop = loop
+        self.__address = address
+        self.__onStateChange = onStateChange
+        self.__writer: Optional[StreamWriter] = None
+        self.__draining = False
+        self.__players: Dict[int, 'RemotePlayerHandle'] = {}
+
+    def getAddress(self) -> str:
+        return self.__address
+
+    def isConnected(self) -> bool:
+        return self.__writer is not None
+
+    def isDraining(self) -> bool:
+        return self.__draining
+
+    def start(self) -> None:
+        """Start to connect with the node, can be called from any thread"""
+        self.__loop.call_soon_threadsafe(lambda: self.__loop.create_task(self.__run(), name=f'Player Node {self.__address}'))
+
+    def register(self, playerID: int, player: 'RemotePlayerHandle') -> None:
+        self.__players[playerID] = player
+
+    def unregister(self, playerID: int) -> None:
+        self.__players.pop(playerID, None)
+
+    def send(self, playerID: int, command: VCommands) -> None:
+        """Send the command to the player in the node, can be called from any thread"""
+        if self.__writer is None:
+            raise ConnectionError(f'player node {self.__address} is not connected')
+        self.__loop.call_soon_threadsafe(self.__write, CommandsProtocol.encodeFrame(playerID, command))
+
+    def __write(self, frame: bytes) -> None:
+        if self.__writer is not None:
+            self.__writer.write(frame)
+
+    async def __run(self) -> None:
+        while True:
+            try:
+                reader, writer = await self.__connect()
+            except OSError as e:
+                print(f'[PLAYER NODE {self.__address}] -> Unable to connect: {e}')
+                await sleep(self.RECONNECT_DELAY)
+                continue
+            try:
+                await self.__authenticate(reader, writer)
+            except (IncompleteReadError, OSError, TimeoutError, ValueError) as e:
+                print(f'[PLAYER NODE {self.__address}] -> Unable to authenticate: {e}')
+                writer.close()
+                await sleep(self.RECONNECT_DELAY)
+                continue
+
+            print(f'[PLAYER NODE {self.__address}] -> Connected')
+            self.__writer = writer
+            self.__draining = False
+            self.__onStateChange(self)
+            try:
+                while True:
+                    try:
+                        playerID, command = await CommandsProtocol.readFrame(reader)
+                    except InvalidFrameError as e:
+                        print(f'[PLAYER NODE {self.__address}] -> Ignored frame: {e}')
+                        continue
+                    if playerID == CommandsProtocol.NODE_ID:
+                        self.__receiveNodeCommand(command)
+                        continue
+                    player = self.__players.get(playerID)
+                    # The commands of the players already closed are ignored
+                    if player is not None:
+                        player.notify(command)
+            except (IncompleteReadError, OSError) as e:
+                print(f'[PLAYER NODE {self.__address}] -> Connection lost: {e}')
+            except Exception as e:
+                print(f'[ERROR IN PLAYER NODE {self.__address}] -> {e}')
+
+            # The node kills the players of a lost connection, they are restarted by the supervisor in other nodes,
+            # so this node leaves the ring before the players are notified
+            self.__writer = None
+            writer.close()
+            self.__onStateChange(self)
+            players = list(self.__players.values())
+            self.__players.clear()
+            for player in players:
+                player.nodeLost()
+            await sleep(self.RECONNECT_DELAY)
+
+    def __receiveNodeCommand(self, command: VCommands) -> None:
+        if command.getType() == VCommandsType.DRAINING:
+            print(f'[PLAYER NODE {self.__address}] -> Draining, exiting in at most {command.getArgs():.0f}s')
+            self.__draining = True
+            self.__onStateChange(self)
+
+    async def __authenticate(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Answer the challenge sent by the node, the node closes the connection if the answer is wrong"""
+        playerID, command = await wait_for(CommandsProtocol.readFrame(reader), self.AUTHENTICATION_TIMEOUT)
+        if playerID != CommandsProtocol.NODE_ID or command.getType() != VCommandsType.AUTHENTICATE:
+            raise ValueError(f'expected the authentication challenge, received {command.getType()}')
+        answer = CommandsProtocol.signChallenge(command.getArgs(), VConfigs().PLAYER_NODE_SECRET)
+        writer.write(CommandsProtocol.encodeFrame(CommandsProtocol.NODE_ID, VCommands(VCommandsType.AUTHENTICATE, answer)))
+
+    async def __connect(self):
+        if self.__address.startswith('unix:'):
+            return await open_unix_connection(self.__address[len('unix:'):])
+        host, port = self.__address.rsplit(':', 1)
+        return await open_connection(host, int(port))
+
+
+class RemotePlayerHandle(PlayerHandle):
+    """Player running in a PlayerNode, identified in the node connection by an id unique in this process"""
+    __ids = count(1)
+
+    def __init__(self, node: PlayerNodeConnection, guildName: str, guildID: int, voiceID: int, shardID: int, shardCount: int) -> None:
+        self.__node = node
+        self.__playerID = next(self.__ids)
+        self.__context = (guildName, guildID, voiceID, shardID, shardCount)
+        self.__callback: Callable[[VCommands], None] = None
+        self.__started = False
+        self.__ended = False
+
+    def getName(self) -> str:
+        return f'{self.__context[0]} in {self.__node.getAddress()}'
+
+    def start(self) -> None:
+        if self.__started:
+            return
+        self.__started = True
+        self.__node.register(self.__playerID, self)
+        try:
+            # The node creates the player when receiving the context
+            self.__node.send(self.__playerID, VCommands(VCommandsType.CONTEXT, self.__context))
+        except ConnectionError as e:
+            self.__ended = True
+            print(f'[WARNINGS] -> {e}')
+
+    def isAlive(self) -> bool:
+        return self.__started and not self.__ended and self.__node.isConnected()
+
+    def send(self, command: VCommands) -> None:
+        self.__node.send(self.__playerID, command)
+
+    def listen(self, callback: Callable[[VCommands], None]) -> None:
+        self.__callback = callback
+
+    def notify(self, command: VCommands) -> None:
+        """Called by the node connection with each command of the player"""
+        if command.getType() in (VCommandsType.SLEEPING, VCommandsType.TERMINATE):
+            self.__ended = True
+        if self.__callback is not None:
+            self.__callback(command)
+
+    def nodeLost(self) -> None:
+        """Called by the node connection when it drops, the node kills the player"""
+        if self.__ended:
+            return
+        self.__ended = True
+        if self.__callback is not None:
+            self.__callback(VCommands(VCommandsType.PLAYER_LOST))
+
+    def close(self) -> None:
+        self.__callback = None
+        self.__node.unregister(self.__playerID)
+
+    def kill(self) -> None:
+        self.close()
+        if self.__ended:
+            return
+        self.__ended = True
+        try:
+            # For the node the TERMINATE from the bot means to kill the player
+            self.__node.send(self.__playerID, VCommands(VCommandsType.TERMINATE))
+        except ConnectionError:
+            pass
+
+
+class RemotePlayersHost(AbstractPlayersHost):
+    """
+    Run the players in PlayerNodes of other machines, the guilds are assigned to the connected nodes by
+    consistent hashing of the guild id, so the players of a lost node are recreated in the other nodes
+    The draining nodes are removed from the ring, and their players are handed off by the players manager
+    """
+
+    def __init__(self, loop: AbstractEventLoop, addresses: List[str]) -> None:
+        self.__nodes = {address: PlayerNodeConnection(loop, address, self.__nodeStateChanged) for address in addresses}
+        self.__allNodesRing = ConsistentHashRing(addresses)
+        # The nodes connected and not draining, that receive the new players
+        self.__availableRing = ConsistentHashRing()
+        self.__availableAddresses: Set[str] = set()
+        for node in self.__nodes.values():
+            node.start()
+
+    def getNodes(self) -> List[PlayerNodeConnection]:
+        return list(self.__nodes.values())
+
+    def createPlayer(self, guildName: str, guildID: int, voiceID: int, shardID: int, shardCount: int) -> RemotePlayerHandle:
+        try:
+            address = self.__availableRing.getNode(guildID)
+        except LookupError:
+            # Without an available node the player may fail to start, and is recreated when a node connects
+            address = self.__allNodesRing.getNode(guildID)
+        return RemotePlayerHandle(self.__nodes[address], guildName, guildID, voiceID, shardID, shardCount)
+
+    def canCreatePlayers(self) -> bool:
+        return len(self.__availableAddresses) > 0
+
+    def __nodeStateChanged(self, node: PlayerNodeConnection) -> None:
+        address = node.getAddress()
+        if node.isConnected() and not node.isDraining():
+            if address not in self.__availableAddresses:
+                self.__availableAddresses.add(address)
+                self.__availableRing.addNode(address)
+        elif address in self.__availableAddresses:
+            self.__availableAddresses.remove(address)
+            self.__availableRing.removeNode(address)
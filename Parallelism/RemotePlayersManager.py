@@ -0,0 +1,31 @@
+import atexit
+from secrets import token_hex
+from Config.Configs import VConfigs
+from Music.VulkanBot import VulkanBot
+from Parallelism.AbstractPlayersHost import AbstractPlayersHost
+from Parallelism.PlayerNode import PlayerNode
+from Parallelism.ProcessPlayerManager import ProcessPlayerManager
+from Parallelism.RemotePlayersHost import RemotePlayersHost
+
+
+class RemotePlayersManager(ProcessPlayerManager):
+    """
+    Manage the players like the ProcessPlayerManager, but the player processes run in the PLAYER_NODES
+    Without configured nodes a local node is started, keeping the same path of the commands in a single machine
+    """
+
+    def _createPlayersHost(self, bot: VulkanBot) -> AbstractPlayersHost:
+        # Only the bot listening to the commands connects to the nodes
+        if not bot.listingSlash:
+            return super()._createPlayersHost(bot)
+
+        config = VConfigs()
+        addresses = config.PLAYER_NODES
+        if len(addresses) == 0:
+            addresses = [config.PLAYER_NODE_ADDRESS]
+            # Only this bot uses the local node, so it can protect it with a secret of its own
+            if config.PLAYER_NODE_SECRET == '':
+                config.PLAYER_NODE_SECRET = token_hex(32)
+            process = PlayerNode.startLocalNode(config.PLAYER_NODE_ADDRESS, config.PLAYER_NODE_SECRET)
+            atexit.register(process.kill)
+        return RemotePlayersHost(bot.loop, addresses)
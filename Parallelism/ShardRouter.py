@@ -0,0 +1,27 @@
+from typing import Optional, Tuple
+from discord import Client
+
+
+class ShardRouter:
+    """
+    Find the gateway shard of each guild, Discord sends the events of a guild only to the shard of the guild
+    The player processes connect as the shard of its guild, and each Bot process only creates players for the
+    guilds of the shards it connected, so many Bot processes with different SHARD_IDS split the guilds
+    """
+
+    @classmethod
+    def getShard(cls, bot: Client, guildID: int) -> Tuple[Optional[int], Optional[int]]:
+        """Return the shard id of the guild and the shards quant, both None if the bot is not sharded"""
+        shardCount = bot.shard_count
+        if not shardCount:
+            return None, None
+        return (guildID >> 22) % shardCount, shardCount
+
+    @classmethod
+    def ownsGuild(cls, bot: Client, guildID: int) -> bool:
+        """Return if the guild is in one of the shards connected by this bot"""
+        shardID, _ = cls.getShard(bot, guildID)
+        if shardID is None:
+            return True
+        shardIDs = getattr(bot, 'shard_ids', None)
+        return shardIDs is None or shardID in shardIDs
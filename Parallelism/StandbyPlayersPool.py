@@ -0,0 +1,106 @@
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from threading import Lock, Thread
+from typing import Deque, Optional, Tuple
+from Parallelism.ProcessPlayer import ProcessPlayer
+
+
+class StandbyPlayer:
+    """Store a player process started without a guild and the pipes to send and receive commands"""
+
+    def __init__(self, process: ProcessPlayer, connectionToPlayer: Connection, connectionToMain: Connection) -> None:
+        self.__process = process
+        self.__connectionToPlayer = connectionToPlayer
+        self.__connectionToMain = connectionToMain
+
+    def getProcess(self) -> ProcessPlayer:
+        return self.__process
+
+    def getConnectionToPlayer(self) -> Connection:
+        return self.__connectionToPlayer
+
+    def getConnectionToMain(self) -> Connection:
+        return self.__connectionToMain
+
+
+class StandbyPlayersPool:
+    """
+    Keep a quant of player processes already started and logged in Discord, waiting for a guild assignment
+    Each process taken from the pool is replaced by a new one in background
+    """
+
+    def __init__(self, size: int) -> None:
+        self.__size = size
+        self.__lock = Lock()
+        self.__standbyPlayers: Deque[StandbyPlayer] = deque()
+        self.__createdQuant = 0
+        self.__hits = 0
+        self.__misses = 0
+        Thread(target=self.__replenish, name='Standby Players Replenish', daemon=True).start()
+
+    def take(self) -> Optional[StandbyPlayer]:
+        """Return a running standby player, or None if there is none available"""
+        with self.__lock:
+            standbyPlayer = None
+            while len(self.__standbyPlayers) > 0:
+                candidate = self.__standbyPlayers.popleft()
+                if candidate.getProcess().is_alive():
+                    standbyPlayer = candidate
+                    break
+
+            if standbyPlayer is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+
+        Thread(target=self.__replenish, name='Standby Players Replenish', daemon=True).start()
+        return standbyPlayer
+
+    def close(self) -> None:
+        """Kill the standby processes and stop to replace them"""
+        with self.__lock:
+            self.__size = 0
+            for standbyPlayer in self.__standbyPlayers:
+                process = standbyPlayer.getProcess()
+                if process.is_alive():
+                    process.kill()
+            self.__standbyPlayers.clear()
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    def getHitRate(self) -> float:
+        """Fraction of the players created that used a standby process, 0 if none was created yet"""
+        total = self.__hits + self.__misses
+        if total == 0:
+            return 0.0
+        return self.__hits / total
+
+    def getStats(self) -> Tuple[int, int, float]:
+        return (self.__hits, self.__misses, self.getHitRate())
+
+    def __replenish(self) -> None:
+        """Start processes until the pool is full again, discarding the ones that died"""
+        try:
+            while True:
+                with self.__lock:
+                    self.__standbyPlayers = deque(standby for standby in self.__standbyPlayers
+                                                  if standby.getProcess().is_alive())
+                    if len(self.__standbyPlayers) >= self.__size:
+                        return
+                    standbyPlayer = self.__createStandbyPlayer()
+                    self.__standbyPlayers.append(standbyPlayer)
+        except Exception as e:
+            print(f'[ERROR REPLENISHING STANDBY PLAYERS] -> {e}')
+
+    def __createStandbyPlayer(self) -> StandbyPlayer:
+        connectionToReceive, connectionToPlayer = Pipe(duplex=False)
+        connectionToMain, connectionToSend = Pipe(duplex=False)
+        self.__createdQuant += 1
+        process = ProcessPlayer.standby(f'Standby {self.__createdQuant}', connectionToReceive, connectionToSend)
+        process.start()
+        return StandbyPlayer(process, connectionToPlayer, connectionToMain)
@@ -5,14 +5,18 @@ from discord import PCMVolumeTransformer, VoiceClient
 from asyncio import AbstractEventLoop
 from threading import RLock, Thread
 from multiprocessing import Lock
-from typing import Callable
-from discord import Guild, FFmpegPCMAudio, VoiceChannel
+from typing import Callable, Optional
+from discord import Guild, VoiceChannel
 from Music.Playlist import Playlist
 from Music.Song import Song
+from Music.SongAudioSource import SongAudioSource
+from Music.PositionTrackedSource import PositionTrackedSource
 from Config.Configs import VConfigs
+from Config.Exceptions import DownloadingError
 from Music.VulkanBot import VulkanBot
 from Music.Downloader import Downloader
 from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.PlayerSupervisor import PlayerHeartbeat, VoiceState
 
 
 class TimeoutClock:
@@ -29,7 +33,10 @@ class TimeoutClock:
 
 
 class ThreadPlayer(Thread):
-    """Player Thread to control the song playback in the same Process of the Main Process"""
+    """
+    Player Thread to control the song playback in the same Process of the Main Process
+    The manager reads the heartbeat of the player periodically, the unhealthy players are abandoned and replaced
+    """
 
     def __init__(self, bot: VulkanBot, guild: Guild, name: str, voiceChannel: VoiceChannel, playlist: Playlist, lock: Lock, guildID: int, voiceID: int, callbackToSendCommand: Callable, exitCB: Callable) -> None:
         Thread.__init__(self, name=name, group=None, target=None, args=(), kwargs={})
@@ -56,6 +63,11 @@ class ThreadPlayer(Thread):
 
         self.__playing = False
         self.__forceStop = False
+        # The abandoned player was replaced by another one, it must not play the next songs
+        self.__abandoned = False
+        self.__songPlaying: Song = None
+        # Source of the song playing, that gives the position to continue the song after a reset
+        self.__songSource: PositionTrackedSource = None
         self.FFMPEG_OPTIONS = {'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
                                'options': '-vn'}
 
@@ -76,11 +88,11 @@ class ThreadPlayer(Thread):
 
             volume = volume / 100
 
+            self.__songVolumeUsing = volume
             if not self.__currentSongChangeVolume:
-                print('[THREAD ERROR] -> Cannot change the volume of this song')
+                # The Opus frames are sent without decoding, so the volume is only used from the next song
+                print('[THREAD PLAYER] -> The volume will be changed from the next song')
                 return
-            
-            self.__songVolumeUsing = volume
             self.__voiceClient.source.volume = volume
         except Exception as e:
             print(e)
@@ -105,14 +117,17 @@ class ThreadPlayer(Thread):
                 await self.__playSong(song)
                 self.__playing = True
 
-    async def __playSong(self, song: Song) -> None:
-        """Function that will trigger the player to play the song"""
+    async def __playSong(self, song: Song, position: float = 0.0) -> None:
+        """Function that will trigger the player to play the song, from the position in seconds"""
         try:
             self.__playerLock.acquire()
             if song is None:
                 return
 
+            # Songs restored from the stored playlists only have the metadata, the source is resolved now
             if song.source is None:
+                song = await self.__downloadSongAgain(song)
+            if song is None or song.source is None:
                 return self.__playNext(None)
 
             # If not connected, connect to bind channel
@@ -132,12 +147,15 @@ class ThreadPlayer(Thread):
             songStillAvailable = self.__verifyIfSongAvailable(song)
             if not songStillAvailable:
                 print('[THREAD PLAYER -> SONG NOT AVAILABLE ANYMORE, DOWNLOADING AGAIN]')
-                song = self.__downloadSongAgain(song)
+                song = await self.__downloadSongAgain(song)
+                if song is None or song.source is None:
+                    return self.__playNext('Song could not be downloaded again')
 
             self.__playing = True
             self.__songPlaying = song
 
-            player = FFmpegPCMAudio(song.source, **self.FFMPEG_OPTIONS)
+            player = SongAudioSource.create(song, self.__getFFmpegOptions(position), self.__songVolumeUsing)
+            player = self.__songSource = PositionTrackedSource(player, position)
             if not player.is_opus():
                 player = PCMVolumeTransformer(player, self.__songVolumeUsing)
                 self.__currentSongChangeVolume = True
@@ -146,8 +164,10 @@ class ThreadPlayer(Thread):
             self.__timer.cancel()
             self.__timer = TimeoutClock(self.__timeoutHandler, self.__loop)
 
-            nowPlayingCommand = VCommands(VCommandsType.NOW_PLAYING, song)
-            await self.__callback(nowPlayingCommand, self.__guild, song)
+            # A song continued from a position was already shown
+            if position == 0:
+                nowPlayingCommand = VCommands(VCommandsType.NOW_PLAYING, song)
+                await self.__callback(nowPlayingCommand, self.__guild, song)
         except Exception as e:
             print(f'[THREAD PLAYER -> ERROR IN PLAY SONG FUNCTION] -> {e}, {type(e)}')
             self.__playNext(None)
@@ -160,6 +180,8 @@ class ThreadPlayer(Thread):
         with self.__playlistLock:
             with self.__playerLock:
                 self.__currentSongChangeVolume = False
+                if self.__abandoned:
+                    return None
                 if self.__forceStop:  # If it's forced to stop player
                     self.__forceStop = False
                     return None
@@ -196,9 +218,28 @@ class ThreadPlayer(Thread):
             print(f'[THREAD PLAYER -> ERROR VERIFYING SONG AVAILABILITY] -> {e}')
             return False
 
-    def __downloadSongAgain(self, song: Song) -> Song:
+    async def __downloadSongAgain(self, song: Song) -> Optional[Song]:
         """Force a download to be executed again, one use case is when the song.source expired and needs to refresh"""
-        return self.__downloader.finish_one_song(song)
+        # The download runs in a thread to not stop the loop shared with the Bot, the song is finished in the loop
+        try:
+            return await self.__downloader.finish_one_song_async(song)
+        except DownloadingError as e:
+            print(f'[THREAD PLAYER -> ERROR DOWNLOADING SONG AGAIN] -> {e}')
+            return None
+
+    def getSongPosition(self) -> float:
+        """Seconds of the song playing already sent, also after the voice connection dropped"""
+        if self.__songSource is None:
+            return 0.0
+        return self.__songSource.position
+
+    def __getFFmpegOptions(self, position: float) -> dict:
+        if position <= 0:
+            return self.FFMPEG_OPTIONS
+        # With the -ss before the input ffmpeg seeks in the stream, instead of decoding and discarding until it
+        options = dict(self.FFMPEG_OPTIONS)
+        options['before_options'] = f'-ss {position:.2f} {options["before_options"]}'
+        return options
 
     async def __playPrev(self, voiceChannelID: int) -> None:
         with self.__playlistLock:
@@ -222,13 +263,52 @@ class ThreadPlayer(Thread):
                     self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
 
     async def __restartCurrentSong(self) -> None:
-        song = self.__playlist.getCurrentSong()
+        # The song that was playing continues from the position it reached
+        if self.__songPlaying is not None:
+            song, position = self.__songPlaying, self.getSongPosition()
+        else:
+            song, position = self.__playlist.getCurrentSong(), 0.0
         if song is None:
             song = self.__playlist.next_song()
         if song is None:
             return
 
-        self.__loop.create_task(self.__playSong(song), name=f'Song {song.identifier}')
+        self.__loop.create_task(self.__playSong(song, position), name=f'Song {song.identifier}')
+
+    def getHeartbeat(self) -> PlayerHeartbeat:
+        """Health of the player, the loop lag is not measured because the loop is the same of the Bot"""
+        voiceState = self.__getVoiceState()
+        voiceChannelID = self.__voiceChannelID
+        songID = position = None
+        if voiceState != VoiceState.DISCONNECTED:
+            # The bot may have been moved to another channel
+            voiceChannelID = self.__voiceClient.channel.id
+        if voiceState in (VoiceState.PLAYING, VoiceState.PAUSED) and self.__songPlaying is not None:
+            songID = self.__songPlaying.songID
+            position = self.getSongPosition()
+        return PlayerHeartbeat(0.0, voiceState, voiceChannelID, songID, position)
+
+    def isSongExpected(self) -> bool:
+        """Returns if the player should be playing a song"""
+        return self.__playing and self.__songPlaying is not None
+
+    def getSongPlaying(self) -> Optional[Song]:
+        return self.__songPlaying
+
+    def abandon(self) -> None:
+        """Called when the player is replaced, the voice connection is taken by the new player"""
+        with self.__playerLock:
+            self.__abandoned = True
+            self.__timer.cancel()
+
+    def __getVoiceState(self) -> VoiceState:
+        if self.__voiceClient is None or not self.__voiceClient.is_connected():
+            return VoiceState.DISCONNECTED
+        if self.__voiceClient.is_paused():
+            return VoiceState.PAUSED
+        if self.__voiceClient.is_playing():
+            return VoiceState.PLAYING
+        return VoiceState.CONNECTED
 
     async def receiveCommand(self, command: VCommands) -> None:
         try:
@@ -244,6 +324,9 @@ class ThreadPlayer(Thread):
                 await self.__skip()
             elif type == VCommandsType.PLAY:
                 await self.__playPlaylistSongs()
+            elif type == VCommandsType.PLAY_AT:
+                song, position = args
+                self.__loop.create_task(self.__playSong(song, position), name=f'Song {song.identifier}')
             elif type == VCommandsType.PREV:
                 await self.__playPrev(args)
             elif type == VCommandsType.RESET:
@@ -300,7 +383,7 @@ class ThreadPlayer(Thread):
                     return self.__voiceClient.resume()
                 # If there is a current song but the voice client is not playing
                 elif self.__songPlaying is not None and not self.__voiceClient.is_playing():
-                    await self.__playSong(self.__songPlaying)
+                    await self.__playSong(self.__songPlaying, self.getSongPosition())
 
     async def __skip(self) -> None:
         self.__playing = self.__verifyIfIsPlaying()
@@ -310,7 +393,7 @@ class ThreadPlayer(Thread):
                 self.__playing = False
                 self.__voiceClient.stop()
             # If for some reason the Bot has disconnect but there is still songs to play
-            elif len(self.__playlist.getSongs()) > 0:
+            elif self.__playlist.getQueueLength() > 0:
                 print('[THREAD PLAYER -> RESTARTING CURRENT SONG]')
                 await self.__restartCurrentSong()
 
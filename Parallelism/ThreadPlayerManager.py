@@ -1,5 +1,6 @@
 from threading import RLock
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
+from Config.Configs import VConfigs
 from Config.Singleton import Singleton
 from discord import Guild, Interaction, TextChannel
 from discord.ext.commands import Context
@@ -9,6 +10,13 @@ from Music.Playlist import Playlist
 from Parallelism.Commands import VCommands, VCommandsType
 from Music.VulkanBot import VulkanBot
 from Parallelism.ProcessExecutor import ProcessCommandsExecutor
+from Parallelism.PlaylistWatcher import PlaylistWatcher
+from Parallelism.PlayerLock import PlayerLock
+from Parallelism.PlayerSupervisor import PlayerSupervisor
+from Parallelism.ShardRouter import ShardRouter
+from Parallelism.PlaylistSnapshotter import PlaylistSnapshotter
+from Parallelism.GuildPlaylists import GuildPlaylists
+from Music.PlaylistStore import PlaylistStore
 from Parallelism.ThreadPlayer import ThreadPlayer
 
 
@@ -17,10 +25,10 @@ class ThreadPlayerInfo:
     Class to store the reference to all structures to maintain a player thread
     """
 
-    def __init__(self, thread: ThreadPlayer, playlist: Playlist, lock: RLock, textChannel: TextChannel) -> None:
+    def __init__(self, thread: ThreadPlayer, playlist: Playlist, playerLock: PlayerLock, textChannel: TextChannel) -> None:
         self.__thread = thread
         self.__playlist = playlist
-        self.__lock = lock
+        self.__playerLock = playerLock
         self.__textChannel = textChannel
 
     def getPlayer(self) -> ThreadPlayer:
@@ -30,7 +38,10 @@ class ThreadPlayerInfo:
         return self.__playlist
 
     def getLock(self) -> RLock:
-        return self.__lock
+        return self.__playerLock.getLock()
+
+    def getPlayerLock(self) -> PlayerLock:
+        return self.__playerLock
 
     def getTextChannel(self) -> TextChannel:
         return self.__textChannel
@@ -39,12 +50,23 @@ class ThreadPlayerInfo:
 class ThreadPlayerManager(Singleton, AbstractPlayersManager):
     """
     Manage all running player threads, creating and storing them for future calls
+    The threads use the voice connection of the Bot shard of the guild, only guilds of this Bot shards are played
+    The heartbeats of the players are read in each PLAYER_HEARTBEAT_INTERVAL and given to the PlayerSupervisor,
+    an unhealthy player is abandoned and a new one continues its song with the same Playlist and lock
     """
 
     def __init__(self, bot: VulkanBot = None) -> None:
         if not super().created:
             self.__bot = bot
             self.__playersThreads: Dict[int, ThreadPlayerInfo] = {}
+            self.__supervisor: PlayerSupervisor = None
+            # The heartbeats of the threads are read in the bot loop
+            if bot is not None:
+                self.__supervisor = PlayerSupervisor(bot.loop, self.__restartUnhealthyPlayer)
+                bot.loop.call_soon_threadsafe(self.__scheduleHeartbeats)
+            self.__playlistWatcher = PlaylistWatcher()
+            self.__guildPlaylists = GuildPlaylists(PlaylistStore())
+            PlaylistSnapshotter(self).start()
 
     async def sendCommandToPlayer(self, command: VCommands, guild: Guild, context: Union[Context, Interaction], forceCreation: bool = False):
         playerInfo = self.__playersThreads[guild.id]
@@ -69,22 +91,29 @@ class ThreadPlayerManager(Singleton, AbstractPlayersManager):
         if playerInfo:
             return playerInfo.getPlaylist()
 
-    def getPlayerLock(self, guild: Guild) -> RLock:
+    def getPlayerLock(self, guild: Guild) -> PlayerLock:
         playerInfo = self.__getRunningPlayerInfo(guild)
         if playerInfo:
-            return playerInfo.getLock()
+            return playerInfo.getPlayerLock()
+
+    def getPlayersPlaylists(self) -> Dict[int, Tuple[Playlist, RLock]]:
+        return {guildID: (info.getPlaylist(), info.getLock()) for guildID, info in list(self.__playersThreads.items())}
 
     def verifyIfPlayerExists(self, guild: Guild) -> bool:
         return guild.id in self.__playersThreads.keys()
 
     def createPlayerForGuild(self, guild: Guild, context: Union[Context, Interaction]):
         try:
+            if not ShardRouter.ownsGuild(self.__bot, guild.id):
+                print(f'[THREAD MANAGER] -> Guild {guild.id} is not in the shards of this Bot')
+                return None
+
             if guild.id not in self.__playersThreads.keys():
-                self.__playersThreads[guild.id] = self.__createPlayerThreadInfo(context)
+                self.__setPlayerInfo(guild.id, self.__createPlayerThreadInfo(context))
             else:
                 # If the thread has ended create a new one
                 if not self.__playersThreads[guild.id].getPlayer().is_alive():
-                    self.__playersThreads[guild.id] = self.__recreateThread(guild, context)
+                    self.__setPlayerInfo(guild.id, self.__recreateThread(guild, context))
 
             return self.__playersThreads[guild.id]
         except Exception as e:
@@ -94,13 +123,9 @@ class ThreadPlayerManager(Singleton, AbstractPlayersManager):
         if guild.id not in self.__playersThreads.keys():
             return None
 
-        # Recreate the thread keeping the playlist
-        newPlayerInfo = self.__recreateThread(guild, context)
-        newPlayerInfo.getPlayer().start()
-        # Send a command to start the play again
-        playCommand = VCommands(VCommandsType.PLAY)
-        newPlayerInfo.getQueueToPlayer().put(playCommand)
-        self.__playersThreads[guild.id] = newPlayerInfo
+        # Recreate the thread keeping the playlist, the new one continues the song of the old one
+        playerInfo = self.__playersThreads[guild.id]
+        self.__bot.loop.create_task(self.__replaceThread(guild.id, playerInfo, context.channel))
 
     def __getRunningPlayerInfo(self, guild: Guild) -> ThreadPlayerInfo:
         if guild.id not in self.__playersThreads.keys():
@@ -118,11 +143,11 @@ class ThreadPlayerManager(Singleton, AbstractPlayersManager):
 
         voiceChannel = context.author.voice.channel
 
-        playlist = Playlist()
-        lock = RLock()
+        playlist = self.__guildPlaylists.get(guildID)
+        playerLock = PlayerLock(RLock())
         player = ThreadPlayer(self.__bot, context.guild, context.guild.name,
-                              voiceChannel, playlist, lock, guildID, voiceID, self.__receiveCommand, self.__deleteThread)
-        playerInfo = ThreadPlayerInfo(player, playlist, lock, context.channel)
+                              voiceChannel, playlist, playerLock.getLock(), guildID, voiceID, self.__receiveCommand, self.__deleteThread)
+        playerInfo = ThreadPlayerInfo(player, playlist, playerLock, context.channel)
         player.start()
 
         return playerInfo
@@ -134,7 +159,10 @@ class ThreadPlayerManager(Singleton, AbstractPlayersManager):
         if playerInfo:
             thread = playerInfo.getPlayer()
             self.__playersThreads.pop(guild.id)
+            self.__supervisor.unwatch((guild.id, playerInfo))
+            self.__guildPlaylists.remove(guild.id)
             del thread
+        self.__playlistWatcher.notify(guild.id)
 
     def __recreateThread(self, guild: Guild, context: Union[Context, Interaction]) -> ThreadPlayerInfo:
         self.__stopPossiblyRunningProcess(guild)
@@ -146,16 +174,79 @@ class ThreadPlayerManager(Singleton, AbstractPlayersManager):
             voiceID: int = context.author.voice.channel.id
         voiceChannel = context.author.voice.channel
 
-        playlist = self.__playersThreads[guildID].getPlaylist()
-        lock = RLock()
+        oldPlayerInfo = self.__playersThreads[guildID]
+        playlist = oldPlayerInfo.getPlaylist()
+        # The lock is kept, the handlers may be waiting for it
+        playerLock = oldPlayerInfo.getPlayerLock()
         player = ThreadPlayer(self.__bot, context.guild, context.guild.name,
-                              voiceChannel, playlist, lock, guildID, voiceID, self.__receiveCommand, self.__deleteThread)
-        playerInfo = ThreadPlayerInfo(player, playlist, lock, context.channel)
+                              voiceChannel, playlist, playerLock.getLock(), guildID, voiceID, self.__receiveCommand, self.__deleteThread)
+        playerInfo = ThreadPlayerInfo(player, playlist, playerLock, context.channel)
         player.start()
 
         return playerInfo
 
+    def __setPlayerInfo(self, guildID: int, playerInfo: ThreadPlayerInfo) -> None:
+        """Store the player of the guild, the supervisor stops watching the previous one"""
+        oldPlayerInfo = self.__playersThreads.get(guildID)
+        if oldPlayerInfo is not None:
+            self.__supervisor.unwatch((guildID, oldPlayerInfo))
+        self.__playersThreads[guildID] = playerInfo
+        self.__supervisor.watch((guildID, playerInfo), guildID)
+
+    def __scheduleHeartbeats(self) -> None:
+        self.__bot.loop.call_later(VConfigs().PLAYER_HEARTBEAT_INTERVAL, self.__readHeartbeats)
+
+    def __readHeartbeats(self) -> None:
+        """The threads run in the bot loop, so the manager reads the heartbeats instead of receiving them"""
+        try:
+            for guildID, playerInfo in list(self.__playersThreads.items()):
+                player = playerInfo.getPlayer()
+                self.__supervisor.beat((guildID, playerInfo), player.getHeartbeat(), player.isSongExpected())
+        except Exception as e:
+            print(f'[ERROR READING THREAD PLAYERS HEARTBEATS] -> {e}')
+        finally:
+            self.__scheduleHeartbeats()
+
+    def __restartUnhealthyPlayer(self, key: Tuple[int, ThreadPlayerInfo], reason: str) -> None:
+        """Called by the supervisor in the bot loop, replace the player keeping the Playlist and the song"""
+        guildID, playerInfo = key
+        if self.__playersThreads.get(guildID) is not playerInfo:
+            return
+
+        print(f'[THREAD MANAGER] -> Restarting the player of guild {guildID}: {reason}')
+        self.__bot.loop.create_task(self.__replaceThread(guildID, playerInfo, playerInfo.getTextChannel()))
+
+    async def __replaceThread(self, guildID: int, oldPlayerInfo: ThreadPlayerInfo, textChannel: TextChannel) -> None:
+        """Abandon the player and create a new one that continues the song from the position it reached"""
+        oldPlayer = oldPlayerInfo.getPlayer()
+        heartbeat = oldPlayer.getHeartbeat()
+        song, position = oldPlayer.getSongPlaying(), oldPlayer.getSongPosition()
+        songExpected = oldPlayer.isSongExpected()
+        oldPlayer.abandon()
+
+        guild = self.__bot.get_guild(guildID)
+        if guild is None:
+            return
+        voiceID = heartbeat.voiceChannelID
+        playlist = oldPlayerInfo.getPlaylist()
+        playerLock = oldPlayerInfo.getPlayerLock()
+        player = ThreadPlayer(self.__bot, guild, guild.name, guild.get_channel(voiceID), playlist, playerLock.getLock(),
+                              guildID, voiceID, self.__receiveCommand, self.__deleteThread)
+        playerInfo = ThreadPlayerInfo(player, playlist, playerLock, textChannel)
+        self.__setPlayerInfo(guildID, playerInfo)
+        player.start()
+
+        if song is not None and songExpected:
+            print(f'[THREAD MANAGER] -> Continuing the song of guild {guildID} from {position:.0f}s')
+            await player.receiveCommand(VCommands(VCommandsType.PLAY_AT, (song, position)))
+        else:
+            await player.receiveCommand(VCommands(VCommandsType.PLAY))
+
+    async def waitPlaylistChange(self, guild: Guild, timeout: float) -> bool:
+        return await self.__playlistWatcher.wait(guild.id, timeout)
+
     async def showNowPlaying(self, guild: Guild, song: Song) -> None:
+        self.__playlistWatcher.notify(guild.id)
         processInfo = self.__playersThreads[guild.id]
         playlist = processInfo.getPlaylist()
         txtChannel = processInfo.getTextChannel()
@@ -0,0 +1,354 @@
+import asyncio
+from time import sleep
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from Config.Configs import VConfigs
+from Tests.TestBase import VulkanTesterBase
+from Music.Playlist import Playlist
+from Music.Song import Song
+from Music.SongAudioSource import SongAudioSource
+from Parallelism.Commands import VCommands, VCommandsType
+from Parallelism.CommandsProtocol import CommandsProtocol, InvalidFrameError
+from Parallelism.ConsistentHashRing import ConsistentHashRing
+from Parallelism.GuildPlaylists import GuildPlaylists
+from Parallelism.PlayerLock import PlayerLock
+from Parallelism.PlayerNode import PlayerNode
+from Parallelism.PlayerSupervisor import PlayerHeartbeat, PlayerSupervisor, VoiceState
+
+
+class FakePlaylistStore:
+    """Return each snapshot only once, like the PlaylistStore"""
+
+    def __init__(self, snapshots: Dict[int, dict]) -> None:
+        self.__snapshots = snapshots
+
+    def loadSnapshot(self, guildID: int) -> Optional[dict]:
+        return self.__snapshots.pop(guildID, None)
+
+
+class VulkanParallelismTest(VulkanTesterBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__config = VConfigs()
+        self.__startGrace = self.__config.PLAYER_START_GRACE
+        self.__restartBackoff = self.__config.PLAYER_RESTART_BACKOFF
+
+    def _tearDown(self) -> None:
+        super()._tearDown()
+        self.__config.PLAYER_START_GRACE = self.__startGrace
+        self.__config.PLAYER_RESTART_BACKOFF = self.__restartBackoff
+
+    def _createSong(self, codec: Optional[str] = 'opus') -> Song:
+        song = Song('Song Identifier', None, 'Requester')
+        song.finish_down({'url': 'url', 'title': 'Song Title', 'duration': 120, 'webpage_url': 'webpage url',
+                          'original_url': 'original url', 'channel': 'channel', 'id': 'id', 'uploader': 'uploader',
+                          'thumbnail': 'thumbnail', 'acodec': codec})
+        return song
+
+    def _roundTrip(self, command: VCommands) -> VCommands:
+        return CommandsProtocol.decode(CommandsProtocol.encode(command))
+
+    def _createSupervisor(self, startGrace: float = 0, restartBackoff: float = 0) -> Tuple[PlayerSupervisor, List[Tuple[int, str]]]:
+        self.__config.PLAYER_START_GRACE = startGrace
+        self.__config.PLAYER_RESTART_BACKOFF = restartBackoff
+        restarts: List[Tuple[int, str]] = []
+        supervisor = PlayerSupervisor(self._runner.loop, lambda key, reason: restarts.append((key, reason)))
+        supervisor.watch(1)
+        return supervisor, restarts
+
+    def _heartbeat(self, voiceState: VoiceState, position: Optional[float], loopLag: float = 0.0) -> PlayerHeartbeat:
+        songID = None if position is None else 10
+        return PlayerHeartbeat(loopLag, voiceState, 20, songID, position)
+
+    def test_protocolSongFields(self) -> bool:
+        # Fails when a field is added to the Song but not to the protocol
+        song = self._createSong()
+        decoded = self._roundTrip(VCommands(VCommandsType.PLAY, song)).getArgs()
+        return decoded.__getstate__() == song.__getstate__()
+
+    def test_protocolRoundTrip(self) -> bool:
+        song = self._createSong()
+        prev = self._roundTrip(VCommands(VCommandsType.PREV, (30, song))).getArgs()
+        if prev[0] != 30 or prev[1].songID != song.songID:
+            return False
+
+        songAt, position = self._roundTrip(VCommands(VCommandsType.PLAY_AT, (song, 42.5))).getArgs()
+        if songAt.songID != song.songID or position != 42.5:
+            return False
+
+        if self._roundTrip(VCommands(VCommandsType.PLAY)).getArgs() is not None:
+            return False
+        if self._roundTrip(VCommands(VCommandsType.NOW_PLAYING, song)).getArgs() != song.songID:
+            return False
+
+        context = ('Guild', 1, 2, None, None)
+        if self._roundTrip(VCommands(VCommandsType.CONTEXT, context)).getArgs() != context:
+            return False
+        context = ('Guild', 1, 2, 3, 4)
+        if self._roundTrip(VCommands(VCommandsType.CONTEXT, context)).getArgs() != context:
+            return False
+
+        heartbeat = self._roundTrip(VCommands(VCommandsType.HEARTBEAT, self._heartbeat(VoiceState.PLAYING, 7.5, 0.25))).getArgs()
+        if (heartbeat.loopLag, heartbeat.voiceState, heartbeat.voiceChannelID, heartbeat.songID, heartbeat.position) != \
+                (0.25, VoiceState.PLAYING, 20, 10, 7.5):
+            return False
+        heartbeat = self._roundTrip(VCommands(VCommandsType.HEARTBEAT, self._heartbeat(VoiceState.CONNECTED, None))).getArgs()
+        if heartbeat.songID is not None or heartbeat.position is not None:
+            return False
+
+        answer = CommandsProtocol.signChallenge('challenge', 'secret')
+        return self._roundTrip(VCommands(VCommandsType.AUTHENTICATE, answer)).getArgs() == answer and \
+            self._roundTrip(VCommands(VCommandsType.VOLUME, 0.5)).getArgs() == 0.5 and \
+            self._roundTrip(VCommands(VCommandsType.TERMINATE)).getType() == VCommandsType.TERMINATE
+
+    def test_protocolRejectsInvalidMessages(self) -> bool:
+        message = bytearray(CommandsProtocol.encode(VCommands(VCommandsType.VOLUME, 0.5)))
+        heartbeat = bytearray(CommandsProtocol.encode(VCommands(VCommandsType.HEARTBEAT, self._heartbeat(VoiceState.PLAYING, 1.0))))
+        # The args are smaller than the command needs, or the voice state doesn't exist
+        heartbeat[8 + 6] = 255
+        invalidMessages = [bytes([CommandsProtocol.VERSION + 1]) + message[1:],
+                           message[:1] + bytes([255]) + message[2:],
+                           message[:-1],
+                           message[:3],
+                           message[:2] + (3).to_bytes(4, 'big') + message[6:9],
+                           heartbeat]
+        for invalid in invalidMessages:
+            try:
+                CommandsProtocol.decode(bytes(invalid))
+                return False
+            except ValueError:
+                pass
+        return True
+
+    def test_protocolFrames(self) -> bool:
+        async def readFrames() -> bool:
+            reader = asyncio.StreamReader()
+            invalid = CommandsProtocol.encode(VCommands(VCommandsType.VOLUME, 0.5))[:-1]
+            reader.feed_data((5).to_bytes(8, 'big') + len(invalid).to_bytes(4, 'big') + invalid)
+            reader.feed_data(CommandsProtocol.encodeFrame(5, VCommands(VCommandsType.VOLUME, 0.5)))
+            reader.feed_data(bytes(8) + (CommandsProtocol.MAX_FRAME_SIZE + 1).to_bytes(4, 'big'))
+            # The invalid frame is consumed, so the next one can be read
+            try:
+                await CommandsProtocol.readFrame(reader)
+                return False
+            except InvalidFrameError as e:
+                if e.playerID != 5:
+                    return False
+            playerID, command = await CommandsProtocol.readFrame(reader)
+            if playerID != 5 or command.getArgs() != 0.5:
+                return False
+            try:
+                await CommandsProtocol.readFrame(reader)
+                return False
+            except ValueError:
+                return True
+
+        return self._runner.run_coroutine(readFrames())
+
+    def test_playerNodeNeedsSecret(self) -> bool:
+        # The nodes in TCP addresses refuse to start without a secret
+        try:
+            PlayerNode('localhost:0', '').run()
+            return False
+        except ValueError:
+            return True
+
+    def test_hashRingAssignment(self) -> bool:
+        ring = ConsistentHashRing(['node A', 'node B', 'node C'])
+        assignments = {guildID: ring.getNode(guildID) for guildID in range(3000)}
+        # The same ring must assign the guilds in the same way
+        if any(ConsistentHashRing(['node C', 'node A', 'node B']).getNode(guildID) != node
+               for guildID, node in assignments.items()):
+            return False
+        # Every node receives a reasonable part of the guilds
+        return all(list(assignments.values()).count(node) > 500 for node in ['node A', 'node B', 'node C'])
+
+    def test_hashRingRemoveNode(self) -> bool:
+        ring = ConsistentHashRing(['node A', 'node B', 'node C'])
+        before = {guildID: ring.getNode(guildID) for guildID in range(3000)}
+        ring.removeNode('node B')
+        for guildID, node in before.items():
+            after = ring.getNode(guildID)
+            # Only the guilds of the removed node are moved
+            if after == 'node B' or (node != 'node B' and after != node):
+                return False
+
+        ring.removeNode('node A')
+        ring.removeNode('node C')
+        try:
+            ring.getNode(1)
+            return False
+        except LookupError:
+            return True
+
+    def test_supervisorLoopLag(self) -> bool:
+        supervisor, restarts = self._createSupervisor()
+        heartbeat = self._heartbeat(VoiceState.CONNECTED, None, VConfigs().PLAYER_MAX_LOOP_LAG + 1)
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT):
+            supervisor.beat(1, heartbeat, False)
+        return restarts == [(1, 'loop lag')] and supervisor.getHealth(1) is None
+
+    def test_supervisorSongNotPlaying(self) -> bool:
+        supervisor, restarts = self._createSupervisor()
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT - 1):
+            supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        # A healthy heartbeat resets the count
+        supervisor.beat(1, self._heartbeat(VoiceState.PLAYING, 1.0), True)
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT - 1):
+            supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        if restarts != []:
+            return False
+
+        supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        return restarts == [(1, 'song not playing')]
+
+    def test_supervisorStartGrace(self) -> bool:
+        supervisor, restarts = self._createSupervisor(startGrace=0.2)
+        # The new player is still connecting and resolving the song
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT + 1):
+            supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        sleep(0.1)
+        # The grace is counted again from the last song played
+        supervisor.beat(1, self._heartbeat(VoiceState.PLAYING, 1.0), True)
+        sleep(0.15)
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT + 1):
+            supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        if restarts != []:
+            return False
+
+        sleep(0.1)
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT):
+            supervisor.beat(1, self._heartbeat(VoiceState.CONNECTED, None), True)
+        return restarts == [(1, 'song not playing')]
+
+    def test_supervisorRestartBackoff(self) -> bool:
+        async def restartGuild() -> bool:
+            supervisor, restarts = self._createSupervisor(restartBackoff=0.1)
+            # The players of the guild 5 are restarted again and again, the first restart is not delayed
+            supervisor.watch(2, 5)
+            supervisor.fail(2, 'player lost')
+            supervisor.watch(3, 5)
+            supervisor.fail(3, 'player lost')
+            # Other guilds are not delayed
+            supervisor.fail(1, 'player lost')
+            if restarts != [(2, 'player lost'), (1, 'player lost')]:
+                return False
+            await asyncio.sleep(0.15)
+            if restarts[-1] != (3, 'player lost'):
+                return False
+
+            # The third restart waits the double
+            supervisor.watch(4, 5)
+            supervisor.fail(4, 'player lost')
+            await asyncio.sleep(0.15)
+            if len(restarts) != 3:
+                return False
+            await asyncio.sleep(0.1)
+            if restarts[-1] != (4, 'player lost'):
+                return False
+
+            # Playing a song forgets the restarts of the guild
+            supervisor.watch(6, 5)
+            supervisor.beat(6, self._heartbeat(VoiceState.PLAYING, 1.0), True)
+            supervisor.fail(6, 'player lost')
+            return restarts[-1] == (6, 'player lost')
+
+        return self._runner.run_coroutine(restartGuild())
+
+    def test_supervisorSongStalled(self) -> bool:
+        supervisor, restarts = self._createSupervisor()
+        for position in range(10):
+            supervisor.beat(1, self._heartbeat(VoiceState.PLAYING, float(position)), True)
+        # The paused songs are not moving, but they are healthy
+        for _ in range(10):
+            supervisor.beat(1, self._heartbeat(VoiceState.PAUSED, 9.0), True)
+        if restarts != []:
+            return False
+
+        for _ in range(PlayerSupervisor.UNHEALTHY_BEATS_LIMIT + 1):
+            supervisor.beat(1, self._heartbeat(VoiceState.PLAYING, 9.0), True)
+        return restarts == [(1, 'song stalled')] and supervisor.getRestarts() == {'song stalled': 1}
+
+    def test_supervisorFail(self) -> bool:
+        supervisor, restarts = self._createSupervisor()
+        supervisor.fail(1, 'player lost')
+        # The player is restarted only once, the unwatched players are ignored
+        supervisor.fail(1, 'player lost')
+        supervisor.fail(2, 'player lost')
+        return restarts == [(1, 'player lost')]
+
+    def test_audioSourceCodec(self) -> bool:
+        passthrough = VConfigs().OPUS_PASSTHROUGH
+        if SongAudioSource.canPassthrough(self._createSong('opus'), 1) != passthrough:
+            return False
+        # The volume can only be changed in the PCM frames
+        return not SongAudioSource.canPassthrough(self._createSong('opus'), 0.5) and \
+            not SongAudioSource.canPassthrough(self._createSong('mp4a.40.2'), 1) and \
+            not SongAudioSource.canPassthrough(self._createSong(None), 1)
+
+    def test_guildPlaylistsRestore(self) -> bool:
+        saved = Playlist()
+        for x in range(5):
+            saved.add_song(Song(f'Song {x}', saved, ''))
+        guildPlaylists = GuildPlaylists(FakePlaylistStore({1: saved.exportState()}))
+
+        playlist = guildPlaylists.get(1)
+        if len(playlist) != 5 or guildPlaylists.get(1) is not playlist or len(guildPlaylists.get(2)) != 0:
+            return False
+
+        # The snapshot is only restored once, a removed guild starts empty
+        guildPlaylists.remove(1)
+        return len(guildPlaylists.get(1)) == 0
+
+    def test_playerLockContention(self) -> bool:
+        async def contend() -> bool:
+            playerLock = PlayerLock(Lock())
+            order = []
+
+            async def hold(name: str) -> None:
+                if await playerLock.acquire(1):
+                    order.append(name)
+                    await asyncio.sleep(0.05)
+                    playerLock.release()
+
+            await asyncio.gather(hold('first'), hold('second'), hold('third'))
+            # The coroutines of the loop receive the lock in the order they asked for it
+            return order == ['first', 'second', 'third'] and playerLock.acquisitions == 3 and \
+                playerLock.contentions == 2 and playerLock.maxWait >= 0.05 and playerLock.timeouts == 0
+
+        return self._runner.run_coroutine(contend())
+
+    def test_playerLockTimeout(self) -> bool:
+        async def timeout() -> bool:
+            sharedLock = Lock()
+            playerLock = PlayerLock(sharedLock)
+            # Held outside the loop, like by the snapshotter
+            sharedLock.acquire()
+            if await playerLock.acquire(0.1) or playerLock.locked():
+                return False
+            sharedLock.release()
+
+            # Held by other coroutine of the loop
+            if not await playerLock.acquire(0.1):
+                return False
+            if await playerLock.acquire(0.05):
+                return False
+            return playerLock.timeouts == 2 and playerLock.acquisitions == 1
+
+        return self._runner.run_coroutine(timeout())
+
+    def test_playerLockRelease(self) -> bool:
+        async def release() -> bool:
+            sharedLock = Lock()
+            playerLock = PlayerLock(sharedLock)
+            if not await playerLock.acquire(1) or not playerLock.locked() or sharedLock.acquire(False):
+                return False
+            await asyncio.sleep(0.02)
+            playerLock.release()
+
+            # Both locks are free for the loop and for the other threads
+            if playerLock.locked() or not sharedLock.acquire(False):
+                return False
+            sharedLock.release()
+            return await playerLock.acquire(0.1) and playerLock.maxHold >= 0.02
+        return self._runner.run_coroutine(release())
@@ -0,0 +1,92 @@
+import os
+from tempfile import TemporaryDirectory
+from Config.Configs import VConfigs
+from Tests.TestBase import VulkanTesterBase
+from Music.Playlist import Playlist
+from Music.PlaylistStore import PlaylistStore
+from Music.Song import Song
+
+
+class VulkanPlaylistStoreTest(VulkanTesterBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__config = VConfigs()
+        self.__databasePath = self.__config.PLAYLISTS_DATABASE_PATH
+
+    def _setUp(self) -> None:
+        super()._setUp()
+        # Each test receives a new store in a temporary database instead of the one used by the Bot
+        self.__folder = TemporaryDirectory()
+        self.__config.PLAYLISTS_DATABASE_PATH = os.path.join(self.__folder.name, 'playlists.db')
+        PlaylistStore._Singleton__instance = None
+        self._store = PlaylistStore()
+
+    def _tearDown(self) -> None:
+        super()._tearDown()
+        self.__config.PLAYLISTS_DATABASE_PATH = self.__databasePath
+        PlaylistStore._Singleton__instance = None
+        self.__folder.cleanup()
+
+    def _createPlaylist(self, quant: int) -> Playlist:
+        playlist = Playlist()
+        for x in range(quant):
+            song = Song(f'Song {x}', playlist, '')
+            song.finish_down({'url': f'url {x}', 'title': f'Song {x}', 'id': f'id{x}', 'duration': x})
+            playlist.add_song(song)
+        return playlist
+
+    def test_savedPlaylists(self) -> bool:
+        records = self._createPlaylist(5).getRecords()
+        self._store.savePlaylist(1, 'rock', records)
+        self._store.savePlaylist(1, 'jazz', records[:2])
+        self._store.savePlaylist(2, 'rock', records[:1])
+        # Saving with the same name replaces the playlist
+        self._store.savePlaylist(1, 'jazz', records[:3])
+
+        return self._store.loadPlaylist(1, 'rock') == records and self._store.loadPlaylist(1, 'jazz') == records[:3] \
+            and self._store.loadPlaylist(2, 'rock') == records[:1] and self._store.loadPlaylist(2, 'jazz') is None \
+            and self._store.getPlaylistsNames(1) == ['jazz', 'rock']
+
+    def test_snapshotLoadedOnce(self) -> bool:
+        playlist = self._createPlaylist(10)
+        playlist.next_song()
+        self._store.saveSnapshots({1: playlist.exportState(), 2: Playlist().exportState()})
+
+        restored = Playlist()
+        if restored.restoreState(self._store.loadSnapshot(1)) != 10:
+            return False
+        # The snapshot is only returned to the first player of the guild, and the empty ones are not stored
+        if self._store.loadSnapshot(1) is not None or self._store.loadSnapshot(2) is not None:
+            return False
+
+        self._store.saveSnapshots({3: playlist.exportState()})
+        self._store.saveSnapshots({3: None})
+        return self._store.loadSnapshot(3) is None
+
+    def test_changesAndCompaction(self) -> bool:
+        playlist = self._createPlaylist(300)
+        self._store.saveSnapshots({1: playlist.exportState()})
+
+        for x in range(3):
+            version = playlist.getVersion()
+            playlist.add_song(Song(f'Added {x}', playlist, ''))
+            playlist.move_songs(1, 200)
+            playlist.next_song()
+            if self._store.saveChanges(1, playlist.exportChangesSince(version)) != x + 1:
+                return False
+
+        # The changes after the compaction are applied in the new snapshot
+        self._store.compactSnapshot(1)
+        version = playlist.getVersion()
+        playlist.remove_song(10)
+        if self._store.saveChanges(1, playlist.exportChangesSince(version)) != 1:
+            return False
+        return self._store.loadSnapshot(1) == playlist.exportState()
+
+    def test_changesWithoutSnapshot(self) -> bool:
+        playlist = Playlist()
+        # The empty playlist is not stored, only its changes
+        self._store.saveSnapshots({1: playlist.exportState()})
+        playlist.add_songs([Song(f'Song {x}', playlist, '') for x in range(5)])
+        self._store.saveChanges(1, playlist.exportChangesSince(0))
+        return self._store.loadSnapshot(1) == playlist.exportState()
@@ -0,0 +1,297 @@
+import json
+import pickle
+from threading import Event, Thread
+from typing import List
+from Tests.TestBase import VulkanTesterBase
+from Music.Playlist import Playlist
+from Music.PlaylistChanges import PlaylistChangeType
+from Music.Song import Song
+
+
+class VulkanPlaylistTest(VulkanTesterBase):
+    def __init__(self) -> None:
+        super().__init__()
+
+    def _createPlaylist(self, quant: int) -> Playlist:
+        playlist = Playlist()
+        for x in range(quant):
+            song = Song(f'Song {x}', playlist, '')
+            song.finish_down({'url': f'url {x}', 'title': f'Song {x}', 'id': f'id{x}', 'duration': x})
+            playlist.add_song(song)
+        return playlist
+
+    def _getIdentifiers(self, playlist: Playlist) -> List[str]:
+        return [song.identifier for song in playlist.getSongs()]
+
+    def test_moveSongsInBigQueue(self) -> bool:
+        playlist = self._createPlaylist(1000)
+        expected = self._getIdentifiers(playlist)
+
+        song = playlist.move_songs(900, 1)
+        expected.insert(0, expected.pop(899))
+        if song.identifier != 'Song 899':
+            return False
+
+        playlist.move_songs(2, 1000)
+        expected.insert(999, expected.pop(1))
+
+        return self._getIdentifiers(playlist) == expected
+
+    def test_removeSongsInBigQueue(self) -> bool:
+        playlist = self._createPlaylist(1000)
+        expected = self._getIdentifiers(playlist)
+
+        for position in [500, 1, 998, 250]:
+            song = playlist.remove_song(position)
+            if song.identifier != expected.pop(position - 1):
+                return False
+
+        return self._getIdentifiers(playlist) == expected and len(playlist) == 996
+
+    def test_addSongStartAndNextSong(self) -> bool:
+        playlist = self._createPlaylist(300)
+        first = Song('First', playlist, '')
+        playlist.add_song_start(first)
+
+        if playlist.next_song() is not first:
+            return False
+
+        return playlist.next_song().identifier == 'Song 0' and len(playlist) == 299
+
+    def test_destroySong(self) -> bool:
+        playlist = self._createPlaylist(300)
+        song = playlist.getSongs()[150]
+        song.destroy()
+
+        return song.problematic and song.identifier not in self._getIdentifiers(playlist) and len(playlist) == 299
+
+    def test_shuffleKeepSongs(self) -> bool:
+        playlist = self._createPlaylist(500)
+        before = sorted(self._getIdentifiers(playlist))
+        playlist.shuffle()
+        return sorted(self._getIdentifiers(playlist)) == before
+
+    def test_songsPage(self) -> bool:
+        playlist = self._createPlaylist(95)
+        page = playlist.getSongsPage(3, 10)
+        if [song.identifier for song in page.songs] != [f'Song {x}' for x in range(30, 40)]:
+            return False
+        if page.pagesQuant != 10 or page.totalSongs != 95 or page.startPosition != 31:
+            return False
+
+        # Pages out of range are truncated to the closest one
+        lastPage = playlist.getSongsPage(50, 10)
+        return lastPage.pageNumber == 9 and len(lastPage.songs) == 5 and not lastPage.hasNext()
+
+    def test_songsIndexByID(self) -> bool:
+        playlist = self._createPlaylist(500)
+        song = playlist.getSongs()[300]
+        # Songs outside the memory window are read from the disk, so compare by the id
+        if playlist.getSongByID(song.songID).identifier != song.identifier or playlist.getSongPosition(song.songID) != 301:
+            return False
+
+        playlist.move_songs(301, 1)
+        if playlist.getSongPosition(song.songID) != 1:
+            return False
+
+        # Songs received from the Playlist proxy are copies, the id must still find the song
+        playlist.destroy_song(pickle.loads(pickle.dumps(song)))
+        return not playlist.isSongQueued(song.songID) and len(playlist) == 499
+
+    def test_destroySpilledSongsWhileExporting(self) -> bool:
+        playlist = self._createPlaylist(1000)
+        expected = self._getIdentifiers(playlist)
+        version = playlist.getVersion()
+        stop = Event()
+        errors = []
+
+        def export() -> None:
+            # Like the snapshotter thread, that doesn't hold the lock of the loop changing the songs
+            while not stop.is_set():
+                try:
+                    playlist.exportChangesSince(version)
+                    playlist.exportState()
+                except Exception as e:
+                    errors.append(e)
+                    return
+
+        thread = Thread(target=export)
+        thread.start()
+        try:
+            for position in range(900, 300, -5):
+                song = playlist.getSongs().slice(position - 1, position)[0]
+                song.destroy()
+                expected.pop(position - 1)
+            # The songs never queued are ignored
+            Song('Not Queued', playlist, '').destroy()
+        finally:
+            stop.set()
+            thread.join()
+
+        return errors == [] and self._getIdentifiers(playlist) == expected and len(playlist) == 880
+
+    def test_playlistChanges(self) -> bool:
+        playlist = self._createPlaylist(10)
+        version = playlist.getVersion()
+        playlist.move_songs(5, 1)
+        playlist.remove_song(2)
+        playlist.next_song()
+
+        changes = playlist.getChangesSince(version)
+        types = [change.type for change in changes]
+        expected = [PlaylistChangeType.MOVED, PlaylistChangeType.REMOVED,
+                    PlaylistChangeType.REMOVED, PlaylistChangeType.CURRENT_CHANGED]
+        if types != expected or playlist.getVersion() != version + 4:
+            return False
+
+        playlist.revert()
+        if playlist.getChangesSince(version + 4)[0].type != PlaylistChangeType.REVERSED:
+            return False
+
+        # Changes no longer stored must force the reader to read all the playlist again
+        for _ in range(Playlist.MAX_CHANGES_STORED):
+            playlist.shuffle()
+        return playlist.getChangesSince(version) is None and playlist.getChangesSince(playlist.getVersion()) == []
+
+    def test_bulkOperations(self) -> bool:
+        playlist = self._createPlaylist(0)
+        source = self._createPlaylist(300)
+        version = playlist.getVersion()
+        if playlist.add_songs(list(source.getSongs())) != 300:
+            return False
+        # The bulk add is stored as only one change
+        changes = playlist.getChangesSince(version)
+        if len(changes) != 1 or changes[0].type != PlaylistChangeType.ADDED_MANY:
+            return False
+        if (changes[0].position, changes[0].newPosition) != (1, 300):
+            return False
+        expected = self._getIdentifiers(playlist)
+
+        removed = playlist.remove_range(10, 19)
+        if [song.identifier for song in removed] != expected[9:19]:
+            return False
+        del expected[9:19]
+
+        playlist.move_many([(1, 290), (290, 1), (5, 2)])
+        expected.insert(1, expected.pop(4))
+        return self._getIdentifiers(playlist) == expected and len(playlist) == 290
+
+    def test_removeRangeBounds(self) -> bool:
+        playlist = self._createPlaylist(20)
+        expected = self._getIdentifiers(playlist)
+        for start, end in [(0, 5), (-3, 2), (21, 25), (6, 5)]:
+            try:
+                playlist.remove_range(start, end)
+                return False
+            except IndexError:
+                pass
+        if self._getIdentifiers(playlist) != expected:
+            return False
+
+        # The end is limited to the last song
+        removed = playlist.remove_range(16, 100)
+        if [song.identifier for song in removed] != expected[15:]:
+            return False
+        removed = playlist.remove_range(1, 1)
+        return [song.identifier for song in removed] == expected[:1] and len(playlist) == 14
+
+    def test_exportChangesOfSpilledQueue(self) -> bool:
+        playlist = self._createPlaylist(500)
+        state = json.loads(json.dumps(playlist.exportState()))
+        version = playlist.getVersion()
+
+        playlist.add_song(Song('Added', playlist, ''))
+        playlist.add_songs([Song(f'Many {x}', playlist, '') for x in range(50)])
+        playlist.remove_song(450)
+        playlist.move_songs(1, 480)
+        playlist.next_song()
+        playlist.remove_range(3, 7)
+        playlist.add_song_start(Song('First', playlist, ''))
+        playlist.loop_all()
+        playlist.next_song()
+
+        changes = json.loads(json.dumps(playlist.exportChangesSince(version)))
+        if Playlist.applyChanges(state, changes) != playlist.exportState():
+            return False
+
+        # The random order can't be replayed
+        playlist.shuffle()
+        return playlist.exportChangesSince(version) is None
+
+    def test_playlistStats(self) -> bool:
+        playlist = self._createPlaylist(100)
+        pending = Song('Pending', playlist, 'Other')
+        playlist.add_song_start(pending)
+
+        playlist.remove_range(2, 11)
+        playlist.next_song()
+        playlist.remove_song(1)
+
+        stats = playlist.getStats()
+        expected = sum(range(11, 100))
+        return stats.totalDuration == expected == playlist.getTotalDuration() and stats.resolvedQuant == 89 \
+            and stats.pendingQuant == 0 and stats.requesters == {'': 89}
+
+    def test_statsOfSongDownloadedInQueue(self) -> bool:
+        playlist = self._createPlaylist(10)
+        song = Song('Pending', playlist, 'Requester')
+        playlist.add_song(song)
+        stats = playlist.getStats()
+        if stats.pendingQuant != 1 or stats.totalDuration != sum(range(10)) + Song.DEFAULT_DURATION:
+            return False
+
+        # The download changes the song contribution while it's queued
+        song.finish_down({'url': 'url', 'title': 'Pending', 'duration': 100})
+        stats = playlist.getStats()
+        if stats.pendingQuant != 0 or stats.resolvedQuant != 11 or stats.totalDuration != sum(range(10)) + 100:
+            return False
+
+        playlist.remove_song(11)
+        stats = playlist.getStats()
+        return stats.totalDuration == sum(range(10)) and stats.requesters == {'': 10}
+
+    def test_exportAndRestoreState(self) -> bool:
+        playlist = self._createPlaylist(50)
+        playlist.next_song()
+        playlist.next_song()
+        playlist.loop_all()
+
+        # The state is stored as JSON, the restored songs only have the metadata
+        state = json.loads(json.dumps(playlist.exportState()))
+        restored = Playlist()
+        if restored.restoreState(state) != 49 or not restored.isLoopingAll():
+            return False
+
+        songs = list(restored.getSongs())
+        if [song.title for song in songs] != [f'Song {x}' for x in range(1, 50)]:
+            return False
+        return songs[0].source is None and songs[0].videoID == 'id1' and restored.getHistory() == ['Song 0']
+
+    def test_spilledQueue(self) -> bool:
+        playlist = self._createPlaylist(3000)
+        if playlist.getSongs().spilledQuant == 0:
+            return False
+
+        # Pages from the spilled part are read from the disk
+        page = playlist.getSongsPage(250, 10)
+        if [song.identifier for song in page.songs] != [f'Song {x}' for x in range(2500, 2510)]:
+            return False
+
+        song = playlist.getSongs()[2800]
+        playlist.shuffle()
+        position = playlist.getSongPosition(song.songID)
+        return playlist.getSongsPage(position - 1, 1).songs[0].identifier == 'Song 2800' and len(playlist) == 3000
+
+    def test_destroySpilledSong(self) -> bool:
+        playlist = self._createPlaylist(3000)
+        # The song read from the disk is bound to the Playlist again, so it can destroy itself
+        song = playlist.getSongs()[2500]
+        if song.playlist is not playlist:
+            return False
+        song.destroy()
+        if playlist.isSongQueued(song.songID) or len(playlist) != 2999:
+            return False
+
+        # The positions of the spilled keys are updated after the removal
+        nextSong = playlist.getSongs()[2500]
+        return nextSong.identifier == 'Song 2501' and playlist.getSongPosition(nextSong.songID) == 2501
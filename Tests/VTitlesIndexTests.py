@@ -0,0 +1,80 @@
+from typing import List
+from Config.Configs import VConfigs
+from Tests.TestBase import VulkanTesterBase
+from Music.Song import Song
+from Music.TitlesIndex import TitlesIndex
+
+
+class VulkanTitlesIndexTest(VulkanTesterBase):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__config = VConfigs()
+        self.__maxTitles = self.__config.MAX_AUTOCOMPLETE_TITLES
+
+    def _tearDown(self) -> None:
+        super()._tearDown()
+        self.__config.MAX_AUTOCOMPLETE_TITLES = self.__maxTitles
+
+    def _createIndex(self, maxTitles: int = 100) -> TitlesIndex:
+        # Each test receives a new index instead of the one shared by the Bot
+        self.__config.MAX_AUTOCOMPLETE_TITLES = maxTitles
+        TitlesIndex._Singleton__instance = None
+        return TitlesIndex()
+
+    def _createSong(self, title: str, url: str = None) -> Song:
+        song = Song(title, None, '')
+        url = url if url is not None else f'https://www.youtube.com/watch?v={title.replace(" ", "")}'
+        song.finish_down({'url': 'source', 'title': title, 'id': title.replace(' ', ''), 'webpage_url': url})
+        return song
+
+    def _getTitles(self, index: TitlesIndex, query: str, guildID: int = 1) -> List[str]:
+        return [indexed.title for indexed in index.getSuggestions(query, guildID)]
+
+    def test_prefixMatching(self) -> bool:
+        index = self._createIndex()
+        index.addResolvedSong(self._createSong('Bohemian Rhapsody'), 1)
+        index.addResolvedSong(self._createSong('Rhapsody in Blue'), 1)
+        index.addResolvedSong(self._createSong('Blue Monday'), 1)
+
+        return sorted(self._getTitles(index, 'rhap')) == ['Bohemian Rhapsody', 'Rhapsody in Blue'] and \
+            self._getTitles(index, 'BLUE rhaps') == ['Rhapsody in Blue'] and \
+            self._getTitles(index, 'rhapsody queen') == [] and \
+            len(self._getTitles(index, '')) == 3
+
+    def test_guildOrdering(self) -> bool:
+        index = self._createIndex()
+        first = self._createSong('Song One')
+        second = self._createSong('Song Two')
+        # The second song is the most used globally, but the first is the most used in the guild 1
+        index.addResolvedSong(first, 1)
+        for guildID in [2, 2, 3]:
+            index.addResolvedSong(second, guildID)
+
+        return self._getTitles(index, 'song', 1) == ['Song One', 'Song Two'] and \
+            self._getTitles(index, 'song', 2) == ['Song Two', 'Song One'] and \
+            self._getTitles(index, 'song', 4) == ['Song Two', 'Song One']
+
+    def test_removeLeastRecentlyUsed(self) -> bool:
+        index = self._createIndex(3)
+        songs = [self._createSong(f'Song {x}') for x in range(4)]
+        for song in songs[:3]:
+            index.addResolvedSong(song, 1)
+        # Using again the first song makes the second the least recently used
+        index.addResolvedSong(songs[0], 1)
+        index.addResolvedSong(songs[3], 1)
+
+        return len(index) == 3 and not index.isResolvedURL(songs[1].webpageUrl) and \
+            sorted(self._getTitles(index, 'song')) == ['Song 0', 'Song 2', 'Song 3']
+
+    def test_withoutTitles(self) -> bool:
+        index = self._createIndex(0)
+        song = self._createSong('Song')
+        index.addResolvedSong(song, 1)
+        return len(index) == 0 and not index.isResolvedURL(song.webpageUrl)
+
+    def test_urlOfOtherExtractors(self) -> bool:
+        index = self._createIndex()
+        url = 'https://soundcloud.com/artist/track'
+        index.addResolvedSong(self._createSong('Soundcloud Track', url), 1)
+        suggestions = index.getSuggestions('soundcloud', 1)
+        return len(suggestions) == 1 and suggestions[0].url == url and index.isResolvedURL(url)
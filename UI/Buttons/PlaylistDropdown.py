@@ -1,4 +1,3 @@
-import asyncio
 from typing import List
 from discord import Interaction, Message, TextChannel, SelectOption
 from discord.ui import Select, View
@@ -10,19 +9,25 @@ from Handlers.AbstractHandler import AbstractHandler
 from UI.Buttons.AbstractItem import AbstractItem
 from UI.Views.AbstractView import AbstractView
 from Music.Playlist import Playlist
+from Music.PlaylistChanges import PlaylistChangeType
+from Config.Configs import VConfigs
+from Parallelism.AbstractProcessManager import AbstractPlayersManager
 
 
 class PlaylistDropdown(Select, AbstractItem):
     """Receives n elements to put in drop down and return the selected, pass the index value to a handler"""
+    MAX_OPTIONS = 20
+    # Max time to wait for the player to start the selected song before updating the options
+    WAIT_PLAYER_TIMEOUT = 5
 
     def __init__(self, bot: VulkanBot, handler: type[AbstractHandler], playlist: Playlist, textChannel: TextChannel, guildID: int, category: MessagesCategory):
-        songs = list(playlist.getSongs())
+        # Get only the 20 first songs, the pycord library doesn't accept more
+        songs = playlist.getSongsPage(0, self.MAX_OPTIONS).songs
 
-        values = [str(x) for x in range(1, len(songs) + 1)]
-        # Get the title of each of the 20 first songs, the pycord library doesn't accept more
+        # Each option store the id of the song, to find the song even if the queue changed
+        values = [str(song.songID) for song in songs]
         songsNames: List[str] = []
-        songsLength = min(20, len(songs))
-        for x in range(songsLength):
+        for x in range(len(songs)):
             songsNames.append(f'{x + 1} - {songs[x].title[:80]}')
 
         selectOptions: List[SelectOption] = []
@@ -41,14 +46,22 @@ class PlaylistDropdown(Select, AbstractItem):
         self.__messagesManager = MessagesManager()
         self.__bot = bot
         self.__view: AbstractView = None
+        self.__version = playlist.getVersion()
 
     async def callback(self, interaction: Interaction) -> None:
         """Callback to when the selection is selected"""
         await interaction.response.defer()
 
-        # Execute the handler passing the value selected
+        # Get the current position of the selected song, if it's not in the queue anymore only update the options
+        position = self.__playlist.getSongPosition(int(self.values[0]))
+        if position is None:
+            await self.__update()
+            return
+
+        # Execute the handler passing the position selected
+        versionBefore = self.__playlist.getVersion()
         handler = self.__handlerClass(interaction, self.__bot)
-        response: HandlerResponse = await handler.run(self.values[0])
+        response: HandlerResponse = await handler.run(str(position))
 
         message = None
         if response and response.view is not None:
@@ -60,17 +73,49 @@ class PlaylistDropdown(Select, AbstractItem):
         if message:
             await self.__messagesManager.addMessageAndClearPrevious(self.__guildID, self.__category, message, response.view)
 
-        # Extreme ugly way to wait for the player process to actually retrieve the next song
-        await asyncio.sleep(2)
+        # Wait for the player to actually retrieve the selected song, only if it didn't already
+        if not self.__currentChangedSince(versionBefore):
+            playersManager: AbstractPlayersManager = VConfigs().getPlayersManager()
+            await playersManager.waitPlaylistChange(interaction.guild, self.WAIT_PLAYER_TIMEOUT)
 
         await self.__update()
 
-    async def __update(self):
-        songs = list(self.__playlist.getSongs())
+    def __currentChangedSince(self, version: int) -> bool:
+        changes = self.__playlist.getChangesSince(version)
+        if changes is None:  # Too many changes, surely the current song changed
+            return True
+        return any(change.type == PlaylistChangeType.CURRENT_CHANGED for change in changes)
+
+    def __optionsChangedSince(self, version: int) -> bool:
+        """Return if the changes after the version touched the first songs, the ones shown in the options"""
+        changes = self.__playlist.getChangesSince(version)
+        if changes is None:
+            return True
+        for change in changes:
+            if change.type == PlaylistChangeType.CURRENT_CHANGED:
+                continue
+            if change.type in (PlaylistChangeType.ADDED, PlaylistChangeType.ADDED_MANY, PlaylistChangeType.REMOVED) and change.position > self.MAX_OPTIONS:
+                continue
+            if change.type == PlaylistChangeType.MOVED and min(change.position, change.newPosition) > self.MAX_OPTIONS:
+                continue
+            return True
+        return False
 
-        values = [str(x) for x in range(1, len(songs) + 1)]
-        # Get the title of each of the 20 first songs, library doesn't accept more
-        songsNames = [song.title[:80] for song in songs[:20]]
+    async def __update(self):
+        # Only rebuild the options if the changes since the last build reached the songs in the options
+        version = self.__playlist.getVersion()
+        if version == self.__version:
+            return
+        optionsChanged = self.__optionsChangedSince(self.__version)
+        self.__version = version
+        if not optionsChanged:
+            return
+
+        # Get only the 20 first songs, library doesn't accept more
+        songs = self.__playlist.getSongsPage(0, self.MAX_OPTIONS).songs
+
+        values = [str(song.songID) for song in songs]
+        songsNames = [song.title[:80] for song in songs]
 
         selectOptions: List[SelectOption] = []
 
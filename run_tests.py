@@ -1,6 +1,10 @@
 from Tests.VDownloaderTests import VulkanDownloaderTest
 from Tests.VSpotifyTests import VulkanSpotifyTest
 from Tests.VDeezerTests import VulkanDeezerTest
+from Tests.VPlaylistTests import VulkanPlaylistTest
+from Tests.VParallelismTests import VulkanParallelismTest
+from Tests.VTitlesIndexTests import VulkanTitlesIndexTest
+from Tests.VPlaylistStoreTests import VulkanPlaylistStoreTest
 
 
 tester = VulkanDownloaderTest()
@@ -9,3 +13,11 @@ tester = VulkanSpotifyTest()
 tester.run()
 tester = VulkanDeezerTest()
 tester.run()
+tester = VulkanPlaylistTest()
+tester.run()
+tester = VulkanParallelismTest()
+tester.run()
+tester = VulkanTitlesIndexTest()
+tester.run()
+tester = VulkanPlaylistStoreTest()
+tester.run()